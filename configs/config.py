@@ -24,6 +24,12 @@ DEFAULT_INTERVALS = [
     "1h", "2h", "4h", "1d", "1w"
 ]
 DEFAULT_OHLCV_LIMIT = 200
+# Closed candles per (exchange, symbol, interval), see integrations/multi_interval_ohlcv/candle_store.py
+CANDLE_STORE_DIR = "../AI-crypto-trader-logs/candle-data/"
+# Rolling success rate, latency and circuit state per exchange, see integrations/exchange_health.py
+EXCHANGE_HEALTH_FILE = "../AI-crypto-trader-logs/fetch-data/exchange_health.json"
+# Streaming indicator state per (symbol, interval), see modules/indicator_engine/streaming_indicators.py
+STREAMING_INDICATORS_FILE = "../AI-crypto-trader-logs/fetch-data/indicator_state.json"
 
 # DIVERGENCE SETTINGS
 # scripts/divergence_detector.py
@@ -66,6 +72,7 @@ RSI_THRESHOLDS = {
 # SIGNAL LIMITER SETTINGS
 # scripts/signal_limiter.py
 LOG_FILE = "../AI-crypto-trader-logs/signal-data/signals_log.json"
+SIGNAL_DB_FILE = "../AI-crypto-trader-logs/signal-data/signals_log.sqlite3"
 SIGNAL_TIMEOUT = timedelta(hours=1)
 
 # SIGNAL LOGGER SETTINGS
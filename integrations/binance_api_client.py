@@ -1,29 +1,42 @@
 # integrations/binance_api_client.py
 
-from binance.client import Client
-from binance.enums import *
-from binance.exceptions import BinanceAPIException
 import pandas as pd
 import sys
 import os
+import threading
 
 # Paths, confs and credentials
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from configs.credentials import BINANCE_API_KEY, BINANCE_API_SECRET
 from configs.binance_config import BINANCE_INTERVALS
+from utils.lazy_import import LazyObject, lazy_import
 
-client = None
+# python-binance is heavy to import and its Client pings the API when created,
+# so both happen on first use instead of when this module is imported
+binance_enums = lazy_import("binance.enums")
+binance_exceptions = lazy_import("binance.exceptions")
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            from binance.client import Client
+            _client = Client(api_key=BINANCE_API_KEY, api_secret=BINANCE_API_SECRET)
+        return _client
+
+client = LazyObject(get_client)
 
 def init_client():
-    global client
+    """Creates the client now and checks the connection; otherwise it is created on first use."""
     try:
-        client = Client(api_key=BINANCE_API_KEY, api_secret=BINANCE_API_SECRET)
-        client.ping()  # Optional, can be removed
+        get_client().ping()
         print("✅ Binance client initialized successfully.")
     except Exception as e:
         print(f"❌ Failed to initialize Binance client: {e}")
-        client = None
 
 ### --- OHLCV for multible symbols and intervals ---
 def fetch_ohlcv_for_intervals(symbol: str, intervals: list, limit: int = 100):
@@ -42,7 +55,7 @@ def fetch_ohlcv_for_intervals(symbol: str, intervals: list, limit: int = 100):
             df.set_index('timestamp', inplace=True)
             df = df.astype(float)
             result[interval] = df
-        except BinanceAPIException as e:
+        except binance_exceptions.BinanceAPIException as e:
             print(f"⚠️ OHLCV fetch error for {symbol} - {interval}: {e.message}")
     return result
 
@@ -64,7 +77,7 @@ def fetch_multi_ohlcv(selected_symbol: list, limit=10):
                 df.set_index('timestamp', inplace=True)
                 df = df.astype(float)
                 result[symbol][interval] = df
-            except BinanceAPIException as e:
+            except binance_exceptions.BinanceAPIException as e:
                 print(f"⚠️ OHLCV fetch error {symbol} - {interval}: {e.message}")
     return result
 
@@ -75,7 +88,7 @@ def get_all_current_prices(selected_symbol: list):
     try:
         all_prices = client.get_all_tickers()
         return {p["symbol"]: float(p["price"]) for p in all_prices if p["symbol"] in selected_symbol}
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         print(f"❌ Hintojen massahaku epäonnistui: {e.message}")
         return {}
 
@@ -85,11 +98,11 @@ def place_market_order(symbol: str, side: str, quantity: float):
     try:
         return client.create_order(
             symbol=symbol,
-            side=SIDE_BUY if side.lower() == "buy" else SIDE_SELL,
-            type=ORDER_TYPE_MARKET,
+            side=binance_enums.SIDE_BUY if side.lower() == "buy" else binance_enums.SIDE_SELL,
+            type=binance_enums.ORDER_TYPE_MARKET,
             quantity=quantity
         )
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         print(f"❌ API error: {e.message}")
         return None
 
@@ -97,13 +110,13 @@ def place_limit_order(symbol: str, side: str, quantity: float, price: float):
     try:
         return client.create_order(
             symbol=symbol,
-            side=SIDE_BUY if side.lower() == "buy" else SIDE_SELL,
-            type=ORDER_TYPE_LIMIT,
-            timeInForce=TIME_IN_FORCE_GTC,
+            side=binance_enums.SIDE_BUY if side.lower() == "buy" else binance_enums.SIDE_SELL,
+            type=binance_enums.ORDER_TYPE_LIMIT,
+            timeInForce=binance_enums.TIME_IN_FORCE_GTC,
             quantity=quantity,
             price=str(price)
         )
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         print(f"❌ API error: {e.message}")
         return None
 
@@ -112,7 +125,7 @@ def get_current_price(symbol: str):
     try:
         ticker = client.get_symbol_ticker(symbol=symbol)
         return float(ticker['price'])
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         print(f"❌ Hintahaku epäonnistui: {e.message}")
         return None
 
@@ -123,7 +136,7 @@ if __name__ == "__main__":
     try:
         client.ping()
         print("✅ Connection to Binance API: OK")
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         print(f"❌ ERROR: Failed to connect to Binance API: {e.message}")
     except Exception as e:
         print(f"❌ ERROR: Unexpected issue with Binance connection: {e}")
@@ -147,7 +160,7 @@ if __name__ == "__main__":
             print("✅ Binance API integration seems to be working")
         else:
             print("❌ ERROR: Unexpected response in account info.")
-    except BinanceAPIException as e:
+    except binance_exceptions.BinanceAPIException as e:
         if "API-key format invalid" in str(e.message):
             print("❌ ERROR: Binance API keys invalid - check configs/credentials.py")
         elif "API-key does not have permission" in str(e.message):
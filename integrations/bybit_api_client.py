@@ -1,10 +1,10 @@
 # integrations/bybit_api_client.py
 
-from pybit.unified_trading import HTTP
 import pandas as pd
 import sys
 import os
 import math
+import threading
 
 # Polut ja konfiguraatiot
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -14,13 +14,25 @@ from configs.bybit_config import  (
     DEFAULT_BYBIT_TAKE_PROFIT_PERCENT,
     DEFAULT_BYBIT_STOP_LOSS_PERCENT
 )
+from utils.lazy_import import LazyObject
+
+# Bybit V5 unified trading client, created on first use so importing this module stays cheap
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            from pybit.unified_trading import HTTP
+            _client = HTTP(
+                api_key=BYBIT_API_KEY, 
+                api_secret=BYBIT_API_SECRET, 
+                testnet=False
+            )
+        return _client
 
-# Bybit V5 unified trading client
-client = HTTP(
-    api_key=BYBIT_API_KEY, 
-    api_secret=BYBIT_API_SECRET, 
-    testnet=False
-)
+client = LazyObject(get_client)
 
 # --- Asetukset ---
 DEFAULT_LEVERAGE = 2
@@ -0,0 +1,256 @@
+# integrations/exchange_health.py
+# version 2.0, aug 2025
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+try:
+    import fcntl
+except ImportError:  # Windows: saves are still atomic, just not serialized between processes
+    fcntl = None
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+import requests
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from configs.config import EXCHANGE_HEALTH_FILE
+from utils.rate_limiter import RequestBudgetExceeded
+
+WINDOW_SIZE = 50              # attempts kept per exchange and per (exchange, symbol)
+MIN_PAIR_SAMPLES = 3          # pair stats are used for ordering once they have this many attempts
+FAILURE_THRESHOLD = 3         # consecutive failures that open the circuit
+COOLDOWN_SECONDS = 60.0       # first cool-down, doubled per reopening up to MAX_COOLDOWN_SECONDS
+MAX_COOLDOWN_SECONDS = 3600.0
+SAVE_INTERVAL_SECONDS = 30.0
+PAIR_TTL_SECONDS = 24 * 3600.0  # (exchange, symbol) windows with no attempt for this long are dropped
+
+def is_exchange_failure(error: Exception) -> bool:
+    """
+    True when the error says the exchange itself is unreachable or overloaded: connection
+    errors, timeouts, 5xx and 429/418 responses. Other errors (a 4xx for an unknown symbol,
+    bad or empty data) and our own rate budget running out are about the request.
+    """
+    if isinstance(error, RequestBudgetExceeded):
+        return False
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status >= 500 or status in (418, 429)
+    return isinstance(error, requests.RequestException)
+
+class _Window:
+    """Rolling attempts of one exchange or (exchange, symbol) pair with a circuit breaker."""
+
+    def __init__(self, attempts=None, failures=0, open_until=0.0, trips=0, last_seen=None):
+        self.attempts = deque(attempts or [], maxlen=WINDOW_SIZE)   # [ok, latency seconds]
+        self.failures = failures
+        self.open_until = open_until
+        self.trips = trips
+        self.last_seen = time.time() if last_seen is None else last_seen
+
+    def record(self, ok: bool, latency: float, now: float, count_failure: bool = True):
+        self.attempts.append([bool(ok), round(float(latency), 4)])
+        self.last_seen = now
+        if ok:
+            self.failures = 0
+            self.trips = 0
+            self.open_until = 0.0
+            return
+        if not count_failure:
+            return
+        self.failures += 1
+        if self.failures >= FAILURE_THRESHOLD:
+            self.open_until = now + min(MAX_COOLDOWN_SECONDS, COOLDOWN_SECONDS * (2 ** self.trips))
+            self.trips += 1
+            self.failures = 0
+
+    def is_open(self, now: float) -> bool:
+        return self.open_until > now
+
+    def is_stale(self, now: float) -> bool:
+        return now - self.last_seen > PAIR_TTL_SECONDS and not self.is_open(now)
+
+    def stats(self) -> dict:
+        latencies = sorted(latency for ok, latency in self.attempts if ok)
+        count = len(self.attempts)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            "attempts": count,
+            "success_rate": round(sum(1 for ok, _ in self.attempts if ok) / count, 3) if count else None,
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "p95": percentile(0.95),
+        }
+
+    def to_dict(self) -> dict:
+        return {"attempts": list(self.attempts), "failures": self.failures, "open_until": self.open_until,
+                "trips": self.trips, "last_seen": self.last_seen}
+
+class ExchangeHealth:
+    """
+    Success rate and latency of recent attempts per exchange and per (exchange, symbol).
+    order() puts the healthiest exchanges first and drops the ones whose circuit is open
+    after repeated failures. State is saved to a JSON file so the next run starts from it;
+    concurrent processes merge into that file under a lock, newest window per key winning.
+    """
+
+    def __init__(self, name: str, path: Optional[str] = None):
+        self.name = name
+        self.path = path or EXCHANGE_HEALTH_FILE
+        self._lock = threading.Lock()
+        self._exchanges: Dict[str, _Window] = {}
+        self._pairs: Dict[str, _Window] = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._load()
+
+    @staticmethod
+    def _pair_key(exchange: str, symbol: str) -> str:
+        return f"{exchange}:{symbol}"
+
+    def _read_file(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _windows(section, key: str) -> Dict[str, _Window]:
+        windows = {}
+        for name, state in ((section or {}).get(key) or {}).items():
+            try:
+                windows[name] = _Window(**state)
+            except TypeError:
+                continue
+        return windows
+
+    def _load(self):
+        section = self._read_file().get(self.name)
+        if not isinstance(section, dict):
+            return
+        now = time.time()
+        self._exchanges = self._windows(section, "exchanges")
+        self._pairs = {name: window for name, window in self._windows(section, "pairs").items() if not window.is_stale(now)}
+
+    def record(self, exchange: str, symbol: Optional[str], ok: bool, latency: float, symbol_error: bool = False, now: Optional[float] = None):
+        """
+        One attempt. symbol_error marks a failure that is about the symbol (not listed, no
+        data): it cools down only that pair, not the whole exchange.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._exchanges.setdefault(exchange, _Window()).record(ok, latency, now, count_failure=not symbol_error)
+            if symbol:
+                self._pairs.setdefault(self._pair_key(exchange, symbol), _Window()).record(ok, latency, now)
+            self._dirty = True
+            due = time.monotonic() - self._saved_at >= SAVE_INTERVAL_SECONDS
+        if due:
+            self.save()
+
+    def is_available(self, exchange: str, symbol: Optional[str] = None, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            window = self._exchanges.get(exchange)
+            if window is not None and window.is_open(now):
+                return False
+            pair = self._pairs.get(self._pair_key(exchange, symbol)) if symbol else None
+            return pair is None or not pair.is_open(now)
+
+    def stats(self, exchange: str, symbol: Optional[str] = None) -> dict:
+        with self._lock:
+            window = self._pairs.get(self._pair_key(exchange, symbol)) if symbol else self._exchanges.get(exchange)
+            return window.stats() if window is not None else _Window().stats()
+
+    def _sort_key(self, exchange: str, symbol: Optional[str]):
+        window = self._pairs.get(self._pair_key(exchange, symbol)) if symbol else None
+        if window is None or len(window.attempts) < MIN_PAIR_SAMPLES:
+            window = self._exchanges.get(exchange)
+        stats = window.stats() if window is not None else {"success_rate": None, "p50": None}
+
+        # Unknown exchanges rank as fully healthy but slow, so they get tried without jumping the queue
+        success_rate = 1.0 if stats["success_rate"] is None else stats["success_rate"]
+        p50 = float("inf") if stats["p50"] is None else stats["p50"]
+        return (-round(success_rate, 1), p50)
+
+    def order(self, exchanges: List[str], symbol: Optional[str] = None, now: Optional[float] = None) -> List[str]:
+        """
+        Exchanges by success rate (in 10 % steps) and then median latency; ties keep the
+        configured order. Open circuits are left out unless every exchange is open, in which
+        case the configured order is returned so the caller still gets one attempt.
+        """
+        now = time.time() if now is None else now
+        available = [exchange for exchange in exchanges if self.is_available(exchange, symbol, now)]
+        if not available:
+            return list(exchanges)
+        with self._lock:
+            return sorted(available, key=lambda exchange: self._sort_key(exchange, symbol))
+
+    def save(self):
+        """
+        Merges this tracker into the file: for each key the window with the latest attempt
+        wins, so another process's windows are kept. Pair windows past PAIR_TTL_SECONDS are
+        dropped from the file and from memory.
+        """
+        now = time.time()
+        with self._lock:
+            if not self._dirty:
+                return
+            self._pairs = {name: window for name, window in self._pairs.items() if not window.is_stale(now)}
+            exchanges = {name: window.to_dict() for name, window in self._exchanges.items()}
+            pairs = {name: window.to_dict() for name, window in self._pairs.items()}
+            self._dirty = False
+            self._saved_at = time.monotonic()
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(f"{self.path}.lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                data = self._read_file()
+                section = data.get(self.name) if isinstance(data.get(self.name), dict) else {}
+                merged = {}
+                for key, ours in (("exchanges", exchanges), ("pairs", pairs)):
+                    theirs = {name: window for name, window in self._windows(section, key).items()
+                              if key == "exchanges" or not window.is_stale(now)}
+                    merged[key] = {name: window.to_dict() for name, window in theirs.items()}
+                    for name, state in ours.items():
+                        if name not in theirs or theirs[name].last_seen <= state["last_seen"]:
+                            merged[key][name] = state
+                data[self.name] = merged
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save exchange health to {self.path}: {e}")
+
+_trackers: Dict[str, ExchangeHealth] = {}
+_trackers_lock = threading.Lock()
+
+def get_exchange_health(name: str) -> ExchangeHealth:
+    """Shared tracker per use ("ohlcv", "price"); saved on exit."""
+    with _trackers_lock:
+        tracker = _trackers.get(name)
+        if tracker is None:
+            tracker = _trackers[name] = ExchangeHealth(name)
+        return tracker
+
+def save_exchange_health():
+    with _trackers_lock:
+        trackers = list(_trackers.values())
+    for tracker in trackers:
+        tracker.save()
+
+atexit.register(save_exchange_health)
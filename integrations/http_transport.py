@@ -0,0 +1,93 @@
+# integrations/http_transport.py
+# version 2.0, aug 2025
+
+import time
+import random
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.rate_limiter import get_exchange_limiter
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5        # seconds before the first retry, doubled per attempt
+MAX_BACKOFF = 8.0
+DEFAULT_MAX_WAIT = 15.0      # longest a request may queue for its exchange budget
+POOL_MAXSIZE = 32
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+def get_session(url: str) -> requests.Session:
+    """One pooled keep-alive session per host, shared by every caller and thread."""
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+def backoff_delay(attempt: int, base: float = DEFAULT_BACKOFF) -> float:
+    """Exponential backoff with full jitter: uniform(0, base * 2**attempt), capped."""
+    return random.uniform(0, min(MAX_BACKOFF, base * (2 ** attempt)))
+
+def _retry_after(response) -> Optional[float]:
+    try:
+        return min(MAX_BACKOFF, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+def http_get(
+    url: str,
+    params: Optional[dict] = None,
+    exchange: Optional[str] = None,
+    limits: Optional[dict] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    max_wait: float = DEFAULT_MAX_WAIT
+) -> requests.Response:
+    """
+    GET through the pooled session of the host. With exchange set, every attempt takes a
+    slot and a token from that exchange's limiter (limits from config apply on first use)
+    and raises RequestBudgetExceeded if it would have to queue longer than max_wait.
+    Connection errors, timeouts, 429 and 5xx are retried with jittered exponential backoff;
+    the last response or error is returned or raised as requests would.
+    """
+    session = get_session(url)
+    limiter = get_exchange_limiter(exchange, limits) if exchange else None
+
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire(max_wait=max_wait)
+        try:
+            response = session.get(url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retries:
+                raise
+            delay = backoff_delay(attempt, backoff)
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            delay = _retry_after(response) or backoff_delay(attempt, backoff)
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+        attempt += 1
+        time.sleep(delay)
@@ -0,0 +1,159 @@
+# integrations/multi_interval_ohlcv/candle_store.py
+# version 2.0, aug 2025
+
+import os
+import sys
+import time
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from configs.config import CANDLE_STORE_DIR
+
+# One fixed-size record per closed candle, appended in open time order
+CANDLE_DTYPE = np.dtype([
+    ("open_time", "<i8"),   # ms since epoch
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+INTERVAL_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+MAX_STORED_CANDLES = 5000
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+def interval_to_ms(interval):
+    """Interval length in ms, or None for calendar intervals (1M) that are not stored."""
+    unit = interval[-1:]
+    if unit not in INTERVAL_UNIT_MS:
+        return None
+    try:
+        return int(interval[:-1] or 1) * INTERVAL_UNIT_MS[unit]
+    except ValueError:
+        return None
+
+def get_store_path(exchange, symbol, interval, store_dir=None):
+    return os.path.join(store_dir or CANDLE_STORE_DIR, exchange.lower(), symbol, f"{interval}.bin")
+
+def _get_lock(path):
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+def read_candles(path):
+    """Stored closed candles as a structured array; a torn last record is ignored."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+    count = size // CANDLE_DTYPE.itemsize
+    if count == 0:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+    return np.fromfile(path, dtype=CANDLE_DTYPE, count=count)
+
+def _write_candles(path, candles, append):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if append:
+        # Drop a torn record left by an interrupted write before appending
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+            if size % CANDLE_DTYPE.itemsize:
+                with open(path, "r+b") as f:
+                    f.truncate(size - size % CANDLE_DTYPE.itemsize)
+        with open(path, "ab") as f:
+            candles.tofile(f)
+    else:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            candles.tofile(f)
+        os.replace(tmp_path, path)
+
+def frame_to_candles(df):
+    """OHLCV DataFrame (DatetimeIndex of open times) -> structured candle array."""
+    candles = np.empty(len(df), dtype=CANDLE_DTYPE)
+    if len(df):
+        candles["open_time"] = df.index.values.astype("datetime64[ms]").astype(np.int64)
+        for column in OHLCV_COLUMNS:
+            candles[column] = df[column].to_numpy(dtype=float)
+    return candles
+
+def candles_to_frame(candles):
+    """Structured candle array -> DataFrame in the layout the fetchers return."""
+    index = pd.to_datetime(candles["open_time"], unit="ms")
+    index.name = "timestamp"
+    return pd.DataFrame({column: candles[column] for column in OHLCV_COLUMNS}, index=index)
+
+def _merge(stored, fetched):
+    """Stored candles followed by the fetched ones that are newer; fetched rows win on overlap."""
+    if not len(stored):
+        return fetched
+    if not len(fetched):
+        return stored
+    keep = stored["open_time"] < fetched["open_time"][0]
+    return np.concatenate((stored[keep], fetched))
+
+def fetch_with_store(exchange, symbol, interval, limit, fetch_fn, now_ms=None, store_dir=None):
+    """
+    Returns the last `limit` candles of interval like a plain fetch, but only downloads the
+    candles after the last stored closed one. fetch_fn(start_time, end_time, limit) is the
+    exchange request for one interval (start/end are aware datetimes or None) and returns
+    an OHLCV DataFrame. Closed candles are appended to the store; the still-open candle is
+    only merged in memory.
+    """
+    interval_ms = interval_to_ms(interval)
+    if interval_ms is None:
+        return fetch_fn(None, None, limit)
+
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    path = get_store_path(exchange, symbol, interval, store_dir)
+
+    with _get_lock(path):
+        stored = read_candles(path)
+        last_open = int(stored["open_time"][-1]) if len(stored) else None
+        missing = (now_ms - last_open) // interval_ms if last_open is not None else 0
+
+        # Not enough history, or too far behind to be worth a range request: full window
+        incremental = last_open is not None and 0 < missing < limit and len(stored) + missing >= limit
+        if incremental:
+            start = datetime.fromtimestamp((last_open + interval_ms) / 1000, tz=timezone.utc)
+            end = datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc)
+            df = fetch_fn(start, end, int(missing) + 1)
+        else:
+            df = fetch_fn(None, None, limit)
+
+        if df is None or df.empty:
+            return pd.DataFrame() if df is None else df
+
+        fetched = frame_to_candles(df.sort_index())
+        is_closed = fetched["open_time"] + interval_ms <= now_ms
+        closed, open_candles = fetched[is_closed], fetched[~is_closed]
+
+        try:
+            if incremental:
+                closed = closed[closed["open_time"] > last_open]
+                merged = np.concatenate((stored, closed))
+                if len(closed):
+                    _write_candles(path, closed, append=True)
+            elif last_open is not None and len(closed) and int(closed["open_time"][0]) <= last_open + interval_ms:
+                merged = _merge(stored, closed)
+                _write_candles(path, merged[-MAX_STORED_CANDLES:], append=False)
+            else:
+                # Empty store, or a gap between it and the fetched window: start over
+                merged = closed
+                if len(closed):
+                    _write_candles(path, closed, append=False)
+
+            if len(merged) > 2 * MAX_STORED_CANDLES:
+                merged = merged[-MAX_STORED_CANDLES:]
+                _write_candles(path, merged, append=False)
+        except OSError as e:
+            print(f"⚠️ Could not update candle store {path}: {e}")
+
+    return candles_to_frame(np.concatenate((merged, open_candles))[-limit:])
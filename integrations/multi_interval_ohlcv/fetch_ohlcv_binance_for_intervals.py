@@ -2,80 +2,73 @@
 # version 2.0, aug 2025
 
 import sys
-import time
 import requests
-import pandas as pd
 from pathlib import Path
-from binance.exceptions import BinanceAPIException
-from requests.exceptions import ReadTimeout
 
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 # CONFIG INIT
-from utils.load_configs_and_logs import load_configs_and_logs 
+from integrations.multi_interval_ohlcv.ohlcv_config import get_ohlcv_config, lazy_attribute
+from integrations.http_transport import http_get
+from integrations.multi_interval_ohlcv.candle_store import fetch_with_store
+from integrations.multi_interval_ohlcv.kline_decoder import decode_klines
+from integrations.multi_interval_ohlcv.parallel_intervals import fetch_intervals
 
-configs_and_logs = load_configs_and_logs([
-    {
-        "name": "multi_interval_ohlcv",
-        "mid_folder": "fetch",
-        "module_key": "multi_interval_ohlcv",
-        "extension": ".jsonl",
-        "return": ["config", "full_log_path", "full_log_schema_path"]
-    }
-])
+# config, general_config and paths are loaded on first use, not at import
+def __getattr__(name):
+    return lazy_attribute(__name__, name)
 
-general_config = configs_and_logs["general_config"]
-config = configs_and_logs["multi_interval_ohlcv_config"]
-paths = {
-    "full_log_path": configs_and_logs["multi_interval_ohlcv_full_log_path"],
-    "full_log_schema_path": configs_and_logs["multi_interval_ohlcv_full_log_schema_path"]
-}
-
-def fetch_ohlcv_binance(symbol, intervals=None, limit=None, start_time=None, end_time=None):
-    intervals = intervals or config.get("intervals")
-    limit = limit or config.get("ohlcv_limit")
+def _fetch_binance_interval(symbol, interval, limit, start_time=None, end_time=None):
+    config = get_ohlcv_config()
     base_url = config.get("binance_base_url", "https://api.binance.com/api/v3/klines")
     max_retries = config.get("fetch_retry", {}).get("max_retries", 3)
     retry_delay = config.get("fetch_retry", {}).get("retry_delay", 2)
 
-    result = {}
+    try:
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit
+        }
 
-    for interval in intervals:
-        success = False
-        for _ in range(max_retries):
-            try:
-                params = {
-                    "symbol": symbol,
-                    "interval": interval,
-                    "limit": limit
-                }
+        if start_time:
+            params["startTime"] = int(start_time.timestamp() * 1000)
+        if end_time:
+            params["endTime"] = int(end_time.timestamp() * 1000)
 
-                if start_time:
-                    params["startTime"] = int(start_time.timestamp() * 1000)
-                if end_time:
-                    params["endTime"] = int(end_time.timestamp() * 1000)
+        # Transient errors are retried by the transport with jittered backoff
+        response = http_get(
+            base_url, params=params, exchange="binance",
+            limits=config.get("exchange_limits", {}).get("binance"),
+            timeout=10, retries=max_retries - 1, backoff=retry_delay
+        )
+        response.raise_for_status()
+        klines = response.json()
 
-                response = requests.get(base_url, params=params, timeout=10)
-                response.raise_for_status()
-                klines = response.json()
+        return decode_klines(klines, "binance")
 
-                df = pd.DataFrame(klines, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                    'close_time', 'quote_asset_volume', 'number_of_trades',
-                    'taker_buy_base_volume', 'taker_buy_quote_volume', 'ignore'
-                ])
-                df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df.set_index('timestamp', inplace=True)
-                df = df.astype(float)
-                result[interval] = df.sort_index()
-                success = True
-                break
+    except requests.exceptions.RequestException:
+        # Network errors reach the exchange health as they are; see is_exchange_failure
+        raise
+    except ValueError:
+        raise Exception(f"Binance fetch failed for {symbol} ({interval})")
+
+def fetch_ohlcv_binance(symbol, intervals=None, limit=None, start_time=None, end_time=None):
+    config = get_ohlcv_config()
+    intervals = intervals or config.get("intervals")
+    limit = limit or config.get("ohlcv_limit")
+    use_store = config.get("candle_store", True) and start_time is None and end_time is None
 
-            except (requests.exceptions.RequestException, ValueError):
-                time.sleep(retry_delay)
+    def fetch_interval(interval):
+        if use_store:
+            # Only the candles after the last stored one are downloaded
+            return fetch_with_store(
+                "binance", symbol, interval, limit,
+                lambda start, end, n: _fetch_binance_interval(symbol, interval, n, start, end)
+            )
+        return _fetch_binance_interval(symbol, interval, limit, start_time, end_time)
 
-        if not success:
-            raise Exception(f"Binance fetch failed for {symbol} ({interval})")
+    # All intervals are requested at once, within the exchange's concurrency cap
+    result = fetch_intervals(intervals, fetch_interval)
 
     return result, "Binance"
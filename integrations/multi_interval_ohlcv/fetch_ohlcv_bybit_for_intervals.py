@@ -9,59 +9,60 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 # Config init
-from utils.load_configs_and_logs import load_configs_and_logs 
+from integrations.multi_interval_ohlcv.ohlcv_config import get_ohlcv_config, lazy_attribute
+from integrations.http_transport import http_get
+from integrations.multi_interval_ohlcv.candle_store import fetch_with_store
+from integrations.multi_interval_ohlcv.kline_decoder import decode_klines
+from integrations.multi_interval_ohlcv.parallel_intervals import fetch_intervals
 
-configs_and_logs = load_configs_and_logs([
-    {
-        "name": "multi_interval_ohlcv",
-        "mid_folder": "fetch",
-        "module_key": "multi_interval_ohlcv",
-        "extension": ".jsonl",
-        "return": ["config", "full_log_path", "full_log_schema_path"]
-    }
-])
+# config, general_config and paths are loaded on first use, not at import
+def __getattr__(name):
+    return lazy_attribute(__name__, name)
 
-general_config = configs_and_logs["general_config"]
-config = configs_and_logs["multi_interval_ohlcv_config"]
-paths = {
-    "full_log_path": configs_and_logs["multi_interval_ohlcv_full_log_path"],
-    "full_log_schema_path": configs_and_logs["multi_interval_ohlcv_full_log_schema_path"]
-}
-
-def fetch_ohlcv_bybit(symbol, intervals=None, limit=None, start_time=None, end_time=None):
-    intervals = intervals or config.get("interval_map_bybit")
-    limit = limit or config.get("ohlcv_limit")
+def _fetch_bybit_interval(symbol, interval, limit, start_time=None, end_time=None):
+    config = get_ohlcv_config()
     interval_map = config.get("interval_map_bybit")
     base_url = config.get("bybit_base_url", "https://api.bybit.com/v5/market/kline")
-    result = {}
 
-    for interval in intervals:
-        try:
-            params = {
-                "category": "spot",
-                "symbol": symbol,
-                "interval": interval_map[interval],
-                "limit": limit
-            }
+    try:
+        params = {
+            "category": "spot",
+            "symbol": symbol,
+            "interval": interval_map[interval],
+            "limit": limit
+        }
 
-            if start_time:
-                params["start"] = int(start_time.timestamp() * 1000)
-            if end_time:
-                params["end"] = int(end_time.timestamp() * 1000)
+        if start_time:
+            params["start"] = int(start_time.timestamp() * 1000)
+        if end_time:
+            params["end"] = int(end_time.timestamp() * 1000)
 
-            r = requests.get(base_url, params=params).json()
-            rows = r['result']['list']
+        r = http_get(base_url, params=params, exchange="bybit", limits=config.get("exchange_limits", {}).get("bybit")).json()
+        rows = r['result']['list']
 
-            df = pd.DataFrame(rows, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-            ])
-            df['timestamp'] = pd.to_datetime(pd.to_numeric(df['timestamp']), unit='ms')
-            df.set_index('timestamp', inplace=True)
-            df = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
+        return decode_klines(rows, "bybit")
 
-            result[interval] = df.sort_index()
+    except requests.exceptions.RequestException:
+        # Network errors reach the exchange health as they are; see is_exchange_failure
+        raise
+    except Exception:
+        return pd.DataFrame()
+
+def fetch_ohlcv_bybit(symbol, intervals=None, limit=None, start_time=None, end_time=None):
+    config = get_ohlcv_config()
+    intervals = intervals or config.get("interval_map_bybit")
+    limit = limit or config.get("ohlcv_limit")
+    use_store = config.get("candle_store", True) and start_time is None and end_time is None
+    def fetch_interval(interval):
+        if use_store:
+            # Only the candles after the last stored one are downloaded
+            return fetch_with_store(
+                "bybit", symbol, interval, limit,
+                lambda start, end, n: _fetch_bybit_interval(symbol, interval, n, start, end)
+            )
+        return _fetch_bybit_interval(symbol, interval, limit, start_time, end_time)
 
-        except Exception:
-            result[interval] = pd.DataFrame()
+    # All intervals are requested at once, within the exchange's concurrency cap
+    result = fetch_intervals(intervals, fetch_interval)
 
     return result, "ByBit"
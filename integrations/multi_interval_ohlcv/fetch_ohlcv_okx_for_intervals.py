@@ -11,71 +11,70 @@ sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 # Config init
 from utils.format_symbol_for_okx import format_symbol_for_okx
-from utils.load_configs_and_logs import load_configs_and_logs 
+from integrations.multi_interval_ohlcv.ohlcv_config import get_ohlcv_config, lazy_attribute
+from integrations.http_transport import http_get
+from integrations.multi_interval_ohlcv.candle_store import fetch_with_store
+from integrations.multi_interval_ohlcv.kline_decoder import decode_klines
+from integrations.multi_interval_ohlcv.parallel_intervals import fetch_intervals
 
-configs_and_logs = load_configs_and_logs([
-    {
-        "name": "multi_interval_ohlcv",
-        "mid_folder": "fetch",
-        "module_key": "multi_interval_ohlcv",
-        "extension": ".jsonl",
-        "return": ["config", "full_log_path", "full_log_schema_path"]
-    }
-])
+# config, general_config and paths are loaded on first use, not at import
+def __getattr__(name):
+    return lazy_attribute(__name__, name)
 
-general_config = configs_and_logs["general_config"]
-config = configs_and_logs["multi_interval_ohlcv_config"]
-paths = {
-    "full_log_path": configs_and_logs["multi_interval_ohlcv_full_log_path"],
-    "full_log_schema_path": configs_and_logs["multi_interval_ohlcv_full_log_schema_path"]
-}
-
-def fetch_ohlcv_okx(symbol, intervals=None, limit=None, start_time=None, end_time=None):
-    symbol = format_symbol_for_okx(symbol)
-    intervals = intervals or config.get("interval_map_okx")
-    limit = limit or config.get("ohlcv_limit")
+def _fetch_okx_interval(symbol, interval, limit, start_time=None, end_time=None):
+    config = get_ohlcv_config()
     interval_map = config.get("interval_map_okx")
     base_url = config.get("okx_base_url", "https://www.okx.com/api/v5/market/candles")
-    result = {}
 
-    for interval in intervals:
-        try:
-            params = {
-                "instId": symbol,
-                "bar": interval_map[interval],
-                "limit": str(limit)
-            }
+    try:
+        params = {
+            "instId": symbol,
+            "bar": interval_map[interval],
+            "limit": str(limit)
+        }
 
-            if start_time:
-                params["after"] = int(start_time.timestamp() * 1000)
-            if end_time:
-                params["before"] = int(end_time.timestamp() * 1000)
+        # OKX paginates: "before" returns candles newer than ts, "after" older than ts
+        if start_time:
+            params["before"] = int(start_time.timestamp() * 1000) - 1
+        if end_time:
+            params["after"] = int(end_time.timestamp() * 1000) + 1
 
-            response = requests.get(base_url, params=params)
-            data = response.json()
+        response = http_get(base_url, params=params, exchange="okx", limits=config.get("exchange_limits", {}).get("okx"))
+        data = response.json()
 
-            if data.get("code") != "0":
-                result[interval] = pd.DataFrame()
-                continue
+        if data.get("code") != "0":
+            return pd.DataFrame()
 
-            rows = data.get("data", [])
-            if not rows:
-                print(f"⚠️ No OHLCV data returned from OKX for {symbol} @ {interval}")
-                result[interval] = pd.DataFrame()
-                continue
+        rows = data.get("data", [])
+        if not rows:
+            print(f"⚠️ No OHLCV data returned from OKX for {symbol} @ {interval}")
+            return pd.DataFrame()
 
-            df = pd.DataFrame(rows, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'quote_volume', 'ignore1', 'ignore2'
-            ])
-            df['timestamp'] = pd.to_datetime(pd.to_numeric(df['timestamp']), unit='ms')
-            df.set_index('timestamp', inplace=True)
-            df = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
+        return decode_klines(rows, "okx")
 
-            result[interval] = df.sort_index()
+    except requests.exceptions.RequestException:
+        # Network errors reach the exchange health as they are; see is_exchange_failure
+        raise
+    except Exception as e:
+        print(f"❌ Exception while fetching {symbol} @ {interval} from OKX: {e}")
+        return pd.DataFrame()
+
+def fetch_ohlcv_okx(symbol, intervals=None, limit=None, start_time=None, end_time=None):
+    config = get_ohlcv_config()
+    symbol = format_symbol_for_okx(symbol)
+    intervals = intervals or config.get("interval_map_okx")
+    limit = limit or config.get("ohlcv_limit")
+    use_store = config.get("candle_store", True) and start_time is None and end_time is None
+    def fetch_interval(interval):
+        if use_store:
+            # Only the candles after the last stored one are downloaded
+            return fetch_with_store(
+                "okx", symbol, interval, limit,
+                lambda start, end, n: _fetch_okx_interval(symbol, interval, n, start, end)
+            )
+        return _fetch_okx_interval(symbol, interval, limit, start_time, end_time)
 
-        except Exception as e:
-            print(f"❌ Exception while fetching {symbol} @ {interval} from OKX: {e}")
-            result[interval] = pd.DataFrame()
+    # All intervals are requested at once, within the exchange's concurrency cap
+    result = fetch_intervals(intervals, fetch_interval)
 
-    return result, "Okx"
\ No newline at end of file
+    return result, "Okx"
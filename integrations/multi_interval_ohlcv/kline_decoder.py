@@ -0,0 +1,50 @@
+# integrations/multi_interval_ohlcv/kline_decoder.py
+# version 2.0, aug 2025
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Where each field sits in one kline row of an exchange's REST response
+KLINE_LAYOUTS = {
+    "binance": {"time": 0, "time_unit_ms": 1, "ohlcv": (1, 2, 3, 4, 5), "newest_first": False},
+    "bybit": {"time": 0, "time_unit_ms": 1, "ohlcv": (1, 2, 3, 4, 5), "newest_first": True},
+    "okx": {"time": 0, "time_unit_ms": 1, "ohlcv": (1, 2, 3, 4, 5), "newest_first": True},
+    "kucoin": {"time": 0, "time_unit_ms": 1000, "ohlcv": (1, 3, 4, 2, 5), "newest_first": True},
+}
+
+def empty_ohlcv_frame():
+    index = pd.DatetimeIndex([], dtype="datetime64[ns]", name="timestamp")
+    return pd.DataFrame({column: np.empty(0) for column in OHLCV_COLUMNS}, index=index)
+
+def decode_klines(rows, exchange):
+    """
+    Kline rows as the exchange returns them (lists of strings or numbers) -> OHLCV DataFrame
+    with a DatetimeIndex of open times, oldest first. Only the five OHLCV fields and the open
+    time are read, each straight into a float64 / int64 array, and the frame is built once.
+    """
+    layout = KLINE_LAYOUTS[exchange]
+    count = len(rows)
+    if count == 0:
+        return empty_ohlcv_frame()
+
+    if layout["newest_first"]:
+        rows = rows[::-1]
+
+    open_ms = np.fromiter((int(row[layout["time"]]) for row in rows), dtype=np.int64, count=count)
+    if layout["time_unit_ms"] != 1:
+        open_ms *= layout["time_unit_ms"]
+
+    columns = {}
+    for column, position in zip(OHLCV_COLUMNS, layout["ohlcv"]):
+        columns[column] = np.fromiter((row[position] for row in rows), dtype=np.float64, count=count)
+
+    # The responses are already in order; sort only if one is not
+    if count > 1 and np.any(open_ms[1:] < open_ms[:-1]):
+        order = np.argsort(open_ms, kind="stable")
+        open_ms = open_ms[order]
+        columns = {column: values[order] for column, values in columns.items()}
+
+    index = pd.DatetimeIndex(open_ms.astype("datetime64[ms]").astype("datetime64[ns]"), name="timestamp")
+    return pd.DataFrame(columns, index=index, copy=False)
@@ -1,44 +1,132 @@
 # integrations/multi_interval_ohlcv/multi_ohlcv_handler.py
 # version 2.0, aug 2025
 
-from ta.momentum import RSIIndicator
-from ta.trend import EMAIndicator, MACD
-from ta.volatility import BollingerBands
 from shutil import copyfile
 
 import sys
 import json
+import time
 import logging
+import calendar
 import importlib
-import numpy as np 
+import threading
 import pandas as pd
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
-# Config init
-from utils.load_configs_and_logs import load_configs_and_logs
 from modules.save_and_validate.save_and_validate import save_and_validate
 from utils.get_timestamp import get_timestamp 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from integrations.exchange_health import get_exchange_health, is_exchange_failure, MIN_PAIR_SAMPLES
+from integrations.multi_interval_ohlcv.ohlcv_config import load_ohlcv_configs, lazy_attribute
+from modules.indicator_engine.indicator_engine import get_indicators, last_value
+from modules.indicator_engine.streaming_indicators import get_streaming_store
+
+# Config init: config, general_config and paths are loaded on first access (see ohlcv_config.py),
+# so importing this module does no file or schema work
+def __getattr__(name):
+    return lazy_attribute(__name__, name)
+
+def get_config():
+    """The multi_interval_ohlcv config; a value set on the module (as tests do) takes precedence."""
+    return globals()["config"] if "config" in globals() else load_ohlcv_configs()["config"]
+
+def get_paths():
+    return globals()["paths"] if "paths" in globals() else load_ohlcv_configs()["paths"]
+
+# In-process OHLCV cache: (symbol, interval) -> {"df", "limit", "source_exchange", "expires_at", "previews"}.
+# An entry is valid until the candle that was open at fetch time closes, so every caller
+# within one loop shares a single REST request per symbol and interval. The last candle is
+# still forming, so the entry is also capped to ohlcv_cache_max_age_seconds to keep its
+# close price from going stale on long intervals.
+_ohlcv_cache = {}
+_ohlcv_cache_lock = threading.Lock()
+_ohlcv_cache_stats = {"hits": 0, "misses": 0}
+
+INTERVAL_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+WEEK_OFFSET_SECONDS = 4 * 86400  # epoch is a Thursday, exchange weeks start on Monday
+DEFAULT_CACHE_MAX_AGE_SECONDS = 60
+
+# Hedged mode (config hedged_requests): a slow primary gets a second exchange racing it
+DEFAULT_HEDGE_DELAY = 2.0    # seconds, until the primary has latency stats
+MIN_HEDGE_DELAY = 0.2
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ohlcv-hedge")
+
+def next_candle_close(interval, now=None):
+    """Epoch seconds at which the currently open candle of interval closes (UTC aligned)."""
+    now = time.time() if now is None else now
+    amount, unit = int(interval[:-1] or 1), interval[-1]
+
+    if unit == "M":
+        current = time.gmtime(now)
+        months = current.tm_year * 12 + (current.tm_mon - 1) + amount
+        return calendar.timegm((months // 12, months % 12 + 1, 1, 0, 0, 0))
+
+    step = amount * INTERVAL_UNIT_SECONDS[unit]
+    offset = WEEK_OFFSET_SECONDS if unit == "w" else 0
+    return ((now - offset) // step + 1) * step + offset
+
+def get_cached_ohlcv(symbol, interval, limit, now=None):
+    """Returns the cache entry when it is fresh and holds at least limit rows."""
+    now = time.time() if now is None else now
+    with _ohlcv_cache_lock:
+        entry = _ohlcv_cache.get((symbol, interval))
+        if entry is None or now >= entry["expires_at"]:
+            _ohlcv_cache.pop((symbol, interval), None)
+            return None
+        if entry["limit"] < limit:
+            return None
+        return entry
+
+def _cached_frame_and_preview(entry, symbol, interval, limit):
+    # A smaller request is served from the tail of the larger cached frame
+    df = entry["df"].tail(limit).copy()
+    preview = entry["previews"].get(limit)
+    if preview is None:
+        # Same summary as a fresh fetch of these candles logs
+        preview = entry["previews"][limit] = summarize_data_for_logging({interval: df}, symbol, live=True)
+    return df, preview
+
+def joined_source(source_by_interval, intervals):
+    """One exchange name, or the names joined with '/' when intervals came from different ones."""
+    return "/".join(dict.fromkeys(source_by_interval[i] for i in intervals if source_by_interval.get(i)))
+
+def store_cached_ohlcv(symbol, data_by_interval, limit, source_exchange, now=None):
+    now = time.time() if now is None else now
+    max_age = (get_config() or {}).get("ohlcv_cache_max_age_seconds", DEFAULT_CACHE_MAX_AGE_SECONDS)
+    with _ohlcv_cache_lock:
+        for interval, df in data_by_interval.items():
+            if df is None or df.empty:
+                continue
+            try:
+                expires_at = min(next_candle_close(interval, now), now + max_age)
+            except (KeyError, ValueError):
+                continue
+            _ohlcv_cache[(symbol, interval)] = {
+                "df": df.copy(),
+                "limit": limit,
+                "source_exchange": source_exchange,
+                "expires_at": expires_at,
+                "previews": {},
+            }
 
-configs_and_logs = load_configs_and_logs([
-    {
-        "name": "multi_interval_ohlcv",
-        "mid_folder": "fetch",
-        "module_key": "multi_interval_ohlcv",
-        "extension": ".jsonl",
-        "return": ["config", "full_log_path", "full_log_schema_path"]
-    }
-])
+def clear_ohlcv_cache():
+    with _ohlcv_cache_lock:
+        _ohlcv_cache.clear()
+
+def get_ohlcv_cache_stats():
+    with _ohlcv_cache_lock:
+        return {**_ohlcv_cache_stats, "entries": len(_ohlcv_cache)}
 
-general_config = configs_and_logs["general_config"]
-config = configs_and_logs["multi_interval_ohlcv_config"]
-paths = {
-    "full_log_path": configs_and_logs["multi_interval_ohlcv_full_log_path"],
-    "full_log_schema_path": configs_and_logs["multi_interval_ohlcv_full_log_schema_path"]
-}
+def fetch_ohlcv_fallback(symbol, intervals=None, limit=None, start_time=None, end_time=None, log_path = None, save=True):
+    """
+    Fetches OHLCV data for symbol from the first exchange that has it and logs a summary.
+    With save=False the summary is only returned, so a caller can write many in one batch.
+    """
 
-def fetch_ohlcv_fallback(symbol, intervals=None, limit=None, start_time=None, end_time=None, log_path = paths["full_log_path"]):
+    config = get_config()
+    log_path = log_path or get_paths()["full_log_path"]
 
     data_by_interval = {}
     source_exchange = None
@@ -46,79 +134,214 @@ def fetch_ohlcv_fallback(symbol, intervals=None, limit=None, start_time=None, en
     limit = limit or config.get("ohlcv_limit")
     errors = {}
 
+    # Only live requests are cached; historical ranges always go to the exchange
+    use_cache = config.get("ohlcv_cache", True) and start_time is None and end_time is None
+    cached = {}
+    if use_cache:
+        for interval in intervals:
+            hit = get_cached_ohlcv(symbol, interval, limit)
+            if hit is not None:
+                cached[interval] = hit
+        with _ohlcv_cache_lock:
+            _ohlcv_cache_stats["hits"] += len(cached)
+            _ohlcv_cache_stats["misses"] += len(intervals) - len(cached)
+
+        if len(cached) == len(intervals):
+            # Served without a REST call, so nothing new is written to the fetch log
+            data_by_interval, data_preview = {}, {}
+            for interval in intervals:
+                data_by_interval[interval], preview = _cached_frame_and_preview(cached[interval], symbol, interval, limit)
+                data_preview.update(preview)
+            source_by_interval = {interval: cached[interval]["source_exchange"] for interval in intervals}
+            return {
+                "timestamp": get_timestamp(),
+                "source_exchange": joined_source(source_by_interval, intervals),
+                "symbol": symbol,
+                "intervals": intervals,
+                "data_preview": data_preview,
+                "limit": limit,
+                "start_time": start_time,
+                "end_time": end_time,
+                "data_by_interval": data_by_interval,
+                "source_by_interval": source_by_interval,
+                "from_cache": True
+            }
+
+    missing_intervals = [interval for interval in intervals if interval not in cached]
+
     exchange_priority = config.get("exchange_priority", [])
     fetch_functions = config.get("fetch_functions", {})
 
+    # Healthiest exchange first; ones cooling down after repeated failures are skipped
+    health = get_exchange_health("ohlcv")
+    if config.get("adaptive_exchange_order", True):
+        exchange_priority = health.order(exchange_priority, symbol)
+
+    candidates = []
     for exchange in exchange_priority:
         fn_name = fetch_functions.get(exchange)
         if not fn_name:
             logging.warning(f"[{exchange}] Fetch function not defined.")
             continue
+        candidates.append((exchange, fn_name))
+
+    def attempt(exchange, fn_name):
+        return _fetch_from_exchange(exchange, fn_name, symbol, missing_intervals, limit, start_time, end_time, health)
+
+    if config.get("hedged_requests", False) and len(candidates) > 1:
+        fetched = _fetch_hedged(candidates, attempt, symbol, health, errors)
+    else:
+        fetched = None
+        for exchange, fn_name in candidates:
+            try:
+                fetched = attempt(exchange, fn_name)
+                break
+            except Exception as e:
+                errors[exchange] = str(e)
+
+    if fetched is None:
+        logging.error(f"❌ Failed to fetch OHLCV data from all exchanges. Errors: {errors}")
+        print(f"\033[93m⚠️  This coin pair can't be found from any supported exchange: {symbol}\033[0m")
+        return None
+
+    data_by_interval, source_exchange = fetched
+    logging.info(f"✅ Fetch successful: {symbol} ({source_exchange})")
+
+    # On a partial cache hit the intervals can come from different exchanges; each keeps its own
+    source_by_interval = {interval: source_exchange for interval in missing_intervals}
+    if use_cache:
+        store_cached_ohlcv(symbol, data_by_interval, limit, source_exchange)
+        source_by_interval.update({interval: entry["source_exchange"] for interval, entry in cached.items()})
+        data_by_interval = {
+            interval: _cached_frame_and_preview(cached[interval], symbol, interval, limit)[0] if interval in cached else data_by_interval.get(interval, pd.DataFrame())
+            for interval in intervals
+        }
+        source_exchange = joined_source(source_by_interval, intervals)
+
+    summarized_data = summarize_data_for_logging(data_by_interval, symbol, live=start_time is None and end_time is None)
+
+    timestamp = get_timestamp()
+
+    to_save = {
+        "timestamp": timestamp,
+        "source_exchange": source_exchange,
+        "symbol": symbol,
+        "intervals": intervals,
+        "data_preview": summarized_data,
+        "limit": limit,
+        "start_time": start_time,
+        "end_time": end_time,
+    }
 
-        try:
-            logging.info(f"🔍 Trying to fetch OHLCV data for {symbol} ({intervals}) from exchange {exchange}")
+    if save:
+        save_and_validate(
+            data=to_save,
+            path=log_path,
+            schema=get_paths()["full_log_schema_path"],
+            verbose=False,
+            background=True
+        )
+    return {
+        **to_save,
+        "data_by_interval": data_by_interval,
+        "source_by_interval": source_by_interval
+    }
+
+def _fetch_from_exchange(exchange, fn_name, symbol, intervals, limit, start_time, end_time, health):
+    """
+    One exchange attempt, recorded in the health stats. Returns (data_by_interval, source_exchange)
+    with at least one non-empty frame, otherwise raises.
+    """
+    started = time.monotonic()
+    try:
+        logging.info(f"🔍 Trying to fetch OHLCV data for {symbol} ({intervals}) from exchange {exchange}")
 
-            module_path = f"integrations.multi_interval_ohlcv.fetch_ohlcv_{exchange}_for_intervals"
-            fetch_module = importlib.import_module(module_path)
-            fetch_fn = getattr(fetch_module, fn_name)
+        module_path = f"integrations.multi_interval_ohlcv.fetch_ohlcv_{exchange}_for_intervals"
+        fetch_module = importlib.import_module(module_path)
+        fetch_fn = getattr(fetch_module, fn_name)
+
+        fetch_kwargs = {
+            "symbol": symbol,
+            "intervals": intervals,
+            "limit": limit
+        }
+        if start_time is not None and end_time is not None:
+            fetch_kwargs["start_time"] = start_time
+            fetch_kwargs["end_time"] = end_time
+
+        # Do the fetch
+        data_by_interval, source_exchange = fetch_fn(**fetch_kwargs)
+
+    except Exception as e:
+        health.record(exchange, symbol, False, time.monotonic() - started,
+                      symbol_error=not is_exchange_failure(e))
+        logging.warning(f"⚠️  Error fetching {symbol} ({exchange}): {e}")
+        raise
+
+    succeeded = any(not df.empty for df in data_by_interval.values())
+    health.record(exchange, symbol, succeeded, time.monotonic() - started, symbol_error=not succeeded)
+    if not succeeded:
+        raise ValueError("Empty DataFrames")
+    return data_by_interval, source_exchange
+
+def get_hedge_delay(exchange, symbol, health):
+    """Seconds to wait for exchange before hedging: hedge_after_seconds, else its p90 latency."""
+    config = get_config()
+    if config.get("hedge_after_seconds") is not None:
+        return float(config["hedge_after_seconds"])
+    stats = health.stats(exchange, symbol)
+    if stats["attempts"] < MIN_PAIR_SAMPLES or stats["p90"] is None:
+        stats = health.stats(exchange)
+    p90 = stats["p90"] if stats["p90"] is not None else DEFAULT_HEDGE_DELAY
+    return max(MIN_HEDGE_DELAY, p90)
+
+def _fetch_hedged(candidates, attempt, symbol, health, errors):
+    """
+    Starts the first exchange and, if it has not answered within its hedge delay, the next one
+    as well; at most two requests are in flight. A failure starts the next exchange at once.
+    The first non-empty result wins and the request still pending is abandoned: a queued one
+    is cancelled, a running one finishes in the background and only updates the health stats.
+    """
+    queue = list(candidates)
+    pending = {}
+
+    def launch():
+        exchange, fn_name = queue.pop(0)
+        pending[_hedge_pool.submit(attempt, exchange, fn_name)] = exchange
+        return exchange
+
+    last_started = launch()
+    while pending:
+        timeout = get_hedge_delay(last_started, symbol, health) if queue and len(pending) < 2 else None
+        done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+        if not done:
+            last_started = launch()
+            logging.info(f"⏱️  {symbol}: no answer within {timeout:.2f}s, hedging to {last_started}")
+            continue
+
+        for future in done:
+            exchange = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                errors[exchange] = str(e)
+                continue
+            for other in pending:
+                other.cancel()
+            return result
+
+        if queue and len(pending) < 2:
+            last_started = launch()
 
-            fetch_kwargs = {
-                "symbol": symbol,
-                "intervals": intervals,
-                "limit": limit
-            }
-            if start_time is not None and end_time is not None:
-                fetch_kwargs["start_time"] = start_time
-                fetch_kwargs["end_time"] = end_time
-
-            # Do the fetch
-            data_by_interval, source_exchange = fetch_fn(**fetch_kwargs)
-
-            if any(not df.empty for df in data_by_interval.values()):
-                logging.info(f"✅ Fetch successful: {symbol} ({source_exchange})")
-
-                summarized_data = summarize_data_for_logging(data_by_interval)
-
-                timestamp = get_timestamp()
-
-                to_save = {
-                    "timestamp": timestamp,
-                    "source_exchange": source_exchange,
-                    "symbol": symbol,
-                    "intervals": intervals,
-                    "data_preview": summarized_data,
-                    "limit": limit,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                }
-
-                save_and_validate(
-                    data=to_save,
-                    path=log_path,
-                    schema=paths["full_log_schema_path"],
-                    verbose=False
-                )
-                return {
-                    **to_save,
-                    "data_by_interval": data_by_interval
-                }
-                
-            else:
-                errors[exchange] = "Empty DataFrames"
-
-        except Exception as e:
-            errors[exchange] = str(e)
-            logging.warning(f"⚠️  Error fetching {symbol} ({exchange}): {e}")
-
-    logging.error(f"❌ Failed to fetch OHLCV data from all exchanges. Errors: {errors}")
-    print(f"\033[93m⚠️  This coin pair can't be found from any supported exchange: {symbol}\033[0m")
     return None
 
-def summarize_data_for_logging(data_by_interval: dict[str, pd.DataFrame]) -> dict[str, dict]:
+def summarize_data_for_logging(data_by_interval: dict[str, pd.DataFrame], symbol: str = None, live: bool = False) -> dict[str, dict]:
     """
-    Summarizes OHLCV-data for analysis 
+    Summarizes OHLCV-data for analysis. live marks the latest candles of the symbol (no
+    start/end time), the only data the streaming indicator state may follow.
     """
-    equired_analysis_keys = set(config.get("required_analysis_keys", []))
+    equired_analysis_keys = set(get_config().get("required_analysis_keys", []))
     summary = {}
 
     for interval, df in data_by_interval.items():
@@ -129,7 +352,7 @@ def summarize_data_for_logging(data_by_interval: dict[str, pd.DataFrame]) -> dic
             print(f"⚠️  Interval {interval} missing valid close prices")
             continue
 
-        analysis = analyze_ohlcv(df)
+        analysis = analyze_ohlcv(df, symbol, interval, live)
 
         try:
             last_close = float(df["close"].iloc[-1])
@@ -145,38 +368,30 @@ def summarize_data_for_logging(data_by_interval: dict[str, pd.DataFrame]) -> dic
 
     return summary
 
-def analyze_ohlcv(df):
+def analyze_ohlcv(df, symbol=None, interval=None, live=False):
     if df.empty or 'close' not in df.columns:
         return {}
 
-    result = {}
-    close = df["close"]
-
-    # RSI
-    rsi = RSIIndicator(close=close, window=14).rsi()
-    last_rsi = rsi.iloc[-1] if not rsi.empty else None
-    result["rsi"] = round(last_rsi, 2) if last_rsi is not None and not np.isnan(last_rsi) else None
-
-    # EMA
-    ema = EMAIndicator(close=close, window=20).ema_indicator()
-    last_ema = ema.iloc[-1] if not ema.empty else None
-    result["ema"] = round(last_ema, 2) if last_ema is not None and not np.isnan(last_ema) else None
-
-    # MACD
-    macd_obj = MACD(close=close)
-    macd_val = macd_obj.macd().iloc[-1] if not macd_obj.macd().empty else None
-    signal_val = macd_obj.macd_signal().iloc[-1] if not macd_obj.macd_signal().empty else None
-    result["macd"] = round(macd_val, 2) if macd_val is not None and not np.isnan(macd_val) else None
-    result["macd_signal"] = round(signal_val, 2) if signal_val is not None and not np.isnan(signal_val) else None
-
-    # Bollinger Bands
-    bb = BollingerBands(close=close, window=20)
-    upper = bb.bollinger_hband().iloc[-1] if not bb.bollinger_hband().empty else None
-    lower = bb.bollinger_lband().iloc[-1] if not bb.bollinger_lband().empty else None
-    result["bb_upper"] = round(upper, 2) if upper is not None and not np.isnan(upper) else None
-    result["bb_lower"] = round(lower, 2) if lower is not None and not np.isnan(lower) else None
-
-    return result
+    # Opt-in: live candles of a known symbol and interval advance the saved streaming state
+    # by the new candles only; historical ranges would rewind it, short frames can't seed it
+    if live and symbol and interval and get_config().get("streaming_indicators", False):
+        values = get_streaming_store().sync(symbol, interval, df)
+        if values is not None:
+            return {key: last_value([values[key]], 2) for key in ("rsi", "ema", "macd", "macd_signal", "bb_upper", "bb_lower")}
+
+    # Shared with signals and market state through the indicator engine memo
+    indicators = get_indicators(df, symbol, interval)
+    macd = indicators.macd()
+    bands = indicators.bollinger(window=20)
+
+    return {
+        "rsi": last_value(indicators.rsi(window=14), 2),
+        "ema": last_value(indicators.ema(window=20), 2),
+        "macd": last_value(macd["macd"], 2),
+        "macd_signal": last_value(macd["signal"], 2),
+        "bb_upper": last_value(bands["upper"], 2),
+        "bb_lower": last_value(bands["lower"], 2),
+    }
 
 def test_single_exchange_ohlcv(symbol, exchange, config, intervals=None):
     print(f"\n🔍 Testing OHLCV fetch from: {exchange} for symbol {symbol}")
@@ -0,0 +1,52 @@
+# integrations/multi_interval_ohlcv/ohlcv_config.py
+# version 2.0, aug 2025
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from utils.load_configs_and_logs import load_configs_and_logs
+
+# The former import-time globals of the OHLCV modules, served by their module __getattr__
+LAZY_ATTRIBUTES = ("config", "general_config", "paths")
+
+_loaded = None
+_lock = threading.Lock()
+
+def load_ohlcv_configs():
+    """
+    multi_interval_ohlcv config and log paths, loaded and validated on first use instead
+    of when the handler or a fetcher is imported. Returns {"config", "general_config", "paths"}.
+    """
+    global _loaded
+    with _lock:
+        if _loaded is None:
+            configs_and_logs = load_configs_and_logs([
+                {
+                    "name": "multi_interval_ohlcv",
+                    "mid_folder": "fetch",
+                    "module_key": "multi_interval_ohlcv",
+                    "extension": ".jsonl",
+                    "return": ["config", "full_log_path", "full_log_schema_path"]
+                }
+            ])
+            _loaded = {
+                "general_config": configs_and_logs["general_config"],
+                "config": configs_and_logs["multi_interval_ohlcv_config"],
+                "paths": {
+                    "full_log_path": configs_and_logs["multi_interval_ohlcv_full_log_path"],
+                    "full_log_schema_path": configs_and_logs["multi_interval_ohlcv_full_log_schema_path"]
+                },
+            }
+        return _loaded
+
+def get_ohlcv_config():
+    return load_ohlcv_configs()["config"]
+
+def lazy_attribute(module_name, name):
+    """Module __getattr__ body for the OHLCV modules."""
+    if name in LAZY_ATTRIBUTES:
+        return load_ohlcv_configs()[name]
+    raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+# integrations/multi_interval_ohlcv/parallel_intervals.py
+# version 2.0, aug 2025
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared by all exchange fetchers; the per-exchange limiter in utils/rate_limiter.py
+# decides how many of these requests actually run against one exchange at a time
+INTERVAL_POOL_WORKERS = 16
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=INTERVAL_POOL_WORKERS, thread_name_prefix="ohlcv-interval")
+        return _pool
+
+def fetch_intervals(intervals, fetch_interval):
+    """
+    Runs fetch_interval(interval) for every interval concurrently and returns
+    {interval: result} in the order of intervals. The first exception (in interval
+    order) is raised once all requests have finished.
+    """
+    intervals = list(intervals)
+    if len(intervals) <= 1:
+        return {interval: fetch_interval(interval) for interval in intervals}
+
+    pool = _get_pool()
+    futures = [(interval, pool.submit(fetch_interval, interval)) for interval in intervals]
+
+    result, error = {}, None
+    for interval, future in futures:
+        try:
+            result[interval] = future.result()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+    return result
@@ -0,0 +1,163 @@
+# integrations/multi_interval_ohlcv/resampled_ohlcv.py
+# version 2.0, aug 2025
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from modules.save_and_validate.save_and_validate import save_and_validate
+from integrations.multi_interval_ohlcv import multi_ohlcv_handler as handler
+from integrations.multi_interval_ohlcv.candle_store import interval_to_ms, OHLCV_COLUMNS
+from utils.get_timestamp import get_timestamp
+
+# Largest base request a derived interval may need; Binance and Bybit cap klines at 1000
+DEFAULT_MAX_BASE_CANDLES = 1000
+WEEK_OFFSET_MS = handler.WEEK_OFFSET_SECONDS * 1000
+
+def plan_intervals(intervals, limit, max_base_candles=DEFAULT_MAX_BASE_CANDLES):
+    """
+    Splits intervals into the ones to fetch and the ones to build from them.
+    Returns ({interval: source interval}, {base interval: candles to fetch}). An interval is
+    derived from the coarsest base it is a whole multiple of, if limit of it fits in
+    max_base_candles base candles (plus one bucket for a partial first one); otherwise it
+    becomes a base itself. Calendar months are always fetched.
+    """
+    sized = sorted((interval_to_ms(interval) or 0, interval) for interval in dict.fromkeys(intervals))
+    sources, base_limits = {}, {}
+
+    for size, interval in sized:
+        source = None
+        if size:
+            for base in sorted(base_limits, key=lambda b: interval_to_ms(b) or 0, reverse=True):
+                base_size = interval_to_ms(base)
+                if not base_size or size % base_size:
+                    continue
+                needed = (limit + 1) * (size // base_size)
+                if needed <= max_base_candles:
+                    source = base
+                    base_limits[base] = max(base_limits[base], needed)
+                    break
+        if source is None:
+            source = interval
+            base_limits[interval] = max(base_limits.get(interval, 0), limit)
+        sources[interval] = source
+
+    return sources, base_limits
+
+def resample_candles(df, interval):
+    """
+    Aggregates a base OHLCV frame into interval candles aligned to exchange boundaries
+    (UTC epoch, weeks from Monday): first open, max high, min low, last close, summed volume.
+    A first bucket the base series does not cover from its start is dropped.
+    """
+    size = interval_to_ms(interval)
+    if df is None or df.empty or size is None:
+        return pd.DataFrame() if df is None else df.iloc[0:0]
+
+    open_ms = df.index.values.astype("datetime64[ms]").astype(np.int64)
+    offset = WEEK_OFFSET_MS if interval[-1] == "w" else 0
+    buckets = (open_ms - offset) // size * size + offset
+
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    if open_ms[0] != buckets[0]:
+        starts, ends = starts[1:], ends[1:]
+    if not len(starts):
+        return df.iloc[0:0]
+
+    values = {column: df[column].to_numpy(dtype=float) for column in OHLCV_COLUMNS}
+
+    columns = {
+        "open": values["open"][starts],
+        "high": np.maximum.reduceat(values["high"], starts),
+        "low": np.minimum.reduceat(values["low"], starts),
+        "close": values["close"][ends],
+        "volume": np.add.reduceat(values["volume"], starts),
+    }
+    index = pd.DatetimeIndex(buckets[starts].astype("datetime64[ms]").astype("datetime64[ns]"), name="timestamp")
+    return pd.DataFrame(columns, index=index)
+
+def fetch_ohlcv_resampled(symbol, intervals=None, limit=None, start_time=None, end_time=None, log_path=None, save=True):
+    """
+    Same result as fetch_ohlcv_fallback, but only the base intervals from plan_intervals are
+    requested, one request per planned limit, and the rest are built locally with resample_candles. A derived interval that
+    comes out shorter than limit (not enough base history, e.g. a 300 candle OKX response)
+    is fetched directly instead. Historical ranges go straight to fetch_ohlcv_fallback.
+    """
+    config = handler.get_config()
+    log_path = log_path or handler.get_paths()["full_log_path"]
+    intervals = intervals or config.get("intervals")
+    limit = limit or config.get("ohlcv_limit")
+
+    if start_time is not None or end_time is not None or not config.get("resample_intervals", True):
+        return handler.fetch_ohlcv_fallback(symbol, intervals, limit, start_time, end_time, log_path=log_path, save=save)
+
+    max_base_candles = config.get("resample_max_base_candles", DEFAULT_MAX_BASE_CANDLES)
+    sources, base_limits = plan_intervals(intervals, limit, max_base_candles)
+    if len(base_limits) == len(sources):
+        return handler.fetch_ohlcv_fallback(symbol, intervals, limit, log_path=log_path, save=save)
+
+    # One request per planned limit, so a base is never fetched with more candles than its
+    # plan needs (payload, decode work and per-request weight all grow with the limit)
+    groups = {}
+    for interval, base_limit in base_limits.items():
+        groups.setdefault(base_limit, []).append(interval)
+
+    frames, source_by_interval, fetched = {}, {}, []
+    for base_limit, group in groups.items():
+        base = handler.fetch_ohlcv_fallback(symbol, group, base_limit, log_path=log_path, save=False)
+        if not base:
+            continue
+        fetched.append(base)
+        frames.update(base["data_by_interval"])
+        source_by_interval.update(base.get("source_by_interval") or dict.fromkeys(group, base["source_exchange"]))
+    if not fetched:
+        return None
+
+    data_by_interval, short = {}, []
+    for interval in intervals:
+        source = sources[interval]
+        df = frames.get(source, pd.DataFrame())
+        source_by_interval[interval] = source_by_interval.get(source)
+        if source != interval:
+            df = resample_candles(df, interval)
+            if len(df) < limit:
+                short.append(interval)
+        data_by_interval[interval] = df.tail(limit)
+
+    if short:
+        direct = handler.fetch_ohlcv_fallback(symbol, short, limit, log_path=log_path, save=False)
+        if direct:
+            data_by_interval.update({interval: direct["data_by_interval"][interval] for interval in short})
+            source_by_interval.update(direct.get("source_by_interval") or dict.fromkeys(short, direct["source_exchange"]))
+
+    to_save = {
+        "timestamp": get_timestamp(),
+        "source_exchange": handler.joined_source(source_by_interval, intervals),
+        "symbol": symbol,
+        "intervals": intervals,
+        "data_preview": handler.summarize_data_for_logging(data_by_interval, symbol, live=True),
+        "limit": limit,
+        "start_time": start_time,
+        "end_time": end_time,
+    }
+
+    # Like fetch_ohlcv_fallback, a result served wholly from the cache is not logged again
+    from_cache = len(fetched) == len(groups) and all(base.get("from_cache") for base in fetched) and not short
+    if save and not from_cache:
+        save_and_validate(
+            data=to_save,
+            path=log_path,
+            schema=handler.get_paths()["full_log_schema_path"],
+            verbose=False,
+            background=True
+        )
+
+    result = {**to_save, "data_by_interval": data_by_interval,
+              "source_by_interval": {interval: source_by_interval.get(interval) for interval in intervals}}
+    if from_cache:
+        result["from_cache"] = True
+    return result
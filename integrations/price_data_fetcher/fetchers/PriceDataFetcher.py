@@ -1,6 +1,8 @@
 # integrations/price_data_fetcher/fetchers/price_data_fetcher.py
 # version 2.0, aug 2025
 
+import time
+from integrations.exchange_health import get_exchange_health, is_exchange_failure
 from integrations.price_data_fetcher.fetchers.fetch_from_okx import fetch_from_okx
 from integrations.price_data_fetcher.fetchers.fetch_from_kucoin import fetch_from_kucoin
 from integrations.price_data_fetcher.fetchers.fetch_from_binance import fetch_from_binance
@@ -8,7 +10,7 @@ from integrations.price_data_fetcher.fetchers.fetch_from_bybit import fetch_from
 
 class PriceDataFetcher:
 
-    def __init__(self, symbol=None, config=None, order=None):
+    def __init__(self, symbol=None, config=None, order=None, snapshots=None):
 
         if config is None:
             raise ValueError("⚠️ PriceDataFetcher requires a 'config' parameter.")
@@ -17,31 +19,58 @@ class PriceDataFetcher:
         settings = config.get("settings", {})
         self.symbol = symbol if symbol else settings.get("symbol_to_use")
         self.exchanges = order if order else settings.get("exchange_order")
+        # Shared TickerSnapshots of the cycle; without it every exchange gets a single request
+        self.snapshots = snapshots
 
     def fetch(self):
 
-        for exchange in self.exchanges:
+        # Healthiest exchange first; ones cooling down after repeated failures are skipped
+        health = get_exchange_health("price")
+        exchanges = self.exchanges
+        if self.config.get("settings", {}).get("adaptive_exchange_order", True):
+            exchanges = health.order(self.exchanges, self.symbol)
 
+        for exchange in exchanges:
+
+            if self.snapshots is not None:
+                data = self.snapshots.lookup(exchange, self.symbol)
+                if data is not False:
+                    # Served from memory; a symbol missing here falls through to the next exchange
+                    if self._has_values(data):
+                        data['source'] = exchange
+                        return data
+                    continue
+
+            started = time.monotonic()
             try:
                 method = getattr(self, f"fetch_from_{exchange}")
                 data = method()
 
-                if data:
-                    price = data.get("lastPrice", 0)
-                    volume = data.get("volume", 0)
-                    high = data.get("highPrice", 0)
-                    low = data.get("lowPrice", 0)
+                if self._has_values(data):
+                    health.record(exchange, self.symbol, True, time.monotonic() - started)
+                    data['source'] = exchange
+                    return data
 
-                    if any([price, volume, high, low]):
-                        data['source'] = exchange
-                        return data
+                health.record(exchange, self.symbol, False, time.monotonic() - started, symbol_error=True)
 
             except Exception as e:
+                health.record(exchange, self.symbol, False, time.monotonic() - started,
+                              symbol_error=not is_exchange_failure(e))
                 print(f"❌ Error fetching from {exchange}: {e}")
                 continue
 
         return None
 
+    @staticmethod
+    def _has_values(data):
+        if not data:
+            return False
+        price = data.get("lastPrice", 0)
+        volume = data.get("volume", 0)
+        high = data.get("highPrice", 0)
+        low = data.get("lowPrice", 0)
+        return any([price, volume, high, low])
+
     def fetch_from_okx(self):
         return fetch_from_okx(self.symbol, self.config)
 
@@ -2,27 +2,55 @@
 # version 2.0, aug 2025
 
 import requests
+from integrations.http_transport import http_get
+
+def binance_symbol(symbol, config):
+    return symbol.replace("USDC", "USDT")
+
+def parse_binance_ticker(data):
+    price_change_percent = float(data["priceChangePercent"])
+
+    return {
+        "lastPrice": data["lastPrice"],
+        "priceChangePercent": round(price_change_percent, 2),
+        "highPrice": data["highPrice"],
+        "lowPrice": data["lowPrice"],
+        "volume": data["volume"],
+        "turnover": data["quoteVolume"],
+    }
 
 def fetch_from_binance(symbol, config):
 
-    symbol = symbol.replace("USDC", "USDT")
+    symbol = binance_symbol(symbol, config)
     base_url = config["binance"]["base_url"]
     timeout = config["binance"]["timeout"]
     url = f"{base_url}?symbol={symbol}"
 
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, exchange="binance", limits=config["binance"].get("rate_limit"), timeout=timeout)
         response.raise_for_status()
-        data = response.json()
-        price_change_percent = float(data["priceChangePercent"])
-
-        return {
-            "lastPrice": data["lastPrice"],
-            "priceChangePercent": round(price_change_percent, 2),
-            "highPrice": data["highPrice"],
-            "lowPrice": data["lowPrice"],
-            "volume": data["volume"],
-            "turnover": data["quoteVolume"],
-        }
-    except (requests.RequestException, ValueError, KeyError):
+        return parse_binance_ticker(response.json())
+    except (ValueError, KeyError):
+        # Network errors reach the exchange health as they are; see is_exchange_failure
         return None
+
+def fetch_all_from_binance(config):
+    """Every 24h ticker in one request (the same endpoint without a symbol), by Binance symbol."""
+
+    base_url = config["binance"].get("bulk_url", config["binance"]["base_url"])
+    timeout = config["binance"]["timeout"]
+
+    try:
+        response = http_get(base_url, exchange="binance", limits=config["binance"].get("rate_limit"), timeout=timeout)
+        response.raise_for_status()
+        rows = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    tickers = {}
+    for row in rows:
+        try:
+            tickers[row["symbol"]] = parse_binance_ticker(row)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return tickers
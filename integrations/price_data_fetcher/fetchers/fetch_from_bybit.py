@@ -2,33 +2,64 @@
 # version 2.0, aug 2025
 
 import requests
+from integrations.http_transport import http_get
+
+def bybit_symbol(symbol, config):
+    return symbol.replace("-", "")
+
+def parse_bybit_ticker(row):
+    price_change_percent = float(row["price24hPcnt"]) * 100
+
+    return {
+        "lastPrice": row["lastPrice"],
+        "priceChangePercent": round(price_change_percent, 2),
+        "highPrice": row["highPrice24h"],
+        "lowPrice": row["lowPrice24h"],
+        "volume": row["volume24h"],
+        "turnover": row["turnover24h"]
+    }
 
 def fetch_from_bybit(symbol, config):
 
-    symbol = symbol.replace("-", "")
+    symbol = bybit_symbol(symbol, config)
     base_url = config["bybit"]["base_url"]
     timeout = config["bybit"]["timeout"]
     url = f"{base_url}&symbol={symbol}"
 
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, exchange="bybit", limits=config["bybit"].get("rate_limit"), timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
         if data.get("retCode") == 0 and data.get("result") and data["result"].get("list"):
-            row = data["result"]["list"][0]
-            price_change_percent = float(row["price24hPcnt"]) * 100
-
-            return {
-                "lastPrice": row["lastPrice"],
-                "priceChangePercent": round(price_change_percent, 2),
-                "highPrice": row["highPrice24h"],
-                "lowPrice": row["lowPrice24h"],
-                "volume": row["volume24h"],
-                "turnover": row["turnover24h"]
-            }
-
-    except (requests.RequestException, ValueError, KeyError) as e:
+            return parse_bybit_ticker(data["result"]["list"][0])
+
+    except (ValueError, KeyError):
+        # Network errors reach the exchange health as they are; see is_exchange_failure
         pass
 
-    return None
\ No newline at end of file
+    return None
+
+def fetch_all_from_bybit(config):
+    """Every 24h ticker of the category in one request (no symbol parameter), by Bybit symbol."""
+
+    base_url = config["bybit"].get("bulk_url", config["bybit"]["base_url"])
+    timeout = config["bybit"]["timeout"]
+
+    try:
+        response = http_get(base_url, exchange="bybit", limits=config["bybit"].get("rate_limit"), timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if data.get("retCode") != 0 or not data.get("result"):
+        return None
+
+    tickers = {}
+    for row in data["result"].get("list") or []:
+        try:
+            tickers[row["symbol"]] = parse_bybit_ticker(row)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return tickers
@@ -2,8 +2,11 @@
 # version 2.0, aug 2025
 
 import requests
+from integrations.http_transport import http_get
 from typing import Dict, Optional, Any
 
+DEFAULT_BULK_URL = "https://api.kucoin.com/api/v1/market/allTickers"
+
 def format_symbol_for_kucoin(symbol: str, quote_assets: str):
     
     for quote in quote_assets:
@@ -12,32 +15,61 @@ def format_symbol_for_kucoin(symbol: str, quote_assets: str):
             return f"{base}-{quote}"
     return symbol
 
+def kucoin_symbol(symbol, config):
+    return format_symbol_for_kucoin(symbol, config["kucoin"]["quote_assets"])
+
+def parse_kucoin_ticker(ticker):
+    price_change_percent = float(ticker.get("changeRate") or 0) * 100
+
+    return {
+        "lastPrice": ticker.get("last") or 0,
+        "priceChangePercent": round(price_change_percent, 2),
+        "highPrice": ticker.get("high") or 0,
+        "lowPrice": ticker.get("low") or 0,
+        "volume": ticker.get("vol") or 0,
+        "turnover": ticker.get("volValue") or 0,
+    }
+
 def fetch_from_kucoin(symbol, config):
 
-    quote_assets  = config["kucoin"]["quote_assets"]
     base_url  = config["kucoin"]["base_url"]
     timeout  = config["kucoin"]["timeout"]
-    formatted_symbol = format_symbol_for_kucoin(symbol, quote_assets)
+    formatted_symbol = kucoin_symbol(symbol, config)
     url = f"{base_url}?symbol={formatted_symbol}"
 
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, exchange="kucoin", limits=config["kucoin"].get("rate_limit"), timeout=timeout)
         response.raise_for_status()
         data = response.json()
-    except (requests.RequestException, ValueError):
+    except ValueError:
+        # Network errors reach the exchange health as they are; see is_exchange_failure
         return None
 
     if data.get("code") != "200000":
         return None
 
-    ticker = data.get("data", {})
-    price_change_percent = float(ticker.get("changeRate") or 0) * 100
+    return parse_kucoin_ticker(data.get("data", {}))
 
-    return {
-        "lastPrice": ticker.get("last") or 0,
-        "priceChangePercent": round(price_change_percent, 2),
-        "highPrice": ticker.get("high") or 0,
-        "lowPrice": ticker.get("low") or 0,
-        "volume": ticker.get("vol") or 0,
-        "turnover": ticker.get("volValue") or 0,
-    }
\ No newline at end of file
+def fetch_all_from_kucoin(config):
+    """Every 24h ticker in one request (allTickers), by KuCoin symbol (BASE-QUOTE)."""
+
+    base_url = config["kucoin"].get("bulk_url", DEFAULT_BULK_URL)
+    timeout = config["kucoin"]["timeout"]
+
+    try:
+        response = http_get(base_url, exchange="kucoin", limits=config["kucoin"].get("rate_limit"), timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if data.get("code") != "200000":
+        return None
+
+    tickers = {}
+    for ticker in (data.get("data") or {}).get("ticker") or []:
+        try:
+            tickers[ticker["symbol"]] = parse_kucoin_ticker(ticker)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return tickers
@@ -2,6 +2,9 @@
 # version 2.0, aug 2025
 
 import requests
+from integrations.http_transport import http_get
+
+DEFAULT_BULK_URL = "https://www.okx.com/api/v5/market/tickers?instType=SPOT"
 
 def format_symbol_for_okx(symbol: str, quote_assets: str):
 
@@ -11,35 +14,65 @@ def format_symbol_for_okx(symbol: str, quote_assets: str):
             return f"{base}-{quote}"
     return symbol
 
+def okx_symbol(symbol, config):
+    return format_symbol_for_okx(symbol, config["okx"]["quote_assets"])
+
+def parse_okx_ticker(row):
+    last = float(row['last'])
+    open_price = float(row['open24h'])
+    price_change_percent = ((last - open_price) / open_price * 100) if open_price else 0.0
+
+    return {
+        "lastPrice": row['last'],
+        "priceChangePercent": round(price_change_percent, 2),
+        "highPrice": row['high24h'],
+        "lowPrice": row['low24h'],
+        "volume": row['vol24h'],
+        "turnover": row['volCcy24h'],
+    }
+
 def fetch_from_okx(symbol, config):
 
-    quote_assets  = config["okx"]["quote_assets"]
     base_url  = config["okx"]["base_url"]
     timeout  = config["okx"]["timeout"]
-    symbol = format_symbol_for_okx(symbol, quote_assets)
+    symbol = okx_symbol(symbol, config)
 
     url = f"{base_url}?instId={symbol}"
 
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, exchange="okx", limits=config["okx"].get("rate_limit"), timeout=timeout)
         response.raise_for_status()
         data = response.json()
-    except (requests.RequestException, ValueError):
+    except ValueError:
+        # Network errors reach the exchange health as they are; see is_exchange_failure
         return None
 
     if data.get('code') != '0':
         return None
 
     data = data.get('data', [])
-    last = float(data[0]['last'])
-    open_price = float(data[0]['open24h'])
-    price_change_percent = ((last - open_price) / open_price * 100) if open_price else 0.0
+    return parse_okx_ticker(data[0])
 
-    return {
-        "lastPrice": data[0]['last'],
-        "priceChangePercent": round(price_change_percent, 2),
-        "highPrice": data[0]['high24h'],
-        "lowPrice": data[0]['low24h'],
-        "volume": data[0]['vol24h'],
-        "turnover": data[0]['volCcy24h'],
-    }
+def fetch_all_from_okx(config):
+    """Every spot 24h ticker in one request (market/tickers), by OKX instId (BASE-QUOTE)."""
+
+    base_url = config["okx"].get("bulk_url", DEFAULT_BULK_URL)
+    timeout = config["okx"]["timeout"]
+
+    try:
+        response = http_get(base_url, exchange="okx", limits=config["okx"].get("rate_limit"), timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if data.get('code') != '0':
+        return None
+
+    tickers = {}
+    for row in data.get('data') or []:
+        try:
+            tickers[row['instId']] = parse_okx_ticker(row)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return tickers
@@ -0,0 +1,65 @@
+# integrations/price_data_fetcher/fetchers/ticker_snapshots.py
+# version 2.0, aug 2025
+
+import time
+import threading
+from integrations.exchange_health import get_exchange_health
+from integrations.price_data_fetcher.fetchers.fetch_from_okx import fetch_all_from_okx, okx_symbol
+from integrations.price_data_fetcher.fetchers.fetch_from_kucoin import fetch_all_from_kucoin, kucoin_symbol
+from integrations.price_data_fetcher.fetchers.fetch_from_binance import fetch_all_from_binance, binance_symbol
+from integrations.price_data_fetcher.fetchers.fetch_from_bybit import fetch_all_from_bybit, bybit_symbol
+
+# exchange -> (all tickers request, symbol -> key in that snapshot, as the single request formats it)
+SNAPSHOT_FETCHERS = {
+    "okx": (fetch_all_from_okx, okx_symbol),
+    "kucoin": (fetch_all_from_kucoin, kucoin_symbol),
+    "binance": (fetch_all_from_binance, binance_symbol),
+    "bybit": (fetch_all_from_bybit, bybit_symbol),
+}
+
+class TickerSnapshots:
+    """
+    All 24h tickers of an exchange, requested once per instance (one cron cycle) and only
+    when the first symbol needs that exchange, so fallback exchanges cost a request only if
+    some symbol is missing from the ones before them.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def get(self, exchange):
+        """{exchange symbol: ticker} or None when the exchange has no bulk request or it failed."""
+        with self._lock:
+            if exchange not in self._snapshots:
+                self._snapshots[exchange] = self._load(exchange)
+            return self._snapshots[exchange]
+
+    def _load(self, exchange):
+        fetchers = SNAPSHOT_FETCHERS.get(exchange)
+        if fetchers is None:
+            return None
+
+        started = time.monotonic()
+        try:
+            tickers = fetchers[0](self.config)
+        except Exception as e:
+            print(f"❌ Error fetching all tickers from {exchange}: {e}")
+            tickers = None
+        get_exchange_health("price").record(exchange, None, bool(tickers), time.monotonic() - started)
+
+        if tickers:
+            print(f"📦 {len(tickers)} tickers from {exchange} in one request")
+        return tickers or None
+
+    def lookup(self, exchange, symbol):
+        """
+        The symbol's ticker from the exchange snapshot: a new dict, None if the snapshot lacks
+        the symbol, or False when there is no snapshot and the single request must be used.
+        """
+        snapshot = self.get(exchange)
+        if snapshot is None:
+            return False
+        ticker = snapshot.get(SNAPSHOT_FETCHERS[exchange][1](symbol, self.config))
+        return dict(ticker) if ticker else None
@@ -5,6 +5,7 @@ from datetime import datetime, timezone, timedelta
 from utils.get_symbols_to_use import get_symbols_to_use
 from modules.save_and_validate.save_and_validate import save_and_validate
 from integrations.price_data_fetcher.fetchers.PriceDataFetcher import PriceDataFetcher
+from integrations.price_data_fetcher.fetchers.ticker_snapshots import TickerSnapshots
 from integrations.price_data_fetcher.utils import test_single_exchange, config_and_log_loader
 
 def price_data_fetcher():
@@ -25,9 +26,12 @@ def price_data_fetcher():
 
     print("Getting results for symbols:\n")
 
+    # One all-tickers request per exchange for the whole pass instead of one per symbol
+    snapshots = TickerSnapshots(module_config) if module_config.get("settings", {}).get("bulk_tickers", True) else None
+
     for symbol in all_symbols:
 
-        fetcher = PriceDataFetcher(symbol=symbol, config=module_config)
+        fetcher = PriceDataFetcher(symbol=symbol, config=module_config, snapshots=snapshots)
         raw_data = fetcher.fetch()
 
         if not raw_data:
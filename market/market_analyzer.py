@@ -6,12 +6,15 @@
 #
 import pandas as pd
 import numpy as np
-from ta.trend import EMAIndicator, ADXIndicator
-from ta.momentum import RSIIndicator
+from modules.indicator_engine.indicator_engine import get_indicators
+
+# In priority order, as get_market_state checks them
+MARKET_STATES = ("bull", "bear", "bull_consolidation", "bear_consolidation", "neutral_sideways", "volatile", "unknown")
+WINDOW_SIZE = 20
 
 class MarketAnalyzer:
 
-    def __init__(self, df: pd.DataFrame, timeframe: str = "1d", use_volume_filter: bool = True):
+    def __init__(self, df: pd.DataFrame, timeframe: str = "1d", use_volume_filter: bool = True, symbol: str = None):
         """
         df: DataFrame, jossa on sarakkeet ['timestamp', 'open', 'high', 'low', 'close', 'volume']
         """
@@ -21,16 +24,18 @@ class MarketAnalyzer:
             self.df.set_index('timestamp', inplace=True)
         self.timeframe = timeframe
         self.use_volume_filter = use_volume_filter
+        self.symbol = symbol
         self._calculate_indicators()
 
     # Indicator calculation
     def _calculate_indicators(self):
-        self.df['EMA20'] = EMAIndicator(close=self.df['close'], window=20).ema_indicator()
-        self.df['EMA50'] = EMAIndicator(close=self.df['close'], window=50).ema_indicator()
-        self.df['RSI'] = RSIIndicator(close=self.df['close'], window=14).rsi()
-        adx = ADXIndicator(high=self.df['high'], low=self.df['low'], close=self.df['close'], window=14)
-        self.df['ADX'] = adx.adx()
-        self.df['Volume_MA20'] = self.df['volume'].rolling(window=20).mean()
+        # With a symbol, series already computed for the same candles (data preview, signals) are reused
+        indicators = get_indicators(self.df, self.symbol, self.timeframe)
+        self.df['EMA20'] = indicators.ema(window=20)
+        self.df['EMA50'] = indicators.ema(window=50)
+        self.df['RSI'] = indicators.rsi(window=14)
+        self.df['ADX'] = indicators.adx(window=14)
+        self.df['Volume_MA20'] = indicators.sma('volume', window=20)
 
     # Check if bull market
     def is_bull_market(self, i: int = -1) -> bool:
@@ -117,21 +122,62 @@ class MarketAnalyzer:
         else:
             return "unknown"
 
+    # Market state of every row at once, as indexes into MARKET_STATES
+    def get_state_codes(self, window_rules: bool = True) -> np.ndarray:
+        """
+        Same rules as the is_* predicates, evaluated as boolean arrays over the whole frame.
+        window_rules=False leaves out the consolidation and volatile rules, which is what
+        get_market_state() gets for its default i=-1 (a negative i never has a full window).
+        """
+        df = self.df
+        close = df['close'].to_numpy(dtype=float)
+        ema20 = df['EMA20'].to_numpy(dtype=float)
+        ema50 = df['EMA50'].to_numpy(dtype=float)
+        rsi = df['RSI'].to_numpy(dtype=float)
+        adx = df['ADX'].to_numpy(dtype=float)
+        n = len(close)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            volume_ok = np.ones(n, dtype=bool)
+            if self.use_volume_filter:
+                volume_ok = df['volume'].to_numpy(dtype=float) > df['Volume_MA20'].to_numpy(dtype=float)
+
+            bull = (ema20 > ema50) & (adx > 20) & (rsi > 55) & volume_ok
+            bear = (ema20 < ema50) & (adx > 20) & (rsi < 45) & volume_ok
+            sideways = (np.abs(ema20 - ema50) / ema50 < 0.02) & (adx < 30) & (35 < rsi) & (rsi < 65)
+
+            bull_consolidation = np.zeros(n, dtype=bool)
+            bear_consolidation = np.zeros(n, dtype=bool)
+            volatile = np.zeros(n, dtype=bool)
+            if window_rules and n >= WINDOW_SIZE:
+                # Row i sees close[i - 19:i + 1], the same slices the predicates take
+                windows = np.lib.stride_tricks.sliding_window_view(close, WINDOW_SIZE)
+                price_range = np.full(n, np.nan)
+                mean_price = np.full(n, np.nan)
+                price_range[WINDOW_SIZE - 1:] = windows.max(axis=1) - windows.min(axis=1)
+                mean_price[WINDOW_SIZE - 1:] = windows.mean(axis=1)
+
+                in_range = price_range < 0.05 * mean_price
+                bull_consolidation = (close > ema20) & (ema20 > ema50) & (adx > 25) & in_range
+                bear_consolidation = (close < ema20) & (ema20 < ema50) & (adx > 25) & in_range
+                volatile = (price_range / mean_price > 0.07) & (adx > 20)
+
+        conditions = [bull, bear, bull_consolidation, bear_consolidation, sideways, volatile]
+        return np.select(conditions, np.arange(len(conditions)), default=len(conditions))
+
     # Return the market state info
     def get_market_state_with_start_date(self) -> dict:
         """
         Palauttaa nykyisen markkinatilan sekä päivämäärän, jolloin kyseinen tila alkoi.
         """
-        current_state = self.get_market_state()
+        # The current state is get_market_state() with its default i=-1, the history is by position
+        current_code = self.get_state_codes(window_rules=False)[-1]
+        current_state = MARKET_STATES[current_code]
         latest_index = self.df.index[-1]
 
-        for i in range(len(self.df) - 2, -1, -1):
-            past_state = self.get_market_state(i)
-            if past_state != current_state:
-                trend_start_date = self.df.index[i + 1]
-                break
-        else:
-            trend_start_date = self.df.index[0]
+        # The run of the current state ends at the last earlier row in another state
+        changed = np.flatnonzero(self.get_state_codes()[:-1] != current_code)
+        trend_start_date = self.df.index[changed[-1] + 1] if len(changed) else self.df.index[0]
 
         return {
             "state": current_state,
@@ -21,7 +21,7 @@ def get_market_state(symbol: str) -> dict:
         return market_info
 
     # Create MarketAnalyzer
-    analyzer = MarketAnalyzer(df, timeframe="1h")
+    analyzer = MarketAnalyzer(df, timeframe="1h", symbol=symbol)
 
     # Check the Market state
     market_state_data = analyzer.get_market_state_with_start_date()
@@ -6,6 +6,7 @@ from utils.load_configs_and_logs import load_configs_and_logs
 from modules.history_analyzer.utils import get_data_from_logs
 from modules.history_analyzer.analysis_engine import analysis_engine
 from modules.save_and_validate.save_and_validate import save_and_validate
+from modules.history_store.history_store import get_storage_backend, get_store_dir, save_columnar
 from utils.load_latest_entries_per_symbol import load_latest_entries_per_symbol
 
 def history_analyzer(symbols, history_config, data_collection):
@@ -50,6 +51,10 @@ def history_analyzer(symbols, history_config, data_collection):
         schema=log_schema_path,
         verbose=False
     )
+    if get_storage_backend(history_config.get("history_analyzer")) == "both":
+        store_dir = get_store_dir(history_config.get("history_analyzer"), log_path)
+        print(f"\n❇️  Saving new result to {store_dir}\n")
+        save_columnar(all_analysis_data, store_dir)
 
     return all_analysis_data
 
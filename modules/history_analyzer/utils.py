@@ -1,9 +1,13 @@
 # modules/history_analyzer/utils.py
 # version 2.0, aug 2025
 
+from dateutil import parser as date_parser
+from datetime import timedelta
+from utils.get_timestamp import get_timestamp
 from utils.load_latest_entry import load_latest_entry
 from utils.load_configs_and_logs import load_configs_and_logs
 from utils.load_latest_entries_per_symbol import load_latest_entries_per_symbol
+from modules.history_store.history_store import get_storage_backend, get_store_dir, load_columnar, load_latest_columnar_entries, frame_to_entries
 
 def get_data_from_logs(symbols, history_config: dict):
 
@@ -17,6 +21,9 @@ def get_data_from_logs(symbols, history_config: dict):
     log_path = configs_and_logs.get("history_full_log_path")
     log_schema_path = configs_and_logs.get("history_full_log_schema_path")
 
+    if get_storage_backend(config) == "both":
+        return get_data_from_store(symbols, config, log_path, log_schema_path, min_age_minutes, max_age_minutes)
+
     latest_entry = load_latest_entry(
         file_path=log_path,
         limit=1,
@@ -32,4 +39,26 @@ def get_data_from_logs(symbols, history_config: dict):
         max_age_minutes=max_age_minutes,
     )
 
-    return analysis_data, latest_analysis_timestamp, log_path, log_schema_path
\ No newline at end of file
+    return analysis_data, latest_analysis_timestamp, log_path, log_schema_path
+
+def get_data_from_store(symbols, config, log_path, log_schema_path, min_age_minutes, max_age_minutes):
+    """Same as get_data_from_logs, reading the previous analysis from the columnar store."""
+
+    store_dir = get_store_dir(config, log_path)
+    now = date_parser.isoparse(get_timestamp())
+
+    # Newest row of the last day that has data
+    latest = load_columnar(store_dir, columns=["timestamp"], start_time=now - timedelta(days=1))
+    if not len(latest["columns"]["timestamp"]):
+        latest = load_columnar(store_dir, columns=["timestamp"])
+    timestamps = latest["columns"]["timestamp"]
+    latest_analysis_timestamp = frame_to_entries(latest, [len(timestamps) - 1])[0]["timestamp"] if len(timestamps) else None
+
+    analysis_data = load_latest_columnar_entries(
+        store_dir,
+        symbols,
+        start_time=now - timedelta(minutes=max_age_minutes),
+        end_time=now - timedelta(minutes=min_age_minutes),
+    )
+
+    return analysis_data, latest_analysis_timestamp, log_path, log_schema_path
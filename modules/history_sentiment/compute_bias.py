@@ -1,29 +1,19 @@
 # modules/history_sentiment/compute_bias.py
 # version 2.0, aug 2025
 
+import numpy as np
 from dateutil import parser
 from typing import List, Dict, Optional
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from utils.get_timestamp import get_timestamp
+from utils.mmap_jsonl_reader import to_epoch_us
+from modules.history_store.history_store import entries_to_frame, is_frame
 
-def parse_log_entry(entry: Dict) -> Dict:
-
-    ts = entry["timestamp"]
-    if isinstance(ts, str):
-        dt = parser.isoparse(ts)
-    else:
-        dt = ts
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-
-    entry["timestamp"] = dt
-    return entry
-
-def filter_values_by_time(values: List[Dict], since: timedelta) -> List[Dict]:
-    now = parser.isoparse(get_timestamp())
-    cutoff = now - since
-    filtered = [log for log in values if log["timestamp"] >= cutoff]
-    return filtered
+# Columns compute_bias reads; history_sentiment loads only these from the columnar store
+BIAS_NUMERIC_COLUMNS = ["avg_rsi"]
+BIAS_CATEGORY_COLUMNS = ["symbol", "macd_trend", "ema_trend", "bollinger_status"]
+# score_entry reads missing trend keys as "neutral"
+BIAS_DEFAULTS = {"macd_trend": "neutral", "ema_trend": "neutral", "bollinger_status": "neutral"}
 
 def score_entry(entry: Dict, config: Dict) -> float:
     score = 0.0
@@ -68,43 +58,86 @@ def determine_market_state(avg_score: float, config: Dict) -> str:
     else:
         return "neutral"
 
-def compute_bias(values: List[Dict], config: Dict, time_window_hours: float = 24.0) -> Optional[Dict]:
+def _weight_table(weight_map: Dict, labels: List) -> np.ndarray:
+    """Weight per category code; the extra last slot is for code -1 (value None)."""
+    return np.array([weight_map.get(label, 0) for label in labels] + [weight_map.get(None, 0)], dtype=float)
+
+def score_frame(frame: Dict, config: Dict) -> np.ndarray:
+    """Vectorized score_entry over all rows of a frame."""
+    columns, labels = frame["columns"], frame["labels"]
+    weights = config['compute_bias']['weights']
 
-    if isinstance(values, dict):
-        values = list(values.values())
-    values = [parse_log_entry(entry) for entry in values]
+    scores = np.zeros(len(columns["timestamp"]))
+    for column, weight_key in (("macd_trend", "macd"), ("ema_trend", "ema"), ("bollinger_status", "bollinger")):
+        table = _weight_table(weights.get(weight_key, {}), labels[column])
+        scores = scores + table[columns[column]]
+
+    # NaN (missing RSI) fails both comparisons, like the None check in score_entry
+    rsi_cfg = config['compute_bias']['rsi_rules']
+    rsi = columns["avg_rsi"]
+    with np.errstate(invalid="ignore"):
+        overbought = rsi > rsi_cfg.get("overbought_threshold", 70)
+        oversold = ~overbought & (rsi < rsi_cfg.get("oversold_threshold", 30))
+    scores = scores + np.where(overbought, rsi_cfg.get("weight_overbought", 0.5), 0.0)
+    scores = scores + np.where(oversold, rsi_cfg.get("weight_oversold", -0.5), 0.0)
+    return scores
+
+def compute_bias(values, config: Dict, time_window_hours: float = 24.0) -> Optional[Dict]:
+    """
+    Accepts log entries (list or {symbol: entries}) or a frame loaded from the columnar
+    history store; entries are converted to the same arrays, so both go through one
+    vectorized reduction.
+    """
+    if is_frame(values):
+        frame = values
+    else:
+        if isinstance(values, dict):
+            values = list(values.values())
+        frame = entries_to_frame(
+            values,
+            numeric=BIAS_NUMERIC_COLUMNS,
+            categorical=BIAS_CATEGORY_COLUMNS,
+            defaults=BIAS_DEFAULTS
+        )
 
     def aggregate_bias(time_delta: timedelta):
-        filtered = filter_values_by_time(values, time_delta)
-        if not filtered:
+        now = parser.isoparse(get_timestamp())
+        cutoff = to_epoch_us(now - time_delta)
+
+        rows = np.flatnonzero(frame["columns"]["timestamp"] >= cutoff)
+        if not len(rows):
             return None
 
-        symbol_scores, symbol_movements = {}, {}
-        for log in filtered:
-            symbol = log["symbol"]
-            score = score_entry(log, config)
-            symbol_scores.setdefault(symbol, []).append(score)
+        scores = score_frame(frame, config)[rows]
+        symbols = frame["columns"]["symbol"][rows]
 
-        avg_scores = {s: sum(v) / len(v) for s, v in symbol_scores.items()}
-        all_avg = sum(avg_scores.values()) / len(avg_scores)
+        # Per symbol averages, then the average over symbols
+        codes, first_rows, inverse = np.unique(symbols, return_index=True, return_inverse=True)
+        counts = np.bincount(inverse)
+        avg_scores = np.bincount(inverse, weights=scores) / counts
+        # Summed in order of first appearance, like the per-symbol dict it replaces
+        appearance = np.argsort(first_rows, kind="stable")
+        all_avg = sum(avg_scores[appearance].tolist()) / len(codes)
 
         divisor = config['compute_bias']['bias_normalization_divisor']
         bias = max(-1.0, min(1.0, all_avg / divisor))
 
-        for symbol, scores in symbol_scores.items():
-            if len(scores) < 2:
-                continue
-            deltas = [abs(scores[i] - scores[i - 1]) for i in range(1, len(scores))]
-            symbol_movements[symbol] = sum(deltas) / len(deltas)
-
-        volume = sum(symbol_movements.values()) / len(symbol_movements) if symbol_movements else 0.0
+        # Mean absolute change between consecutive scores of the same symbol
+        order = np.argsort(inverse, kind="stable")
+        grouped, grouped_scores = inverse[order], scores[order]
+        same_symbol = grouped[1:] == grouped[:-1]
+        deltas = np.abs(np.diff(grouped_scores))[same_symbol]
+        delta_groups = grouped[1:][same_symbol]
+        movements = np.bincount(delta_groups, weights=deltas, minlength=len(codes)) / np.maximum(counts - 1, 1)
+        movements = movements[appearance][counts[appearance] >= 2].tolist()
+        volume = sum(movements) / len(movements) if movements else 0.0
 
         return {
             "avg_score": all_avg,
             "bias": bias,
             "volume": volume,
-            "coins_counted": len(avg_scores),
-            "entries_counted": len(filtered),
+            "coins_counted": len(codes),
+            "entries_counted": len(rows),
         }
 
     biases = aggregate_bias(timedelta(hours=time_window_hours))
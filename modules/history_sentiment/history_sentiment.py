@@ -7,10 +7,11 @@ from datetime import datetime, timedelta
 from utils.get_timestamp import get_timestamp
 from utils.get_symbols_to_use import get_symbols_to_use
 from utils.load_configs_and_logs import load_configs_and_logs
-from modules.history_sentiment.compute_bias import compute_bias
+from modules.history_sentiment.compute_bias import compute_bias, BIAS_NUMERIC_COLUMNS, BIAS_CATEGORY_COLUMNS, BIAS_DEFAULTS
 from utils.load_entries_in_time_range import load_entries_in_time_range
 from modules.save_and_validate.save_and_validate import save_and_validate
 from modules.history_sentiment.trend_shift import trend_shift_analyzer
+from modules.history_store.history_store import entries_to_frame, is_frame, get_storage_backend, get_store_dir, load_columnar
 
 def sentiment_analyzer(all_symbols, history_config, history_entries, sentiment_entries, sentiment_log_path, sentiment_log_schema_path):
 
@@ -18,10 +19,18 @@ def sentiment_analyzer(all_symbols, history_config, history_entries, sentiment_e
 
     sentiment_config = history_config['history_sentiment']
 
-    if isinstance(history_entries, dict):
-        latest_values = list(chain.from_iterable(history_entries.values()))
-    else:
+    if is_frame(history_entries):
         latest_values = history_entries
+    else:
+        if isinstance(history_entries, dict):
+            history_entries = list(chain.from_iterable(history_entries.values()))
+        # Converted once, every time window below is a reduction over the same arrays
+        latest_values = entries_to_frame(
+            history_entries,
+            numeric=BIAS_NUMERIC_COLUMNS,
+            categorical=BIAS_CATEGORY_COLUMNS,
+            defaults=BIAS_DEFAULTS
+        )
 
     bias_results = {}
     bias_time_windows_hours = sentiment_config['main']['bias_time_windows_hours']
@@ -103,12 +112,23 @@ if __name__ == "__main__":
     oldest_allowed = (now - timedelta(hours=max_age_hours)).isoformat()
     newest_allowed = now.isoformat()
 
-    history_entries = load_entries_in_time_range(
-        file_path=history_log_path,
-        symbols=all_symbols,
-        start_time=oldest_allowed,
-        end_time=newest_allowed
-    )
+    analyzer_config = history_config.get("history_analyzer", {})
+    if get_storage_backend(analyzer_config) == "jsonl":
+        history_entries = load_entries_in_time_range(
+            file_path=history_log_path,
+            symbols=all_symbols,
+            start_time=oldest_allowed,
+            end_time=newest_allowed
+        )
+    else:
+        # Only the columns compute_bias needs, for the days in the window
+        history_entries = load_columnar(
+            get_store_dir(analyzer_config, history_log_path),
+            columns=["timestamp"] + BIAS_NUMERIC_COLUMNS + BIAS_CATEGORY_COLUMNS,
+            start_time=oldest_allowed,
+            end_time=newest_allowed,
+            symbols=all_symbols
+        )
 
     sentiment_log_path = configs_and_logs.get("sentiment_full_log_path")
     sentiment_log_schema_path = configs_and_logs.get("sentiment_full_log_schema_path")
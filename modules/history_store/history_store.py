@@ -0,0 +1,288 @@
+# modules/history_store/history_store.py
+# version 2.0, aug 2025
+
+import os
+import time
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import numpy as np
+from utils.get_timestamp import get_timezone
+from utils.mmap_jsonl_reader import to_epoch_us, MISSING_EPOCH
+
+# Columns of the history_analyzer output. Numbers are kept as float64 (NaN for None),
+# text fields are dictionary-encoded: int32 codes plus a per-file label list (-1 = None).
+NUMERIC_COLUMNS = [
+    "price", "price_change", "price_change_percent",
+    "avg_rsi", "rsi_change", "rsi_change_percent",
+    "avg_ema", "ema_change", "ema_change_percent",
+    "avg_macd", "macd_change", "macd_change_percent",
+]
+CATEGORY_COLUMNS = [
+    "symbol", "ema_trend", "macd_trend", "bollinger_status",
+    "signal_strength", "flag", "turnover_status", "rsi_divergence",
+]
+LABELS_SUFFIX = "__labels"
+MAX_PARTS_PER_DAY = 48
+US_PER_DAY = 86400 * 1_000_000
+
+def get_storage_backend(analyzer_config: Dict) -> str:
+    """
+    'jsonl' (default) or 'both' from history_analyzer.storage.backend. The JSONL log is always
+    written, since the runner, momentum validator, unsupported symbol handler and archiver
+    read it directly; 'both' adds the columnar copy for the analyzer and sentiment reads.
+    'columnar' is accepted as 'both'.
+    """
+    backend = (analyzer_config or {}).get("storage", {}).get("backend", "jsonl")
+    if backend == "columnar":
+        return "both"
+    if backend not in ("jsonl", "both"):
+        print(f"⚠️ Unknown storage backend '{backend}', using jsonl")
+        return "jsonl"
+    return backend
+
+def get_store_dir(analyzer_config: Dict, log_path: str) -> str:
+    """Store directory from history_analyzer.storage.columnar_path, next to the JSONL log by default."""
+    path = (analyzer_config or {}).get("storage", {}).get("columnar_path")
+    if path:
+        return path
+    base, _ = os.path.splitext(log_path)
+    return f"{base}_columns"
+
+def entries_to_frame(entries: List[Dict], numeric=None, categorical=None, defaults: Optional[Dict] = None) -> Dict:
+    """
+    Converts log entries to a frame: {"columns": {name: ndarray}, "labels": {name: [label]}}.
+    Entry order is kept. Missing categorical keys take the value from defaults, if given.
+    """
+    numeric = NUMERIC_COLUMNS if numeric is None else numeric
+    categorical = CATEGORY_COLUMNS if categorical is None else categorical
+    defaults = defaults or {}
+
+    columns = {"timestamp": np.fromiter((to_epoch_us(e.get("timestamp")) for e in entries), dtype=np.int64, count=len(entries))}
+    labels = {}
+
+    for name in numeric:
+        values = np.full(len(entries), np.nan)
+        for i, entry in enumerate(entries):
+            value = entry.get(name)
+            if value is None:
+                continue
+            try:
+                values[i] = float(value)
+            except (TypeError, ValueError):
+                pass
+        columns[name] = values
+
+    for name in categorical:
+        default = defaults.get(name)
+        raw = [entry.get(name, default) for entry in entries]
+        vocab = sorted({value for value in raw if value is not None}, key=str)
+        lookup = {value: code for code, value in enumerate(vocab)}
+        columns[name] = np.fromiter((lookup.get(value, -1) for value in raw), dtype=np.int32, count=len(raw))
+        labels[name] = vocab
+
+    return {"columns": columns, "labels": labels}
+
+def frame_length(frame: Dict) -> int:
+    return len(frame["columns"].get("timestamp", ()))
+
+def is_frame(value) -> bool:
+    return isinstance(value, dict) and "columns" in value and "labels" in value
+
+def _day_name(epoch_us: int) -> str:
+    return datetime.fromtimestamp(epoch_us // 1_000_000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+def _write_part(day_dir: str, arrays: Dict[str, np.ndarray]):
+    os.makedirs(day_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=day_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, os.path.join(day_dir, f"part-{time.time_ns()}.npz"))
+
+def _frame_arrays(frame: Dict, selection) -> Dict[str, np.ndarray]:
+    arrays = {name: values[selection] for name, values in frame["columns"].items()}
+    for name, vocab in frame["labels"].items():
+        arrays[f"{name}{LABELS_SUFFIX}"] = np.array([str(label) for label in vocab], dtype=str)
+    return arrays
+
+def save_columnar(entries: List[Dict], store_dir: str, verbose: bool = False) -> int:
+    """
+    Appends analysis entries to the day partitions of store_dir. Each call writes one new
+    part file per day, so earlier parts are never rewritten; a day with many parts is
+    compacted into one. Returns the number of rows written.
+    """
+    if isinstance(entries, dict):
+        entries = [entries]
+    entries = [e for e in entries if isinstance(e, dict)]
+    if not entries:
+        return 0
+
+    frame = entries_to_frame(entries)
+    timestamps = frame["columns"]["timestamp"]
+    valid = timestamps != MISSING_EPOCH
+    if not np.all(valid):
+        print(f"⚠️ Skipping {int(np.sum(~valid))} entries without a valid timestamp")
+
+    days = np.where(valid, timestamps // US_PER_DAY, -1)
+    written = 0
+    try:
+        for day in np.unique(days[valid]):
+            selection = np.flatnonzero(days == day)
+            day_dir = os.path.join(store_dir, _day_name(int(day) * US_PER_DAY))
+            _write_part(day_dir, _frame_arrays(frame, selection))
+            written += len(selection)
+            if len(_list_parts(day_dir)) > MAX_PARTS_PER_DAY:
+                compact_day(day_dir)
+    except OSError as e:
+        print(f"❌ Writing columnar history to {store_dir} failed: {e}")
+        return written
+
+    if verbose:
+        print(f"✅ Saved {written} rows to {store_dir}")
+    return written
+
+def _list_parts(day_dir: str) -> List[str]:
+    try:
+        return sorted(os.path.join(day_dir, name) for name in os.listdir(day_dir) if name.endswith(".npz"))
+    except FileNotFoundError:
+        return []
+
+def _read_part(path: str, columns: List[str], categorical: List[str]) -> Dict:
+    # npz members are read lazily, so only the requested columns are loaded from disk
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in columns if name in data.files}
+        labels = {
+            name: data[f"{name}{LABELS_SUFFIX}"].tolist()
+            for name in categorical if f"{name}{LABELS_SUFFIX}" in data.files
+        }
+    return {"columns": arrays, "labels": labels}
+
+def _concat_frames(frames: List[Dict], columns: List[str], categorical: List[str]) -> Dict:
+    """Concatenates frames, re-coding categorical columns to one shared label list."""
+    result = {"columns": {}, "labels": {}}
+    for name in columns:
+        if name in categorical:
+            vocab = sorted({label for frame in frames for label in frame["labels"].get(name, [])})
+            lookup = {label: code for code, label in enumerate(vocab)}
+            parts = []
+            for frame in frames:
+                codes = frame["columns"].get(name)
+                if codes is None:
+                    parts.append(np.full(frame_length(frame), -1, dtype=np.int32))
+                    continue
+                remap = np.array([lookup[label] for label in frame["labels"].get(name, [])] + [-1], dtype=np.int32)
+                # Code -1 indexes the trailing -1 of remap
+                parts.append(remap[codes])
+            result["columns"][name] = np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+            result["labels"][name] = vocab
+        else:
+            dtype = np.int64 if name == "timestamp" else np.float64
+            parts = [
+                frame["columns"].get(name, np.full(frame_length(frame), np.nan if dtype is np.float64 else MISSING_EPOCH, dtype=dtype))
+                for frame in frames
+            ]
+            result["columns"][name] = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+    return result
+
+def compact_day(day_dir: str):
+    """Merges all part files of one day into a single part."""
+    parts = _list_parts(day_dir)
+    if len(parts) < 2:
+        return
+    columns = ["timestamp"] + NUMERIC_COLUMNS + CATEGORY_COLUMNS
+    merged = _concat_frames([_read_part(p, columns, CATEGORY_COLUMNS) for p in parts], columns, CATEGORY_COLUMNS)
+    _write_part(day_dir, _frame_arrays(merged, slice(None)))
+    for path in parts:
+        os.remove(path)
+
+def load_columnar(
+    store_dir: str,
+    columns: Optional[List[str]] = None,
+    start_time=None,
+    end_time=None,
+    symbols: Optional[List[str]] = None
+) -> Dict:
+    """
+    Loads the requested columns of the rows within [start_time, end_time] (and symbols),
+    ordered by timestamp. Only the day partitions overlapping the range are opened.
+    """
+    columns = list(columns) if columns else ["timestamp"] + NUMERIC_COLUMNS + CATEGORY_COLUMNS
+    for required in ("timestamp", "symbol"):
+        if required not in columns:
+            columns.append(required)
+    categorical = [name for name in columns if name in CATEGORY_COLUMNS]
+
+    start_epoch = to_epoch_us(start_time) if start_time is not None else None
+    end_epoch = to_epoch_us(end_time) if end_time is not None else None
+    first_day = _day_name(start_epoch) if start_epoch is not None else None
+    last_day = _day_name(end_epoch) if end_epoch is not None else None
+
+    try:
+        day_names = sorted(os.listdir(store_dir))
+    except FileNotFoundError:
+        day_names = []
+
+    frames = []
+    for day in day_names:
+        if (first_day and day < first_day) or (last_day and day > last_day):
+            continue
+        for path in _list_parts(os.path.join(store_dir, day)):
+            try:
+                frames.append(_read_part(path, columns, categorical))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skipping unreadable part {path}: {e}")
+
+    frame = _concat_frames(frames, columns, categorical)
+    timestamps = frame["columns"]["timestamp"]
+
+    mask = timestamps != MISSING_EPOCH
+    if start_epoch is not None:
+        mask &= timestamps >= start_epoch
+    if end_epoch is not None:
+        mask &= timestamps <= end_epoch
+    if symbols is not None:
+        wanted = [frame["labels"]["symbol"].index(s) for s in symbols if s in frame["labels"]["symbol"]]
+        mask &= np.isin(frame["columns"]["symbol"], wanted)
+
+    selection = np.flatnonzero(mask)
+    selection = selection[np.argsort(timestamps[selection], kind="stable")]
+    frame["columns"] = {name: values[selection] for name, values in frame["columns"].items()}
+    return frame
+
+def frame_to_entries(frame: Dict, positions=None) -> List[Dict]:
+    """Rebuilds log-style dicts (numbers as strings, like the JSONL log) for the given rows."""
+    columns, labels = frame["columns"], frame["labels"]
+    positions = range(frame_length(frame)) if positions is None else positions
+    tz = get_timezone()
+    entries = []
+    for i in positions:
+        entry = {}
+        for name, values in columns.items():
+            if name == "timestamp":
+                entry[name] = datetime.fromtimestamp(int(values[i]) / 1_000_000, tz=tz).isoformat()
+            elif name in labels:
+                code = int(values[i])
+                entry[name] = labels[name][code] if code >= 0 else None
+            else:
+                entry[name] = None if np.isnan(values[i]) else str(float(values[i]))
+        entries.append(entry)
+    return entries
+
+def load_latest_columnar_entries(store_dir: str, symbols: List[str], start_time=None, end_time=None) -> Dict[str, Dict]:
+    """Newest row per symbol within the time range, as log-style dicts."""
+    frame = load_columnar(store_dir, start_time=start_time, end_time=end_time, symbols=symbols)
+    codes = frame["columns"]["symbol"]
+    if not len(codes):
+        return {}
+
+    # Rows are in time order, so the last occurrence of each code is the newest row
+    reversed_codes = codes[::-1]
+    unique_codes, first_in_reversed = np.unique(reversed_codes, return_index=True)
+    latest = {int(code): len(codes) - 1 - int(pos) for code, pos in zip(unique_codes, first_in_reversed)}
+
+    labels = frame["labels"]["symbol"]
+    result = {}
+    for symbol in symbols:
+        if symbol in labels and labels.index(symbol) in latest:
+            result[symbol] = frame_to_entries(frame, [latest[labels.index(symbol)]])[0]
+    return result
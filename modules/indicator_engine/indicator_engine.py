@@ -0,0 +1,140 @@
+# modules/indicator_engine/indicator_engine.py
+# version 2.0, aug 2025
+
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from utils.lazy_import import lazy_import
+
+# The ta library is the one reference implementation of every indicator in the bot
+ta_momentum = lazy_import("ta.momentum")
+ta_trend = lazy_import("ta.trend")
+ta_volatility = lazy_import("ta.volatility")
+
+MEMO_MAX_ENTRIES = 4096
+
+_memo: "OrderedDict[tuple, object]" = OrderedDict()
+_memo_lock = threading.Lock()
+_memo_stats = {"hits": 0, "misses": 0}
+
+def _last_time_ns(df: pd.DataFrame) -> Optional[int]:
+    if isinstance(df.index, pd.DatetimeIndex) and len(df.index):
+        return int(df.index[-1].value)
+    if "timestamp" in df.columns and len(df):
+        return int(pd.Timestamp(df["timestamp"].iloc[-1]).value)
+    return None
+
+def _candles_checksum(df: pd.DataFrame) -> int:
+    # Two exchanges can agree on the last candle and still differ further back
+    checksum = 0
+    for column in ("high", "low", "close"):
+        if column in df.columns:
+            checksum = zlib.crc32(np.ascontiguousarray(df[column].to_numpy(dtype=float)).tobytes(), checksum)
+    return checksum
+
+def _frozen(values) -> np.ndarray:
+    # Shared between callers, so nobody may write into it
+    array = np.asarray(values, dtype=float)
+    array.setflags(write=False)
+    return array
+
+class CandleIndicators:
+    """
+    Indicator series of one candle set as read-only float64 numpy arrays aligned to its rows.
+    With symbol and interval given, results are memoized process-wide on
+    (symbol, interval, last candle time, row count, checksum of high/low/close, indicator,
+    parameters), so signals, market state, risk management and logging share one computation
+    per candle set. The checksum keeps apart frames that end alike but differ earlier, such as
+    the same symbol from another exchange or with the still-forming candle updated.
+    """
+
+    def __init__(self, df: pd.DataFrame, symbol: Optional[str] = None, interval: Optional[str] = None):
+        self.df = df
+        self._local: Dict[tuple, object] = {}
+        self._key = None
+        if symbol is not None and interval is not None and len(df):
+            self._key = (symbol, interval, _last_time_ns(df), len(df), _candles_checksum(df))
+
+    def _memoized(self, name: str, params: tuple, compute):
+        local_key = (name, params)
+        if local_key in self._local:
+            return self._local[local_key]
+
+        if self._key is None:
+            value = self._local[local_key] = compute()
+            return value
+
+        key = self._key + local_key
+        with _memo_lock:
+            value = _memo.get(key)
+            if value is not None:
+                _memo.move_to_end(key)
+                _memo_stats["hits"] += 1
+        if value is None:
+            value = compute()
+            with _memo_lock:
+                _memo_stats["misses"] += 1
+                _memo[key] = value
+                while len(_memo) > MEMO_MAX_ENTRIES:
+                    _memo.popitem(last=False)
+        self._local[local_key] = value
+        return value
+
+    def _column(self, name: str) -> pd.Series:
+        return self.df[name].astype(float)
+
+    def rsi(self, window: int = 14) -> np.ndarray:
+        """Wilder RSI."""
+        return self._memoized("rsi", (window,), lambda: _frozen(
+            ta_momentum.RSIIndicator(close=self._column("close"), window=window).rsi()
+        ))
+
+    def ema(self, window: int) -> np.ndarray:
+        return self._memoized("ema", (window,), lambda: _frozen(
+            ta_trend.EMAIndicator(close=self._column("close"), window=window).ema_indicator()
+        ))
+
+    def macd(self, slow: int = 26, fast: int = 12, signal: int = 9) -> Dict[str, np.ndarray]:
+        """{"macd", "signal", "diff"}"""
+        def compute():
+            macd = ta_trend.MACD(close=self._column("close"), window_slow=slow, window_fast=fast, window_sign=signal)
+            return {"macd": _frozen(macd.macd()), "signal": _frozen(macd.macd_signal()), "diff": _frozen(macd.macd_diff())}
+        return self._memoized("macd", (slow, fast, signal), compute)
+
+    def bollinger(self, window: int = 20, dev: int = 2) -> Dict[str, np.ndarray]:
+        """{"mavg", "upper", "lower"}"""
+        def compute():
+            bands = ta_volatility.BollingerBands(close=self._column("close"), window=window, window_dev=dev)
+            return {"mavg": _frozen(bands.bollinger_mavg()), "upper": _frozen(bands.bollinger_hband()), "lower": _frozen(bands.bollinger_lband())}
+        return self._memoized("bollinger", (window, dev), compute)
+
+    def adx(self, window: int = 14) -> np.ndarray:
+        return self._memoized("adx", (window,), lambda: _frozen(
+            ta_trend.ADXIndicator(high=self._column("high"), low=self._column("low"), close=self._column("close"), window=window).adx()
+        ))
+
+    def sma(self, column: str, window: int) -> np.ndarray:
+        """Simple moving average of a column, NaN until window rows are in."""
+        return self._memoized("sma", (column, window), lambda: _frozen(
+            self._column(column).rolling(window=window).mean()
+        ))
+
+def get_indicators(df: pd.DataFrame, symbol: Optional[str] = None, interval: Optional[str] = None) -> CandleIndicators:
+    return CandleIndicators(df, symbol, interval)
+
+def last_value(series: np.ndarray, digits: Optional[int] = None):
+    """Last element as a float (rounded when digits is given), None when missing or NaN."""
+    if series is None or not len(series) or np.isnan(series[-1]):
+        return None
+    return round(series[-1], digits) if digits is not None else series[-1]
+
+def clear_indicator_memo():
+    with _memo_lock:
+        _memo.clear()
+
+def get_indicator_memo_stats():
+    with _memo_lock:
+        return {**_memo_stats, "entries": len(_memo)}
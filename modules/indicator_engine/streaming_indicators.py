@@ -0,0 +1,399 @@
+# modules/indicator_engine/streaming_indicators.py
+# version 2.0, aug 2025
+
+import os
+import sys
+import math
+import json
+import time
+import atexit
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from configs.config import STREAMING_INDICATORS_FILE
+from integrations.multi_interval_ohlcv.candle_store import interval_to_ms
+
+# Same conventions as the ta implementations in indicator_engine.py: NaN while warming up
+# (ADX reports 0 like ta does), Wilder smoothing for RSI and ADX, adjust=False EMAs seeded
+# with the first value, population standard deviation for the bands.
+
+SAVE_INTERVAL_SECONDS = 60.0
+MIN_SEED_CANDLES = 3 * 26   # shorter history leaves the EMA-based values too far from ta to seed from
+NAN = float("nan")
+
+def _float(value) -> Optional[float]:
+    return None if value is None or math.isnan(value) else value
+
+class StreamingEMA:
+    def __init__(self, window: int, count: int = 0, value: Optional[float] = None):
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+        self.count = count
+        self.ema = NAN if value is None else value
+
+    def update(self, x: float) -> float:
+        self.ema = x if self.count == 0 else self.ema + self.alpha * (x - self.ema)
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.ema if self.count >= self.window else NAN
+
+    def to_dict(self) -> dict:
+        return {"window": self.window, "count": self.count, "value": _float(self.ema)}
+
+class StreamingRSI:
+    """Wilder RSI: up and down moves smoothed with alpha 1 / window."""
+
+    def __init__(self, window: int = 14, count: int = 0, prev_close: Optional[float] = None,
+                 up: Optional[float] = None, down: Optional[float] = None):
+        self.window = window
+        self.count = count          # candles seen
+        self.prev_close = prev_close
+        self.up = NAN if up is None else up
+        self.down = NAN if down is None else down
+
+    def update(self, close: float) -> float:
+        # ta counts the first candle as a change of zero, so the smoothing starts there
+        change = 0.0 if self.prev_close is None else close - self.prev_close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self.count == 0:
+            self.up, self.down = gain, loss
+        else:
+            self.up += (gain - self.up) / self.window
+            self.down += (loss - self.down) / self.window
+        self.count += 1
+        self.prev_close = close
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.count < self.window:
+            return NAN
+        if self.down == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.up / self.down)
+
+    def to_dict(self) -> dict:
+        return {"window": self.window, "count": self.count, "prev_close": self.prev_close,
+                "up": _float(self.up), "down": _float(self.down)}
+
+class StreamingMACD:
+    def __init__(self, slow: int = 26, fast: int = 12, signal: int = 9, fast_ema=None, slow_ema=None, signal_ema=None):
+        self.slow, self.fast, self.signal = slow, fast, signal
+        self.fast_ema = StreamingEMA(**fast_ema) if fast_ema else StreamingEMA(fast)
+        self.slow_ema = StreamingEMA(**slow_ema) if slow_ema else StreamingEMA(slow)
+        # Fed only once MACD itself is defined, like ta's ewm skipping the leading NaNs
+        self.signal_ema = StreamingEMA(**signal_ema) if signal_ema else StreamingEMA(signal)
+
+    def update(self, close: float) -> Dict[str, float]:
+        self.fast_ema.update(close)
+        self.slow_ema.update(close)
+        macd = self.fast_ema.value - self.slow_ema.value
+        if not math.isnan(macd):
+            self.signal_ema.update(macd)
+        return self.value
+
+    @property
+    def value(self) -> Dict[str, float]:
+        macd = self.fast_ema.value - self.slow_ema.value
+        signal = self.signal_ema.value
+        return {"macd": macd, "signal": signal, "diff": macd - signal}
+
+    def to_dict(self) -> dict:
+        return {"slow": self.slow, "fast": self.fast, "signal": self.signal, "fast_ema": self.fast_ema.to_dict(),
+                "slow_ema": self.slow_ema.to_dict(), "signal_ema": self.signal_ema.to_dict()}
+
+class StreamingRolling:
+    """Mean and population standard deviation over the last window values (SMA, Bollinger Bands)."""
+
+    def __init__(self, window: int = 20, values=None):
+        self.window = window
+        self.values = deque(values or [], maxlen=window)
+        self._resum()
+
+    def _resum(self):
+        self.total = math.fsum(self.values)
+        self.total_sq = math.fsum(v * v for v in self.values)
+        self._updates = 0
+
+    def update(self, x: float) -> float:
+        if len(self.values) == self.window:
+            dropped = self.values[0]
+            self.total -= dropped
+            self.total_sq -= dropped * dropped
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+        self._updates += 1
+        # Running sums drift; start them over once per full turn of the window
+        if self._updates >= self.window:
+            self._resum()
+        return self.mean
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.window if len(self.values) == self.window else NAN
+
+    @property
+    def std(self) -> float:
+        mean = self.mean
+        return math.sqrt(max(self.total_sq / self.window - mean * mean, 0.0)) if not math.isnan(mean) else NAN
+
+    def bands(self, dev: float = 2) -> Dict[str, float]:
+        mean, std = self.mean, self.std
+        return {"mavg": mean, "upper": mean + dev * std, "lower": mean - dev * std}
+
+    def to_dict(self) -> dict:
+        return {"window": self.window, "values": list(self.values)}
+
+class StreamingADX:
+    """
+    ADX exactly as ta.trend.ADXIndicator builds it: true range and directional movement
+    summed over the first window changes, then Wilder-smoothed; ADX is the mean of the first
+    window DX values and is Wilder-smoothed from there. 0 until 2 * window candles are in.
+    """
+
+    def __init__(self, window: int = 14, count: int = 0, prev=None, tr: float = 0.0, plus: float = 0.0,
+                 minus: float = 0.0, dx_seed: float = 0.0, adx: float = 0.0):
+        self.window = window
+        self.count = count          # candles seen
+        self.prev = prev            # [high, low, close] of the previous candle
+        self.tr, self.plus, self.minus = tr, plus, minus
+        self.dx_seed = dx_seed      # sum of the first window DX values
+        self.adx = adx
+
+    def _dx(self) -> float:
+        if self.tr == 0:
+            return 0.0
+        plus_di, minus_di = 100 * self.plus / self.tr, 100 * self.minus / self.tr
+        total = plus_di + minus_di
+        return 100 * abs((plus_di - minus_di) / total) if total != 0 else 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        index, window = self.count, self.window
+        if self.prev is not None:
+            prev_high, prev_low, prev_close = self.prev
+            true_range = max(high, prev_close) - min(low, prev_close)
+            up, down = high - prev_high, prev_low - low
+            plus = up if up > down and up > 0 else 0.0
+            minus = down if down > up and down > 0 else 0.0
+
+            if index <= window:
+                self.tr += true_range
+                self.plus += plus
+                self.minus += minus
+            else:
+                self.tr += true_range - self.tr / window
+                self.plus += plus - self.plus / window
+                self.minus += minus - self.minus / window
+
+            if index >= window:
+                dx = self._dx()
+                if index < 2 * window - 1:
+                    self.dx_seed += dx
+                elif index == 2 * window - 1:
+                    self.adx = (self.dx_seed + dx) / window
+                else:
+                    self.adx = (self.adx * (window - 1) + dx) / window
+
+        self.prev = [high, low, close]
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.adx if self.count >= 2 * self.window else 0.0
+
+    def to_dict(self) -> dict:
+        return {"window": self.window, "count": self.count, "prev": self.prev, "tr": self.tr, "plus": self.plus,
+                "minus": self.minus, "dx_seed": self.dx_seed, "adx": self.adx}
+
+class StreamingIndicators:
+    """
+    Indicator state of one (symbol, interval), seeded once from history and then advanced
+    one closed candle at a time. The forming candle is only ever applied to a copy, so its
+    values are provisional and the state stays on the last closed candle.
+    """
+
+    def __init__(self, state: Optional[dict] = None):
+        state = state or {}
+        self.last_time = state.get("last_time")     # open time (ns) of the last closed candle
+        self.rsi = StreamingRSI(**state.get("rsi", {}))
+        self.ema = StreamingEMA(**state.get("ema", {"window": 20}))
+        self.macd = StreamingMACD(**state.get("macd", {}))
+        self.bollinger = StreamingRolling(**state.get("bollinger", {"window": 20}))
+        self.adx = StreamingADX(**state.get("adx", {}))
+        self.volume_ma = StreamingRolling(**state.get("volume_ma", {"window": 20}))
+
+    def update(self, candle, open_time: Optional[int] = None):
+        """Applies one closed candle (anything indexable by open/high/low/close/volume)."""
+        high, low, close = float(candle["high"]), float(candle["low"]), float(candle["close"])
+        self.rsi.update(close)
+        self.ema.update(close)
+        self.macd.update(close)
+        self.bollinger.update(close)
+        self.adx.update(high, low, close)
+        self.volume_ma.update(float(candle["volume"]))
+        if open_time is not None:
+            self.last_time = open_time
+        return self
+
+    def provisional(self, candle) -> dict:
+        """Values with the forming candle applied, leaving the state untouched."""
+        return StreamingIndicators(self.to_dict()).update(candle).values()
+
+    def seed(self, df: pd.DataFrame):
+        self.__init__()
+        self._apply(df)
+        return self
+
+    def _apply(self, df: pd.DataFrame):
+        times = df.index.asi8
+        for position, candle in enumerate(df[["high", "low", "close", "volume"]].to_dict("records")):
+            self.update(candle, int(times[position]))
+
+    def sync(self, df: pd.DataFrame, interval: Optional[str] = None, now: Optional[float] = None) -> Optional[dict]:
+        """
+        Brings the state up to the closed candles of df and returns the values for its last
+        row. Only candles after the last one applied cost anything; a df that does not line
+        up with the state (gap, older data, first use) seeds it again from df. Returns None,
+        leaving the state alone, when that seed would have fewer than MIN_SEED_CANDLES.
+        """
+        if df is None or df.empty:
+            return self.values()
+
+        times = df.index.asi8
+        size = interval_to_ms(interval) if interval else None
+        if size:
+            now_ns = int((time.time() if now is None else now) * 1e9)
+            closed = int((times + size * 1_000_000 <= now_ns).sum())
+        else:
+            closed = len(df) - 1
+
+        if closed:
+            last_closed = int(times[closed - 1])
+            if self.last_time is None or last_closed < self.last_time or self.last_time not in times[:closed]:
+                if closed < MIN_SEED_CANDLES:
+                    return None
+                self.seed(df.iloc[:closed])
+            elif last_closed > self.last_time:
+                start = int(times[:closed].searchsorted(self.last_time)) + 1
+                self._apply(df.iloc[start:closed])
+
+        if closed < len(df):
+            return self.provisional(df.iloc[-1])
+        return self.values()
+
+    def values(self) -> dict:
+        macd, bands = self.macd.value, self.bollinger.bands(2)
+        return {
+            "rsi": self.rsi.value,
+            "ema": self.ema.value,
+            "macd": macd["macd"],
+            "macd_signal": macd["signal"],
+            "macd_diff": macd["diff"],
+            "bb_mavg": bands["mavg"],
+            "bb_upper": bands["upper"],
+            "bb_lower": bands["lower"],
+            "adx": self.adx.value,
+            "volume_ma": self.volume_ma.mean,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "last_time": self.last_time,
+            "rsi": self.rsi.to_dict(),
+            "ema": self.ema.to_dict(),
+            "macd": self.macd.to_dict(),
+            "bollinger": self.bollinger.to_dict(),
+            "adx": self.adx.to_dict(),
+            "volume_ma": self.volume_ma.to_dict(),
+        }
+
+class StreamingIndicatorStore:
+    """StreamingIndicators per (symbol, interval), saved to a JSON file so restarts resume from it."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or STREAMING_INDICATORS_FILE
+        self._lock = threading.Lock()
+        self._states: Dict[str, StreamingIndicators] = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._load()
+
+    @staticmethod
+    def _key(symbol: str, interval: str) -> str:
+        return f"{symbol}:{interval}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, state in (data if isinstance(data, dict) else {}).items():
+            try:
+                self._states[key] = StreamingIndicators(state)
+            except (TypeError, ValueError, AttributeError):
+                continue
+
+    def get(self, symbol: str, interval: str) -> StreamingIndicators:
+        with self._lock:
+            key = self._key(symbol, interval)
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = StreamingIndicators()
+            return state
+
+    def sync(self, symbol: str, interval: str, df: pd.DataFrame, now: Optional[float] = None) -> Optional[dict]:
+        state = self.get(symbol, interval)
+        with self._lock:
+            before = state.last_time
+            values = state.sync(df, interval, now)
+            if state.last_time != before:
+                self._dirty = True
+            due = self._dirty and time.monotonic() - self._saved_at >= SAVE_INTERVAL_SECONDS
+        if due:
+            self.save()
+        return values
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {key: state.to_dict() for key, state in self._states.items()}
+            self._dirty = False
+            self._saved_at = time.monotonic()
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save indicator state to {self.path}: {e}")
+
+_store: Optional[StreamingIndicatorStore] = None
+_store_lock = threading.Lock()
+
+def get_streaming_store() -> StreamingIndicatorStore:
+    """Shared store of the process; saved on exit."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = StreamingIndicatorStore()
+        return _store
+
+def save_streaming_store():
+    if _store is not None:
+        _store.save()
+
+atexit.register(save_streaming_store)
@@ -0,0 +1,41 @@
+# modules/load_and_validate/config_registry.py
+# version 2.0, aug 2025
+
+import os
+import threading
+from modules.load_and_validate.load_and_validate import load_and_validate, default_schema_path
+
+_config_cache = {}
+_config_lock = threading.Lock()
+
+def _file_version(path):
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError):
+        return None
+
+def load_config_cached(file_path="config.json", schema_path=None):
+    """
+    Same result as load_and_validate(), but each config is read and validated once per
+    process and reloaded only when the config or its schema file changes (mtime/size).
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    key = (os.path.abspath(file_path), os.path.abspath(schema_path) if schema_path else None)
+    version = (_file_version(file_path), _file_version(schema_path or default_schema_path))
+
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = load_and_validate(file_path=file_path, schema_path=schema_path)
+
+    # Failed loads are not cached so the error is reported again on the next call
+    if data is not None and version[0] is not None:
+        with _config_lock:
+            _config_cache[key] = (version, data)
+    return data
+
+def clear_config_cache():
+    with _config_lock:
+        _config_cache.clear()
@@ -23,7 +23,7 @@ def load_and_validate(file_path="config.json", schema_path=None):
         if not isinstance(schema, (dict, bool)):
             raise TypeError(f"❌ Invalid schema type: {type(schema)}. Expected dict or bool.")
 
-        validate_data(data, schema, is_jsonl=is_jsonl)
+        validate_data(data, schema, is_jsonl=is_jsonl, schema_path=schema_path)
         return data
 
     except (FileNotFoundError, ValueError, json.JSONDecodeError, ValidationError) as e:
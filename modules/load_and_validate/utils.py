@@ -4,6 +4,9 @@
 import os
 import json
 from jsonschema import validate, ValidationError
+from modules.schema_registry.schema_registry import get_validator, load_schema_cached
+
+default_schema_path = os.path.join(os.path.dirname(__file__), "default_schema.json")
 
 def read_file(path):
     if not os.path.exists(path):
@@ -31,25 +34,17 @@ def load_schema(schema_path=None):
     if schema_path is None:
         schema_path = default_schema_path
 
-    if not os.path.exists(schema_path):
-        raise FileNotFoundError(
-            f"❌ Schema file not found at: {schema_path}. "
-            f"Provide schema explicitly or ensure default exists."
-        )
-
-    with open(schema_path, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"❌ Schema JSON parsing failed: {str(e)}", f.read(), e.pos)
+    # Parsed once per file version; see modules/schema_registry
+    return load_schema_cached(schema_path)
 
 
-def validate_data(data, schema, is_jsonl=False):
+def validate_data(data, schema, is_jsonl=False, schema_path=None):
+    validator = get_validator(schema, schema_path=schema_path)
     if is_jsonl:
         for i, item in enumerate(data):
             try:
-                validate(instance=item, schema=schema)
+                validator.validate(item)
             except ValidationError as e:
                 raise ValidationError(f"❌ JSONL validation failed on line {i + 1}:\n→ {e.message}")
     else:
-        validate(instance=data, schema=schema)
\ No newline at end of file
+        validator.validate(data)
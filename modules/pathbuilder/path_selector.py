@@ -3,7 +3,7 @@
 # Use with prints:    configs_path, logs_path, schemas_path = path_selector()
 # Use without prints: configs_path, logs_path, schemas_path = path_selector(verbose=False)
 
-from modules.load_and_validate.load_and_validate import load_and_validate
+from modules.load_and_validate.config_registry import load_config_cached
 
 def path_selector(verbose=True, mid_folder=None):
 
@@ -16,7 +16,7 @@ def path_selector(verbose=True, mid_folder=None):
         raise ValueError(f"Invalid mid_folder: '{mid_folder}'. Must be one of {allowed_mid_folders}")
 
     # Load config
-    result = load_and_validate()
+    result = load_config_cached()
     testing = result["testing"]
 
     if testing:
@@ -3,9 +3,15 @@
 
 import os
 import json
+import zlib
 from pathlib import Path
 from modules.save_and_validate.truncate_file_if_too_large import truncate_file_if_too_large
 
+HEAD_CHECK_BYTES = 4096
+
+# path -> validated high-water mark of a JSONL file in this process
+_validated_marks = {}
+
 def check_and_create_path(path, verbose=True):
     directory = os.path.dirname(path)
     if directory and not os.path.exists(directory):
@@ -40,21 +46,75 @@ def is_valid_json(path):
         print(f"Error reading JSON: {e}")
         return False
 
-def is_valid_jsonl(path):
+def is_valid_jsonl(path, start_offset=0):
+    i = 0
     try:
-        with open(path, 'r', encoding='utf-8') as f:
+        with open(path, 'rb') as f:
+            f.seek(start_offset)
             for i, line in enumerate(f, start=1):
-                if line.strip() == "":
+                if line.strip() == b"":
                     continue
-                json.loads(line)
+                json.loads(line.decode('utf-8'))
         return True
     except json.JSONDecodeError as e:
-        print(f"JSONL error on line {i}: {e}")
+        print(f"JSONL error on line {i} (from byte {start_offset}): {e}")
         return False
     except Exception as e:
         print(f"Error in JSONL file: {e}")
         return False
 
+def _head_crc(path, length):
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read(min(length, HEAD_CHECK_BYTES)))
+
+def _last_complete_line_end(path, size):
+    """Returns the byte offset just after the last newline, so a half-written last line is re-checked later."""
+    position = size
+    with open(path, 'rb') as f:
+        while position > 0:
+            read_size = min(HEAD_CHECK_BYTES, position)
+            position -= read_size
+            f.seek(position)
+            newline = f.read(read_size).rfind(b"\n")
+            if newline >= 0:
+                return position + newline + 1
+    return 0
+
+def get_validated_offset(path):
+    """
+    Returns the byte offset up to which the JSONL file is already known to be valid,
+    or 0 if the file shrank or was rewritten since the last check.
+    """
+    mark = _validated_marks.get(path)
+    if mark is None:
+        return 0
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0
+
+    if stat.st_ino != mark["inode"] or stat.st_size < mark["offset"]:
+        return 0
+    if stat.st_size == mark["size"] and stat.st_mtime_ns != mark["mtime_ns"]:
+        return 0
+    if mark["offset"] > 0 and _head_crc(path, mark["offset"]) != mark["head_crc"]:
+        return 0
+    return mark["offset"]
+
+def mark_validated(path):
+    try:
+        stat = os.stat(path)
+        offset = _last_complete_line_end(path, stat.st_size)
+        _validated_marks[path] = {
+            "inode": stat.st_ino,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "offset": offset,
+            "head_crc": _head_crc(path, offset)
+        }
+    except OSError:
+        _validated_marks.pop(path, None)
+
 def file_checker(path, verbose=True):
 
     if verbose:
@@ -65,20 +125,26 @@ def file_checker(path, verbose=True):
 
     truncate_file_if_too_large(Path(path))
 
-    if path.endswith('.jsonl'):
-        valid = is_valid_jsonl(path)
+    is_jsonl = path.endswith('.jsonl')
+    if is_jsonl:
+        # Only the bytes appended since the last successful check are parsed
+        valid = is_valid_jsonl(path, start_offset=get_validated_offset(path))
     else:
         valid = is_valid_json(path)
 
     if not valid:
+        _validated_marks.pop(path, None)
         try:
             with open(path, 'w', encoding='utf-8') as f:
                 f.write('')
-            print(f"⚠️ Existing file is invalid → will be overwritten:\n→ {e}")
+            print(f"⚠️ Existing file is invalid → will be overwritten:\n→ {path}")
         except Exception as e:
             print(f"❌ Error while clearing file: {e}")
         return False
 
+    if is_jsonl:
+        mark_validated(path)
+
     if verbose:
         print(f"✅ Existing file is valid: {path}")
     return True
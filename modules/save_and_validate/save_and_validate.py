@@ -4,11 +4,20 @@
 import os
 import json
 from pathlib import Path
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 from modules.save_and_validate.file_checker import file_checker
+from modules.schema_registry.schema_registry import get_validator, load_schema_cached
+from utils.jsonl_symbol_index import refresh_symbol_index
+from utils.log_writer import enqueue_write, flush_pending_writes, append_lines
 from utils.load_configs_and_logs import load_configs_and_logs
 
-def save_and_validate(data=None, path: str = None, schema: dict = None, verbose=True, mode=None):
+def _write_jsonl_batch(path, chunks):
+    # Runs in the background writer thread: same checks as a direct save, one write per batch
+    file_checker(path, verbose=False)
+    append_lines(path, chunks)
+    refresh_symbol_index(path)
+
+def save_and_validate(data=None, path: str = None, schema: dict = None, verbose=True, mode=None, background=False):
     if data is None:
         raise ValueError("❌ Data argument is missing.")
     if path is None:
@@ -16,36 +25,56 @@ def save_and_validate(data=None, path: str = None, schema: dict = None, verbose=
     if schema is None:
         raise ValueError("❌ Schema argument is missing.")
 
+    schema_path = None
     if isinstance(schema, str) and os.path.isfile(schema):
-        with open(schema, "r", encoding="utf-8") as f:
-            try:
-                schema = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"❌ Failed to parse schema at {schema}: {e}")
-            
-            if not isinstance(schema, (dict, bool)):
-                raise TypeError(f"❌ Invalid schema type: {type(schema)}. Expected dict or bool.")
+        schema_path = schema
+        try:
+            schema = load_schema_cached(schema_path)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"❌ Failed to parse schema at {schema_path}: {e}")
 
-    file_checker(path, verbose=verbose)
+        if not isinstance(schema, (dict, bool)):
+            raise TypeError(f"❌ Invalid schema type: {type(schema)}. Expected dict or bool.")
 
     is_jsonl = path.endswith(".jsonl")
+
+    # Validators are built once per schema and reused across calls
+    validator = get_validator(schema, schema_path=schema_path, items=is_jsonl)
+
+    # Write-behind: validate now, let the log writer thread append the lines
+    if background and is_jsonl and mode != "overwrite":
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            validator.validate(item)
+        enqueue_write(path, "".join(json.dumps(item) + "\n" for item in items), _write_jsonl_batch)
+        if verbose:
+            print(f"📦 Data queued for: {path}")
+        return
+
+    # Keep ordering with anything still queued for the same file
+    flush_pending_writes(path)
+
+    file_checker(path, verbose=verbose)
+
     file_mode = "w" if mode == "overwrite" else ("a" if is_jsonl else "w")
 
     with open(path, file_mode, encoding="utf-8") as f:
         if is_jsonl:
-            item_schema = schema.get("items") if isinstance(schema, dict) and "items" in schema else schema
-
             if isinstance(data, list):
                 for item in data:
-                    validate(instance=item, schema=item_schema)
+                    validator.validate(item)
                     f.write(json.dumps(item) + "\n")
             else:
-                validate(instance=data, schema=item_schema)
+                validator.validate(data)
                 f.write(json.dumps(data) + "\n")
         else:
-            validate(instance=data, schema=schema)
+            validator.validate(data)
             json.dump(data, f, indent=2)
 
+    # Appends only cost the new lines; an overwritten log is indexed again
+    if is_jsonl:
+        refresh_symbol_index(path)
+
     if verbose:
         print(f"📦 Data saved to: {path}")
 
@@ -0,0 +1,188 @@
+# modules/schema_registry/schema_registry.py
+# version 2.0, aug 2025
+
+import os
+import json
+import threading
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+# Keywords that carry no validation meaning for the fast path
+ANNOTATION_KEYWORDS = {"$schema", "$id", "title", "description", "$comment", "examples", "default"}
+
+_schema_cache = {}
+_validator_cache = {}
+_registry_lock = threading.Lock()
+
+def load_schema_cached(schema_path):
+    """Loads a schema file once per (path, mtime, size); the file is re-read only after it changes."""
+    full_path = os.path.abspath(schema_path)
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(
+            f"❌ Schema file not found at: {schema_path}. "
+            f"Provide schema explicitly or ensure default exists."
+        )
+
+    stat = os.stat(full_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _schema_cache.get(full_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(full_path, "r", encoding="utf-8") as f:
+        try:
+            schema = json.load(f)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"❌ Schema JSON parsing failed: {str(e)}", "", e.pos)
+
+    with _registry_lock:
+        _schema_cache[full_path] = (key, schema)
+    return schema
+
+def _type_check(type_name):
+    if type_name == "object":
+        return lambda v: isinstance(v, dict)
+    if type_name == "array":
+        return lambda v: isinstance(v, list)
+    if type_name == "string":
+        return lambda v: isinstance(v, str)
+    if type_name == "number":
+        return lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    if type_name == "integer":
+        # Floats such as 1.0 are left to the full validator (draft dependent)
+        return lambda v: isinstance(v, int) and not isinstance(v, bool)
+    if type_name == "boolean":
+        return lambda v: isinstance(v, bool)
+    if type_name == "null":
+        return lambda v: v is None
+    return None
+
+def compile_schema(schema):
+    """
+    Compiles the simple object/array/number schemas used by our logs into a plain Python
+    predicate. The predicate returns True only when the instance is certainly valid; any
+    other answer falls through to the full jsonschema validator, so errors stay identical.
+    Returns None if the schema uses keywords the fast path does not understand.
+    """
+    if schema is True or schema == {}:
+        return lambda v: True
+    if not isinstance(schema, dict):
+        return None
+
+    supported = {"type", "properties", "required", "items", "additionalProperties"} | ANNOTATION_KEYWORDS
+    if any(key not in supported for key in schema):
+        return None
+
+    checks = []
+
+    if "type" in schema:
+        type_names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [_type_check(name) for name in type_names]
+        if any(check is None for check in type_checks):
+            return None
+        checks.append(lambda v, tc=type_checks: any(check(v) for check in tc))
+
+    if "required" in schema:
+        if not isinstance(schema["required"], list):
+            return None
+        required = list(schema["required"])
+        checks.append(lambda v: not isinstance(v, dict) or all(key in v for key in required))
+
+    properties = {}
+    if "properties" in schema:
+        if not isinstance(schema["properties"], dict):
+            return None
+        for name, subschema in schema["properties"].items():
+            compiled = compile_schema(subschema)
+            if compiled is None:
+                return None
+            properties[name] = compiled
+
+        def check_properties(v):
+            if not isinstance(v, dict):
+                return True
+            for name, compiled in properties.items():
+                if name in v and not compiled(v[name]):
+                    return False
+            return True
+        checks.append(check_properties)
+
+    if "additionalProperties" in schema:
+        additional = schema["additionalProperties"]
+        compiled_additional = compile_schema(additional) if additional is not False else None
+        if additional is not False and compiled_additional is None:
+            return None
+
+        def check_additional(v):
+            if not isinstance(v, dict):
+                return True
+            for name, value in v.items():
+                if name in properties:
+                    continue
+                if compiled_additional is None or not compiled_additional(value):
+                    return False
+            return True
+        checks.append(check_additional)
+
+    if "items" in schema:
+        if not isinstance(schema["items"], (dict, bool)):
+            return None
+        compiled_items = compile_schema(schema["items"])
+        if compiled_items is None:
+            return None
+        checks.append(lambda v: not isinstance(v, list) or all(compiled_items(item) for item in v))
+
+    return lambda v: all(check(v) for check in checks)
+
+class CachedValidator:
+    """Validator built once per schema; validate() raises the same error as jsonschema.validate()."""
+
+    def __init__(self, schema):
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.schema = schema
+        self.validator = validator_cls(schema)
+        self.fast_check = compile_schema(schema)
+
+    def validate(self, instance):
+        if self.fast_check is not None and self.fast_check(instance):
+            return
+        error = best_match(self.validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def is_valid(self, instance):
+        try:
+            self.validate(instance)
+            return True
+        except ValidationError:
+            return False
+
+def get_validator(schema=None, schema_path=None, items=False):
+    """
+    Returns a cached validator. Schema files are keyed by path and mtime, inline schemas
+    by their canonical JSON text, so repeated writes never rebuild the validator.
+    With items=True the validator is built for schema["items"] when the schema has one
+    (the per-line schema of a JSONL log).
+    """
+    if schema_path is not None:
+        schema = load_schema_cached(schema_path)
+        stat = os.stat(schema_path)
+        key = ("path", os.path.abspath(schema_path), stat.st_mtime_ns, stat.st_size, items)
+    else:
+        key = ("inline", json.dumps(schema, sort_keys=True, default=str), items)
+
+    validator = _validator_cache.get(key)
+    if validator is None:
+        if items and isinstance(schema, dict) and "items" in schema:
+            schema = schema["items"]
+        validator = CachedValidator(schema)
+        with _registry_lock:
+            _validator_cache[key] = validator
+    return validator
+
+def clear_schema_cache():
+    with _registry_lock:
+        _schema_cache.clear()
+        _validator_cache.clear()
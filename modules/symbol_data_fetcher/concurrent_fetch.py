@@ -0,0 +1,67 @@
+# modules/symbol_data_fetcher/concurrent_fetch.py
+# version 2.0, aug 2025
+
+import time
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from modules.save_and_validate.save_and_validate import save_and_validate
+from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback, get_paths as get_ohlcv_paths
+
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_LOG_BATCH_SIZE = 50
+
+def _log_entry(result: dict) -> dict:
+    return {key: value for key, value in result.items() if key not in ("data_by_interval", "from_cache")}
+
+def _fetch_one(symbol, intervals, limit, log_path):
+    print(f"➡️  Fetching {symbol}")
+    try:
+        return fetch_ohlcv_fallback(symbol=symbol, intervals=intervals, limit=limit, log_path=log_path, save=False)
+    except Exception as e:
+        print(f"❌ Fetch failed for {symbol}: {e}")
+        return None
+
+def fetch_symbols_concurrently(
+    symbols: List[str],
+    intervals: List[str],
+    limit: int,
+    log_path: str,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+    batch_size: int = DEFAULT_LOG_BATCH_SIZE,
+    schema_path: Optional[str] = None
+) -> Dict[str, Optional[dict]]:
+    """
+    Fetches OHLCV data for many symbols on a thread pool. Request rates are capped per
+    exchange inside the fetchers, so the pool size only bounds the requests in flight.
+    Log entries are appended in batches and always in the order of symbols, whatever
+    order the fetches finish in. Returns {symbol: summary entry or None}; the candle
+    frames are dropped so a full scan does not keep every DataFrame in memory.
+    """
+    schema_path = schema_path or get_ohlcv_paths()["full_log_schema_path"]
+    started = time.monotonic()
+    results: Dict[str, Optional[dict]] = {}
+    pending_entries = []
+
+    def write_pending():
+        if pending_entries:
+            save_and_validate(data=list(pending_entries), path=log_path, schema=schema_path, verbose=False)
+            pending_entries.clear()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="ohlcv-fetch") as pool:
+        futures = [pool.submit(_fetch_one, symbol, intervals, limit, log_path) for symbol in symbols]
+
+        # Consumed in submission order: a finished fetch waits for the ones before it
+        for i, symbol in enumerate(symbols):
+            result = futures[i].result()
+            futures[i] = None
+            results[symbol] = _log_entry(result) if result else None
+            if result and not result.get("from_cache"):
+                pending_entries.append(results[symbol])
+            if len(pending_entries) >= batch_size:
+                write_pending()
+
+    write_pending()
+
+    fetched = sum(1 for result in results.values() if result)
+    print(f"\n✅ Fetched {fetched}/{len(symbols)} symbols in {time.monotonic() - started:.1f}s")
+    return results
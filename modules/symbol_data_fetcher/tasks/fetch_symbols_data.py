@@ -6,6 +6,7 @@ from utils.get_timestamp import get_timestamp
 from utils.get_symbols_to_use import get_symbols_to_use
 from utils.load_configs_and_logs import load_configs_and_logs
 from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
+from modules.symbol_data_fetcher.concurrent_fetch import fetch_symbols_concurrently, DEFAULT_FETCH_WORKERS
 
 def run_fetch_symbols_data(general_config, module_config, module_log_path, module_schema_path, ohlcv_log_path, ohlcv_schema_path):
 
@@ -20,6 +21,19 @@ def run_fetch_symbols_data(general_config, module_config, module_log_path, modul
         print(f"\n{message}")
 
     print(f"\n🧮 Total unique symbols to process: {len(all_symbols)}\n")
+
+    max_workers = module_config.get("fetch_workers", DEFAULT_FETCH_WORKERS)
+    if max_workers > 1:
+        fetch_symbols_concurrently(
+            sorted(all_symbols),
+            intervals=module_config["intervals"],
+            limit=module_config["ohlcv_fetch_limit"],
+            log_path=str(ohlcv_log_path),
+            max_workers=max_workers,
+            schema_path=ohlcv_schema_path
+        )
+        return
+
     for symbol in sorted(all_symbols):
         print(f"➡️  Fetching {symbol}")
         fetch_ohlcv_fallback(
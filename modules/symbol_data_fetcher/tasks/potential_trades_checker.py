@@ -13,6 +13,7 @@ from modules.load_and_validate.load_and_validate import load_and_validate
 from modules.symbol_data_fetcher.analysis_summary import analyze_all_symbols, prepare_analysis_results
 from utils.load_latest_entries_per_symbol import load_latest_entries_per_symbol
 from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
+from modules.symbol_data_fetcher.concurrent_fetch import fetch_symbols_concurrently, DEFAULT_FETCH_WORKERS
 from utils.empty_the_file import empty_the_file
 
 def print_and_save_recommendations(latest_entries, module_config, module_log_path, module_schema_path):
@@ -131,6 +132,9 @@ def run_potential_trades_checker(general_config, module_config, logs_path, modul
 
     latest_entries = load_latest_entries_per_symbol(symbols_to_process, temporary_path, max_age_minutes=module_config["ohlcv_max_age_minutes"])
 
+    max_workers = module_config.get("fetch_workers", DEFAULT_FETCH_WORKERS)
+    symbols_to_fetch = []
+
     for symbol in symbols_to_process:
 
         print(f"\n🔁 Checking symbol: {symbol}")
@@ -138,6 +142,9 @@ def run_potential_trades_checker(general_config, module_config, logs_path, modul
         entry = latest_entries.get(symbol)
 
         if needs_update(symbol, entry, max_age_minutes=module_config["ohlcv_max_age_minutes"]):
+            if max_workers > 1:
+                symbols_to_fetch.append(symbol)
+                continue
             print(f"🚀 Fetching new OHLCV data: {symbol}")
             fetch_ohlcv_fallback(
                 symbol=symbol,
@@ -151,6 +158,16 @@ def run_potential_trades_checker(general_config, module_config, logs_path, modul
             age_str = f"{hours}h {minutes}min" if hours else f"{minutes}min"
             print(f"✅ Fresh data already exists (less than {age_str} old): {symbol}")
 
+    if symbols_to_fetch:
+        print(f"\n🚀 Fetching new OHLCV data for {len(symbols_to_fetch)} symbols")
+        fetch_symbols_concurrently(
+            symbols_to_fetch,
+            intervals=module_config["intervals"],
+            limit=module_config["ohlcv_fetch_limit"],
+            log_path=str(temporary_path),
+            max_workers=max_workers
+        )
+
     latest_entries = load_latest_entries_per_symbol(symbols_to_process, temporary_path, max_age_minutes=module_config["ohlcv_max_age_minutes"])
 
     save_result = print_and_save_recommendations(latest_entries, module_config, module_log_path, module_schema_path)
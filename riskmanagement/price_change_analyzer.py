@@ -1,5 +1,6 @@
 # riskmanagement/price_change_analyzer.py
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import pytz
@@ -26,8 +27,9 @@ def check_price_change_risk(symbol: str, signal: str, df: pd.DataFrame) -> tuple
     else:
         now = datetime.now(pytz.timezone(TIMEZONE.zone))
 
-    # Calculate price changes
-    price_changes = calculate_price_changes(symbol, now)
+    # Calculate price changes; the caller's frame is reused when it reaches back far enough
+    df_5m = df if covers_price_change_timeframes(df, now) else None
+    price_changes = calculate_price_changes(symbol, now, df_5m=df_5m)
     if should_block_signal(signal, price_changes):
         return "none", price_changes
 
@@ -77,68 +79,107 @@ def should_block_signal(signal: str, price_changes: dict) -> bool:
 
     return False
 
-def calculate_price_changes(symbol: str, current_time: datetime) -> dict:
-    from configs.config import TIMEZONE
-    import pytz
-
-    # 🕒 Ensure current_time is in UTC
-    if current_time.tzinfo is None:
-        current_time = pytz.timezone(TIMEZONE.zone).localize(current_time)
-    current_time = current_time.astimezone(pytz.UTC)
+PRICE_CHANGE_TIMEFRAMES = {
+    "24h": timedelta(hours=24),
+    "18h": timedelta(hours=18),
+    "12h": timedelta(hours=12),
+    "6h": timedelta(hours=6),
+    "4h": timedelta(hours=4),
+    "3h": timedelta(hours=3),
+    "2h": timedelta(hours=2),
+    "1h": timedelta(hours=1),
+    "30min": timedelta(hours=0.5)
+}
+# A past price counts only if a candle opened within this distance of the target time
+PRICE_POINT_TOLERANCE = timedelta(minutes=10)
+# 5m candles fetched when no frame is given: 25h, the longest timeframe plus margin
+PRICE_CHANGE_CANDLES = 300
+
+def _candle_times(df: pd.DataFrame) -> pd.DatetimeIndex:
+    times = pd.DatetimeIndex(df["timestamp"] if "timestamp" in df.columns else df.index)
+    return times.tz_localize(pytz.UTC) if times.tz is None else times  # OHLCV data is UTC
+
+def covers_price_change_timeframes(df: pd.DataFrame, current_time: datetime) -> bool:
+    """True when df has a 5m candle old enough for the longest timeframe at current_time."""
+    if df is None or df.empty or not ("timestamp" in df.columns or isinstance(df.index, pd.DatetimeIndex)):
+        return False
+    oldest_needed = pd.Timestamp(current_time) - max(PRICE_CHANGE_TIMEFRAMES.values()) + PRICE_POINT_TOLERANCE
+    return _candle_times(df).min() <= oldest_needed
 
-    result = fetch_ohlcv_fallback(symbol, intervals=["5m"], limit=300)
-    ohlcv_data = result.get("data_by_interval", {}) if result else {}
+def _as_utc_ns(times, naive_zone) -> np.ndarray:
+    if isinstance(times, pd.DatetimeIndex):
+        return (times.tz_localize(naive_zone) if times.tz is None else times).asi8
+    stamps = [pd.Timestamp(t) for t in times]
+    return np.array([(t.tz_localize(naive_zone) if t.tzinfo is None else t).value for t in stamps], dtype=np.int64)
 
-    if not ohlcv_data or "5m" not in ohlcv_data or ohlcv_data["5m"].empty:
-        print(f"⚠️ No OHLCV data available for symbol {symbol}")
-        return {}
-
-    df = ohlcv_data["5m"].copy().reset_index()
-    df.rename(columns={"timestamp": "timestamp", "close": "price"}, inplace=True)
-    df = df[["timestamp", "price"]]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-    if df['timestamp'].dt.tz is None:
-        df['timestamp'] = df['timestamp'].dt.tz_localize(pytz.UTC)  # Assume OHLCV data is in UTC
-
-    timeframes = {
-        "24h": timedelta(hours=24),
-        "18h": timedelta(hours=18),
-        "12h": timedelta(hours=12),
-        "6h": timedelta(hours=6),
-        "4h": timedelta(hours=4),
-        "3h": timedelta(hours=3),
-        "2h": timedelta(hours=2),
-        "1h": timedelta(hours=1),
-        "30min": timedelta(hours=0.5)
-    }
-
-    result = {}
-    current_row = df[df["timestamp"] <= current_time]
-    if current_row.empty:
-        return {key: None for key in timeframes}
-
-    current_price = current_row.iloc[-1]["price"]
-
-    for label, delta in timeframes.items():
-        past_time = current_time - delta
-        df["timedelta"] = (df["timestamp"] - past_time).abs()
-
-        # Only include datapoints within ±10 minutes
-        filtered_df = df[df["timedelta"] <= timedelta(minutes=10)]
-
-        if filtered_df.empty:
-            print(f"⚠️ [{label}] No suitable datapoint found (difference > 10 minutes)")
-            result[label] = None
+def _price_changes(df: pd.DataFrame, as_of_ns: np.ndarray, verbose: bool = True) -> list:
+    """
+    Price change % per timeframe for each as_of time (UTC ns): the last close at or before
+    as_of against the close of the candle nearest to as_of - timeframe (earlier one on a tie),
+    if that is within PRICE_POINT_TOLERANCE. Every (time, timeframe) target is resolved with
+    one searchsorted over the candle times.
+    """
+    if "timestamp" in df.columns:
+        df = df.set_index("timestamp")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    times = _candle_times(df).tz_convert(pytz.UTC).asi8
+    prices = df["close"].to_numpy(dtype=float)
+
+    labels = list(PRICE_CHANGE_TIMEFRAMES)
+    deltas = np.array([pd.Timedelta(delta).value for delta in PRICE_CHANGE_TIMEFRAMES.values()], dtype=np.int64)
+
+    current = np.searchsorted(times, as_of_ns, side="right") - 1
+
+    targets = as_of_ns[:, None] - deltas[None, :]
+    right = np.clip(np.searchsorted(times, targets), 0, len(times) - 1)
+    left = np.clip(right - 1, 0, len(times) - 1)
+    left_distance = np.abs(times[left] - targets)
+    right_distance = np.abs(times[right] - targets)
+    nearest = np.where(left_distance <= right_distance, left, right)
+    found = np.minimum(left_distance, right_distance) <= pd.Timedelta(PRICE_POINT_TOLERANCE).value
+
+    current_price = prices[np.maximum(current, 0)][:, None]
+    past_price = prices[nearest]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = np.round(((current_price - past_price) / past_price) * 100, 2)
+
+    results = []
+    for row in range(len(as_of_ns)):
+        if current[row] < 0:
+            results.append({label: None for label in labels})
             continue
+        result = {}
+        for column, label in enumerate(labels):
+            if found[row, column]:
+                result[label] = changes[row, column].item()
+            else:
+                if verbose:
+                    print(f"⚠️ [{label}] No suitable datapoint found (difference > 10 minutes)")
+                result[label] = None
+        results.append(result)
+    return results
+
+def calculate_price_changes(symbol: str, current_time: datetime = None, df_5m: pd.DataFrame = None, as_of=None):
+    """
+    Price change % over PRICE_CHANGE_TIMEFRAMES at current_time (now when not given), from
+    5m candles. df_5m is used when given (e.g. a frame the caller already has), otherwise
+    PRICE_CHANGE_CANDLES candles are fetched. With as_of (a sequence of times) a list with one
+    result per time is returned instead, which lets a backtest evaluate a whole time grid from
+    one frame. Naive times are in TIMEZONE.
+    """
+    if current_time is None and as_of is None:
+        current_time = datetime.now(pytz.timezone(TIMEZONE.zone))
 
-        closest_row = filtered_df.loc[filtered_df["timedelta"].idxmin()]
-        past_price = closest_row["price"]
-        actual_time = closest_row["timestamp"]
-
-        change_pct = ((current_price - past_price) / past_price) * 100
-        result[label] = round(change_pct, 2)
+    if df_5m is None:
+        result = fetch_ohlcv_fallback(symbol, intervals=["5m"], limit=PRICE_CHANGE_CANDLES)
+        ohlcv_data = result.get("data_by_interval", {}) if result else {}
+        df_5m = ohlcv_data.get("5m")
 
-        # print(f"🔍 [{label}] Past price: {past_price}, Time: {actual_time}, Current price: {current_price}, Change: {result[label]}%")
+    if df_5m is None or df_5m.empty:
+        print(f"⚠️ No OHLCV data available for symbol {symbol}")
+        return [{} for _ in as_of] if as_of is not None else {}
 
-    return result
\ No newline at end of file
+    if as_of is not None:
+        return _price_changes(df_5m, _as_utc_ns(as_of, TIMEZONE.zone), verbose=False)
+    return _price_changes(df_5m, _as_utc_ns([current_time], TIMEZONE.zone))[0]
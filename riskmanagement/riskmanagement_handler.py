@@ -4,8 +4,9 @@ from datetime import datetime
 import pytz
 import pandas as pd
 from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
+from integrations.multi_interval_ohlcv.resampled_ohlcv import fetch_ohlcv_resampled
 from riskmanagement.momentum_validator import verify_signal_with_momentum_and_volume
-from riskmanagement.price_change_analyzer import check_price_change_risk
+from riskmanagement.price_change_analyzer import check_price_change_risk, PRICE_CHANGE_CANDLES
 
 def check_riskmanagement(symbol: str, signal: str, market_state: str, override_signal: bool = False, interval=None, intervals=None, mode: str = None):
     
@@ -39,8 +40,13 @@ def check_riskmanagement(symbol: str, signal: str, market_state: str, override_s
     if intervals is None:
         intervals = [5]
 
-    # Fetch OHLCV for timestamp reference
-    result = fetch_ohlcv_fallback(symbol, intervals=["5m"], limit=30)
+    # 24h of 5m candles for the price change check, fetched first so the 30 candle request
+    # below (and the 5m base of its 15m candles) is sliced from the OHLCV cache
+    history = fetch_ohlcv_fallback(symbol, intervals=["5m"], limit=PRICE_CHANGE_CANDLES)
+    history_5m = history.get("data_by_interval", {}).get("5m") if history else None
+
+    # Fetch OHLCV for timestamp reference; 15m for the reverse check is built from the 5m candles
+    result = fetch_ohlcv_resampled(symbol, intervals=["5m", "15m"], limit=30)
     ohlcv_data = result.get("data_by_interval", {}) if result else {}
 
     if not ohlcv_data or "5m" not in ohlcv_data or ohlcv_data["5m"].empty:
@@ -50,7 +56,7 @@ def check_riskmanagement(symbol: str, signal: str, market_state: str, override_s
     df = ohlcv_data["5m"]
 
     # Price change risk check
-    price_risk_result, price_changes = check_price_change_risk(symbol, signal, df)
+    price_risk_result, price_changes = check_price_change_risk(symbol, signal, history_5m if history_5m is not None and not history_5m.empty else df)
     if price_risk_result == "none":
         print(f"⛔ Blocked {signal.upper()} signal: [2h] Change {price_changes.get('2h')}% exceeds threshold.")
         return "none", price_changes, 1.0, {"momentum_strength": "n/a", "interpretation": "price change block"}
@@ -66,20 +72,16 @@ def check_riskmanagement(symbol: str, signal: str, market_state: str, override_s
     reverse_results = {}
 
     # 5min reverse
-    result_5m = fetch_ohlcv_fallback(symbol, intervals=["5m"], limit=30)
-    ohlcv_5m_data = result_5m.get("data_by_interval", {}) if result_5m else {}
-    if "5m" in ohlcv_5m_data and not ohlcv_5m_data["5m"].empty:
-        df_5m = ohlcv_5m_data["5m"]
+    if "5m" in ohlcv_data and not ohlcv_data["5m"].empty:
+        df_5m = ohlcv_data["5m"]
         reverse_5m = verify_signal_with_momentum_and_volume(df_5m, reverse_signal, symbol, intervals=[5], market_state=market_state)
         reverse_results["5min"] = reverse_5m
     else:
         reverse_results["5min"] = {"momentum_strength": "n/a", "interpretation": "No 5m OHLCV"}
 
     # 15min reverse
-    result_15m = fetch_ohlcv_fallback(symbol, intervals=["15m"], limit=30)
-    ohlcv_15m_data = result_15m.get("data_by_interval", {}) if result_15m else {}
-    if "15m" in ohlcv_15m_data and not ohlcv_15m_data["15m"].empty:
-        df_15m = ohlcv_15m_data["15m"]
+    if "15m" in ohlcv_data and not ohlcv_data["15m"].empty:
+        df_15m = ohlcv_data["15m"]
         reverse_15m = verify_signal_with_momentum_and_volume(df_15m, reverse_signal, symbol, intervals=[15], market_state=market_state)
         reverse_results["15min"] = reverse_15m
     else:
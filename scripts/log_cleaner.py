@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import re
 import tempfile
 import shutil
+from scripts.signal_store import export_signal_log, archive_signal_entries
 
 SIGNAL_DIR = "../AI-crypto-trader-logs/signal-data"
 ORDER_DIR = "../AI-crypto-trader-logs/order-data"
@@ -59,10 +60,6 @@ def extract_date_from_order_entry(entry):
     return None
 
 def archive_complete_signals():
-    if not os.path.exists(SIGNALS_LATEST):
-        print("No signals_log.json found.")
-        return
-
     today = datetime.now()
     yesterday = today - timedelta(days=1)
     archive_filename = f"signals_log_{yesterday.day}-{yesterday.month}-{yesterday.year}.json"
@@ -72,37 +69,32 @@ def archive_complete_signals():
         print(f"Archive already exists for signals: {archive_filename}, skipping.")
         return
 
-    current_data = load_json(SIGNALS_LATEST)
-    archive_data = {}
-
-    for pair, timeframes in list(current_data.items()):
-        for tf, actions in list(timeframes.items()):
-            for direction, indicators in list(actions.items()):
-                if not isinstance(indicators, dict):
-                    continue
-                for indicator, log_data in list(indicators.items()):
-                    log_date = extract_date_from_signal_entry({indicator: log_data})
-                    archive_this = False
-                    if log_date:
-                        if log_date.date() < yesterday.date():
-                            archive_this = True
-                        elif log_date.date() == yesterday.date() and log_data.get("status") == "completed":
-                            archive_this = True
-                    if archive_this:
-                        print(f"Archiving signal: {pair} {tf} {direction} {indicator} @ {log_date}")
-                        archive_data.setdefault(pair, {}).setdefault(tf, {}).setdefault(direction, {})[indicator] = log_data
-                        del current_data[pair][tf][direction][indicator]
+    def should_archive(pair, tf, direction, indicator, log_data):
+        log_date = extract_date_from_signal_entry({indicator: log_data})
+        archive_this = False
+        if log_date:
+            if log_date.date() < yesterday.date():
+                archive_this = True
+            elif log_date.date() == yesterday.date() and log_data.get("status") == "completed":
+                archive_this = True
+        if archive_this:
+            print(f"Archiving signal: {pair} {tf} {direction} {indicator} @ {log_date}")
+        return archive_this
+
+    # The signal state lives in the SQLite store: rows are picked, archived and deleted in one
+    # transaction there, so a row updated meanwhile is never deleted unarchived
+    try:
+        archive_data = archive_signal_entries(should_archive, lambda data: save_json(archive_path, data))
+    except Exception as e:
+        print(f"Warning: Failed to archive signals: {e}")
+        return
 
-                if not current_data[pair][tf][direction]:
-                    del current_data[pair][tf][direction]
-            if not current_data[pair][tf]:
-                del current_data[pair][tf]
-        if not current_data[pair]:
-            del current_data[pair]
+    try:
+        export_signal_log(SIGNALS_LATEST)
+    except Exception as e:
+        print(f"Warning: Failed to export signal store: {e}")
 
     if archive_data:
-        save_json(archive_path, archive_data)
-        save_json(SIGNALS_LATEST, current_data, allow_empty_overwrite=True)
         print(f"Archived complete signals to {archive_filename}")
 
 def archive_old_orders():
@@ -6,6 +6,9 @@ import json
 from datetime import datetime, timezone, timedelta
 import os
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.mmap_jsonl_reader import load_jsonl_time_range
+
 def main():
     if len(sys.argv) < 4:
         print("Käyttö: python poimi_symboli.py <symboli> <alkuaika> <loppuaika>")
@@ -20,30 +23,22 @@ def main():
     alku = datetime.fromisoformat(sys.argv[2]).replace(tzinfo=tz)
     loppu = datetime.fromisoformat(sys.argv[3]).replace(tzinfo=tz)
 
+    # Vain aikavälin rivit dekoodataan (mmap-indeksi + binäärihaku)
     try:
-        with open(tiedosto, "r", encoding="utf-8") as f:
-            records = [json.loads(line) for line in f if line.strip()]
+        if not os.path.isfile(tiedosto):
+            raise FileNotFoundError(tiedosto)
+        records = load_jsonl_time_range(tiedosto, alku, loppu)
     except Exception as e:
         print(f"Virhe tiedostoa luettaessa: {e}")
         sys.exit(1)
 
     osumat = []
     for r in records:
-        # Tarkista että timestamp on olemassa
-        timestamp_str = r.get("timestamp")
-        if not timestamp_str:
-            continue
-
-        try:
-            ts = datetime.fromisoformat(timestamp_str)
-        except:
-            continue
-
         # Lisää symboli, jos puuttuu
         if "symbol" not in r:
             r["symbol"] = haluttu_symboli
 
-        if r["symbol"] == haluttu_symboli and alku <= ts <= loppu:
+        if r["symbol"] == haluttu_symboli:
             osumat.append(r)
 
     if not osumat:
@@ -5,24 +5,29 @@ import os
 from datetime import datetime
 from pytz import UTC
 from configs.config import LOG_FILE, SIGNAL_TIMEOUT, TIMEZONE
-
-# Load the signal log
-def load_signal_log():
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, "r") as f:
-            try:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    return {}
-                return data
-            except json.JSONDecodeError:
-                return {}
-    return {}
+from scripts.signal_store import (
+    get_signal_entry,
+    get_symbol_signals,
+    load_all_signals,
+    upsert_signal_entry,
+    replace_all_signals,
+    export_signal_log
+)
+
+# Signal state lives in a SQLite store (scripts/signal_store.py) keyed by
+# (symbol, interval, signal_type, mode); signals_log.json is an export of it.
+
+# Load the signal log (nested layout: symbol > interval > signal_type > mode)
+def load_signal_log(symbol=None):
+    if symbol is not None:
+        symbol_log = get_symbol_signals(symbol)
+        return {symbol: symbol_log} if symbol_log else {}
+    return load_all_signals()
 
 # Save to signal log
 def save_signal_log(log):
-    with open(LOG_FILE, "w") as f:
-        json.dump(log, f, indent=4)
+    replace_all_signals(log)
+    export_signal_log(LOG_FILE)
 
 # Check if signal is allowed to let through (used in rsi_analyzer.py)
 def is_signal_allowed(symbol: str, interval: str, signal_type: str, now: datetime, mode: str = "default") -> bool:
@@ -32,19 +37,8 @@ def is_signal_allowed(symbol: str, interval: str, signal_type: str, now: datetim
     else:
         now = now.astimezone(TIMEZONE)
 
-    log = load_signal_log()
-
-    signal_entry = (
-        log.get(symbol, {})
-           .get(interval, {})
-           .get(signal_type, {})
-    )
-
-    # If no entry -> accept signal
-    if not signal_entry:
-        return True
-
-    entry_for_mode = signal_entry.get(mode)
+    # Single indexed row lookup instead of loading the whole log
+    entry_for_mode = get_signal_entry(symbol, interval, signal_type, mode)
 
     # If no entry mode -> accept signal
     if not entry_for_mode:
@@ -93,18 +87,13 @@ def update_signal_log(symbol, interval, rsi, signal_type, mode, now, status,
     else:
         now = now.astimezone(TIMEZONE)
 
-    log = load_signal_log()
-
-    # Luo rakenne: symbol > interval > signal_type (buy/sell) > mode (rsi/momentum/...)
-    mode_entry = log.setdefault(symbol, {}) \
-                    .setdefault(interval, {}) \
-                    .setdefault(signal_type, {}) \
-                    .setdefault(mode, {})
+    mode_entry = get_signal_entry(symbol, interval, signal_type, mode)
+    if mode_entry is None:
+        mode_entry = {}
 
     # Korjaa vanha formaatti, jos mode_entry on str, muutetaan dictiksi
     if isinstance(mode_entry, str):
         mode_entry = {"time": mode_entry}
-        log[symbol][interval][signal_type][mode] = mode_entry
 
     # Tallenna aikaleima erilliseen avainkenttään
     mode_entry["time"] = now.isoformat()
@@ -124,9 +113,12 @@ def update_signal_log(symbol, interval, rsi, signal_type, mode, now, status,
     if started_on:
         mode_entry["started_on"] = started_on
 
-    # Tarkista previous_market_state muiden analyysien alta
+    # Tarkista previous_market_state muiden analyysien alta (vain tämän symbolin rivit)
+    symbol_log = get_symbol_signals(symbol)
+    symbol_log.setdefault(interval, {}).setdefault(signal_type, {})[mode] = mode_entry
+
     previous_state = None
-    for _interval_data in log.get(symbol, {}).values():
+    for _interval_data in symbol_log.values():
         for _signal_data in _interval_data.values():
             if isinstance(_signal_data, dict):
                 for _mode_data in _signal_data.values():
@@ -146,9 +138,9 @@ def update_signal_log(symbol, interval, rsi, signal_type, mode, now, status,
     if history_sentiment:
         mode_entry["history_sentiment_data"] = history_sentiment
 
-    # ✅ Tallenna
+    # ✅ Tallenna (yksi rivi)
     try:
-        save_signal_log(log)
+        upsert_signal_entry(symbol, interval, signal_type, mode, mode_entry)
         print("✅ Signal log saved successfully.")
     except Exception as e:
-        print(f"[❌] Failed to save signal log: {e}")
\ No newline at end of file
+        print(f"[❌] Failed to save signal log: {e}")
@@ -0,0 +1,182 @@
+# scripts/signal_store.py
+
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+from configs.config import LOG_FILE, SIGNAL_DB_FILE
+
+# One row per (symbol, interval, direction, mode). The rowid keeps the insertion order,
+# so the nested JSON layout of signals_log.json can be rebuilt in its original order.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    entry TEXT NOT NULL,
+    UNIQUE (symbol, interval, direction, mode)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized_paths = set()
+
+def _connect(db_path=None):
+    db_path = db_path or SIGNAL_DB_FILE
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        connections[db_path] = conn
+
+    with _init_lock:
+        if db_path not in _initialized_paths:
+            _initialized_paths.add(db_path)
+            _import_json_once(conn)
+    return conn
+
+def _iter_nested(log):
+    """Yields (symbol, interval, direction, mode, entry) from the nested signals_log.json layout."""
+    if not isinstance(log, dict):
+        return
+    for symbol, intervals in log.items():
+        if not isinstance(intervals, dict):
+            continue
+        for interval, directions in intervals.items():
+            if not isinstance(directions, dict):
+                continue
+            for direction, modes in directions.items():
+                if not isinstance(modes, dict):
+                    continue
+                for mode, entry in modes.items():
+                    yield symbol, interval, direction, mode, entry
+
+def _build_nested(rows):
+    log = {}
+    for symbol, interval, direction, mode, entry in rows:
+        log.setdefault(symbol, {}).setdefault(interval, {}).setdefault(direction, {})[mode] = json.loads(entry)
+    return log
+
+def _import_json_once(conn, json_path=None):
+    """Seeds an empty store from the existing signals_log.json the first time it is opened."""
+    json_path = json_path or LOG_FILE
+    if conn.execute("SELECT value FROM meta WHERE key = 'json_imported'").fetchone():
+        return
+
+    log = {}
+    if os.path.exists(json_path):
+        try:
+            with open(json_path, "r") as f:
+                log = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Could not import {json_path} into signal store: {e}")
+            log = {}
+
+    with conn:
+        if not conn.execute("SELECT 1 FROM signals LIMIT 1").fetchone():
+            conn.executemany(
+                "INSERT OR REPLACE INTO signals (symbol, interval, direction, mode, entry) VALUES (?, ?, ?, ?, ?)",
+                [(s, i, d, m, json.dumps(e)) for s, i, d, m, e in _iter_nested(log)]
+            )
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', '1')")
+
+def get_signal_entry(symbol, interval, direction, mode, db_path=None):
+    """Returns the stored entry (dict, or str in the old format) or None."""
+    row = _connect(db_path).execute(
+        "SELECT entry FROM signals WHERE symbol = ? AND interval = ? AND direction = ? AND mode = ?",
+        (symbol, interval, direction, mode)
+    ).fetchone()
+    return json.loads(row[0]) if row else None
+
+def get_symbol_signals(symbol, db_path=None):
+    """Returns {interval: {direction: {mode: entry}}} for one symbol, in insertion order."""
+    rows = _connect(db_path).execute(
+        "SELECT symbol, interval, direction, mode, entry FROM signals WHERE symbol = ? ORDER BY id",
+        (symbol,)
+    ).fetchall()
+    return _build_nested(rows).get(symbol, {})
+
+def load_all_signals(db_path=None):
+    rows = _connect(db_path).execute(
+        "SELECT symbol, interval, direction, mode, entry FROM signals ORDER BY id"
+    ).fetchall()
+    return _build_nested(rows)
+
+def upsert_signal_entry(symbol, interval, direction, mode, entry, db_path=None):
+    """Writes one row; an existing row keeps its position in the exported layout."""
+    conn = _connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT INTO signals (symbol, interval, direction, mode, entry) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (symbol, interval, direction, mode) DO UPDATE SET entry = excluded.entry",
+            (symbol, interval, direction, mode, json.dumps(entry))
+        )
+
+def replace_all_signals(log, db_path=None):
+    """Replaces the store content with a nested signals_log.json style dict."""
+    conn = _connect(db_path)
+    with conn:
+        conn.execute("DELETE FROM signals")
+        conn.executemany(
+            "INSERT OR REPLACE INTO signals (symbol, interval, direction, mode, entry) VALUES (?, ?, ?, ?, ?)",
+            [(s, i, d, m, json.dumps(e)) for s, i, d, m, e in _iter_nested(log)]
+        )
+
+def archive_signal_entries(should_archive, write_archive, db_path=None):
+    """
+    Moves rows out of the store in one write transaction: should_archive(symbol, interval,
+    direction, mode, entry) picks the rows, write_archive(nested) saves them and only then
+    are they deleted. Other writers wait for the transaction, so a row cannot change between
+    being archived and being deleted, and a failed archive write deletes nothing.
+    Returns the archived rows in the nested layout.
+    """
+    conn = _connect(db_path)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            "SELECT id, symbol, interval, direction, mode, entry FROM signals ORDER BY id"
+        ).fetchall()
+        chosen = [row for row in rows if should_archive(*row[1:5], json.loads(row[5]))]
+        archived = _build_nested(row[1:] for row in chosen)
+        if chosen:
+            write_archive(archived)
+            conn.executemany("DELETE FROM signals WHERE id = ?", [(row[0],) for row in chosen])
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return archived
+
+def export_signal_log(json_path=None, db_path=None):
+    """
+    Writes the store out in the existing signals_log.json layout. The store is the source of
+    truth and nothing reads this file back; it is a snapshot for people, refreshed by
+    log_cleaner and save_signal_log, not on every update_signal_log.
+    """
+    json_path = json_path or LOG_FILE
+    log = load_all_signals(db_path)
+
+    directory = os.path.dirname(json_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(tmp_fd, "w") as tmp_file:
+        json.dump(log, tmp_file, indent=4)
+    os.replace(tmp_path, json_path)
+    return log
@@ -4,7 +4,7 @@ from integrations.binance_api_client import get_current_price
 import math
 from integrations import binance_api_client
 
-binance_api_client.init_client()
+# binance_api_client.client is created on first use, not at import
 
 def round_price(price, tick_size):
     precision = int(round(-math.log10(tick_size), 0))
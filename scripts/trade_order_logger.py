@@ -3,6 +3,7 @@ import os
 from datetime import datetime
 from configs.config import TRADE_LOG_FILE, TIMEZONE
 import pandas as pd
+from utils.log_writer import enqueue_write
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 LOG_PATH = os.path.join(BASE_DIR, "../AI-crypto-trader-logs/order-data/order_log.json")
@@ -138,6 +139,22 @@ def reactivate_completed_orders(filepath=LOG_PATH):
 
     return updated_any
 
+def _append_skipped_orders(filepath, entries):
+    # Ladataan aiemmat tiedot
+    if os.path.exists(filepath):
+        try:
+            with open(filepath, "r") as f:
+                skipped_orders = json.load(f)
+        except json.JSONDecodeError:
+            skipped_orders = []
+    else:
+        skipped_orders = []
+
+    skipped_orders.extend(entries)
+
+    with open(filepath, "w") as f:
+        json.dump(skipped_orders, f, indent=4)
+
 def log_skipped_order(symbol: str, reason: str, direction: str = None, details: dict = None, order_data: dict = None, history_sentiment: dict = None):
     filepath = SKIPPED_LOG_PATH.replace(".jsonl", ".json")
 
@@ -178,21 +195,9 @@ def log_skipped_order(symbol: str, reason: str, direction: str = None, details:
             if key in order_data:
                 entry[key] = order_data[key]
 
-    # Ladataan aiemmat tiedot
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, "r") as f:
-                skipped_orders = json.load(f)
-        except json.JSONDecodeError:
-            skipped_orders = []
-    else:
-        skipped_orders = []
-
     entry["history_sentiment_data"] = history_sentiment
 
-    skipped_orders.append(entry)
-
-    with open(filepath, "w") as f:
-        json.dump(skipped_orders, f, indent=4)
+    # Kirjoitetaan taustasäikeessä; peräkkäiset ohitukset tallennetaan yhdellä kirjoituksella
+    enqueue_write(filepath, entry, _append_skipped_orders)
 
     print(f"[log_skipped_order] {symbol} {direction or ''} skipped: {reason}")
@@ -3,13 +3,14 @@
 # This tries to find divergences, both bull and bear then returns a signal
 #
 import os
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from scipy.signal import find_peaks
 from datetime import datetime, timedelta
 import pytz
 from scripts.signal_logger import log_signal
 from scripts.signal_limiter import is_signal_allowed, update_signal_log
+from utils.lazy_import import lazy_import
+from modules.indicator_engine.indicator_engine import get_indicators
 from configs.config import (
     RSI_LENGTH,
     BEARISH_RSI_DIFF,
@@ -20,9 +21,12 @@ from configs.config import (
     TIMEZONE
 )
 
+# Heavy library, imported when the first detector runs
+scipy_signal = lazy_import("scipy.signal")
+
 class DivergenceDetector:
 
-    def __init__(self, df: pd.DataFrame, rsi_length: int = RSI_LENGTH):
+    def __init__(self, df: pd.DataFrame, rsi_length: int = RSI_LENGTH, symbol: str = None, interval: str = None):
         self.df = df.copy()
 
         if self.df.index.name == 'timestamp':
@@ -33,60 +37,86 @@ class DivergenceDetector:
 
         self.df['timestamp'] = pd.to_datetime(self.df['timestamp'], utc=True).dt.tz_convert(TIMEZONE)
         self.df.set_index('timestamp', inplace=True)
-        self.df['rsi'] = ta.rsi(self.df['close'], length=rsi_length)
+        # Wilder RSI from the shared engine; with symbol and interval it is computed once per candle
+        self.df['rsi'] = get_indicators(self.df, symbol, interval).rsi(window=rsi_length)
         self.now = pd.Timestamp.utcnow().replace(tzinfo=pytz.utc).astimezone(TIMEZONE)
+        self._peaks_and_troughs = None
 
     def _find_peaks_and_troughs(self):
-        peaks, _ = find_peaks(self.df['rsi'])
-        troughs, _ = find_peaks(-self.df['rsi'])
-        return peaks, troughs
+        # Both series are found once per detector and shared by the bear and bull checks
+        if self._peaks_and_troughs is None:
+            rsi = self.df['rsi'].to_numpy()
+            peaks, _ = scipy_signal.find_peaks(rsi)
+            troughs, _ = scipy_signal.find_peaks(-rsi)
+            self._peaks_and_troughs = peaks, troughs
+        return self._peaks_and_troughs
 
     def _is_recent(self, timestamp, minutes=RECENT_THRESHOLD_MINUTES):
         return self.now - timestamp <= timedelta(minutes=minutes)
 
+    def _latest_divergence(self, extrema, bearish):
+        """
+        Position of the newest recent extreme that diverges from the one before it, or None.
+        Consecutive (prev, curr) pairs are compared as arrays, and only pairs whose curr lies
+        within RECENT_THRESHOLD_MINUTES are considered.
+        """
+        if len(extrema) < 2:
+            return None
+        curr, prev = extrema[1:], extrema[:-1]
+
+        recent = np.asarray(self.df.index[curr] >= self.now - timedelta(minutes=RECENT_THRESHOLD_MINUTES))
+        curr, prev = curr[recent], prev[recent]
+        if not len(curr):
+            return None
+
+        rsi = self.df['rsi'].to_numpy()
+        close = self.df['close'].to_numpy(dtype=float)
+        if bearish:
+            diverging = (rsi[curr] < rsi[prev] - BEARISH_RSI_DIFF) & (close[curr] > close[prev] * BEARISH_PRICE_FACTOR)
+        else:
+            diverging = (rsi[curr] > rsi[prev] + BULLISH_RSI_DIFF) & (close[curr] < close[prev] * BULLISH_PRICE_FACTOR)
+
+        candidates = curr[diverging]
+        return int(candidates[-1]) if len(candidates) else None
+
     # Check for bear divergence
     def detect_bearish_divergence(self, symbol="UNKNOWN", interval="1h"):
         peaks, _ = self._find_peaks_and_troughs()
-        signals = []
-        for i in range(1, len(peaks)):
-            curr, prev = peaks[i], peaks[i-1]
-            time = self.df.index[curr]
-            if not self._is_recent(time):
-                continue
-            if self.df['rsi'].iloc[curr] < self.df['rsi'].iloc[prev] - BEARISH_RSI_DIFF and \
-               self.df['close'].iloc[curr] > self.df['close'].iloc[prev] * BEARISH_PRICE_FACTOR:
-                if is_signal_allowed(symbol, interval, "sell", time, mode="divergence"):
-                    update_signal_log(symbol, interval, self.df['rsi'].iloc[curr], "sell", time, mode="divergence")
-                    log_signal("sell", f"divergence/{symbol}")
-                    signals.append({
-                        'type': 'bear',
-                        'index': curr,
-                        'price': self.df['close'].iloc[curr],
-                        'time': time
-                    })
-        return signals[-1] if signals else None
+        curr = self._latest_divergence(peaks, bearish=True)
+        if curr is None:
+            return None
+
+        # Only the newest divergence can become the signal, so only it goes through the limiter
+        time = self.df.index[curr]
+        if not is_signal_allowed(symbol, interval, "sell", time, mode="divergence"):
+            return None
+        update_signal_log(symbol, interval, self.df['rsi'].iloc[curr], "sell", time, mode="divergence")
+        log_signal("sell", f"divergence/{symbol}")
+        return {
+            'type': 'bear',
+            'index': curr,
+            'price': self.df['close'].iloc[curr],
+            'time': time
+        }
 
     # Check for bull divergence
     def detect_bullish_divergence(self, symbol="UNKNOWN", interval="1h"):
         _, troughs = self._find_peaks_and_troughs()
-        signals = []
-        for i in range(1, len(troughs)):
-            curr, prev = troughs[i], troughs[i-1]
-            time = self.df.index[curr]
-            if not self._is_recent(time):
-                continue
-            if self.df['rsi'].iloc[curr] > self.df['rsi'].iloc[prev] + BULLISH_RSI_DIFF and \
-               self.df['close'].iloc[curr] < self.df['close'].iloc[prev] * BULLISH_PRICE_FACTOR:
-                if is_signal_allowed(symbol, interval, "buy", time, mode="divergence"):
-                    update_signal_log(symbol, interval, "buy", time, mode="divergence")
-                    log_signal("buy", f"divergence/{symbol}")
-                    signals.append({
-                        'type': 'bull',
-                        'index': curr,
-                        'price': self.df['close'].iloc[curr],
-                        'time': time
-                    })
-        return signals[-1] if signals else None
+        curr = self._latest_divergence(troughs, bearish=False)
+        if curr is None:
+            return None
+
+        time = self.df.index[curr]
+        if not is_signal_allowed(symbol, interval, "buy", time, mode="divergence"):
+            return None
+        update_signal_log(symbol, interval, "buy", time, mode="divergence")
+        log_signal("buy", f"divergence/{symbol}")
+        return {
+            'type': 'bull',
+            'index': curr,
+            'price': self.df['close'].iloc[curr],
+            'time': time
+        }
 
     def detect_all_divergences(self, symbol="UNKNOWN", interval="1h"):
         bear = self.detect_bearish_divergence(symbol, interval)
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import pytz
 import pandas as pd
 from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
+from modules.indicator_engine.indicator_engine import get_indicators
 from configs.config import (
     TIMEZONE,
     LOG_BASED_SIGNAL_TIMEOUT,
@@ -15,20 +16,13 @@ from configs.config import (
     RSI_FILTER_SELL_MIN
 )
 
-def calculate_rsi(df, period=14):
-    delta = df['close'].diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+def calculate_rsi(df, period=14, symbol=None, interval=None):
+    # Wilder RSI from the shared indicator engine, like every other RSI in the bot
+    rsi = get_indicators(df, symbol, interval).rsi(window=period)
+    return pd.Series(rsi, index=df.index)
 
 def get_log_based_signal(symbol: str, signal_type: str = None) -> dict:
-    log = load_signal_log()
+    log = load_signal_log(symbol)
     now = datetime.now(pytz.timezone(TIMEZONE.zone))
     symbol_log = log.get(symbol, {})
 
@@ -96,7 +90,7 @@ def get_log_based_signal(symbol: str, signal_type: str = None) -> dict:
                 print(f"❌ RSI data puuttuu symbolilta {symbol} – signaali blokataan")
                 return {}
 
-            rsi_series = calculate_rsi(df_rsi, period=RSI_FILTER_PERIOD)
+            rsi_series = calculate_rsi(df_rsi, period=RSI_FILTER_PERIOD, symbol=symbol, interval=RSI_FILTER_INTERVAL)
             latest_rsi = rsi_series.dropna().iloc[-1]
 
             if best_entry["signal"] == "buy" and latest_rsi > RSI_FILTER_BUY_MAX:
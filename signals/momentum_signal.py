@@ -3,12 +3,14 @@
 from signals.determine_momentum import determine_signal_with_momentum_and_volume
 from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
 from signals.log_signal import get_log_signal
+from modules.indicator_engine.indicator_engine import get_indicators
 from configs.config import (
     RSI_FILTER_ENABLED,
     RSI_FILTER_PERIOD,
     RSI_FILTER_BUY_MAX,
     RSI_FILTER_SELL_MIN
 )
+import numpy as np
 import pandas as pd
 
 def get_momentum_signal(symbol: str):
@@ -44,15 +46,8 @@ def get_momentum_signal(symbol: str):
     # RSI-suodatus (1h) konfiguraation mukaan
     if RSI_FILTER_ENABLED:
         try:
-            close_1h = df_1h["close"]
-            delta = close_1h.diff()
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
-            avg_gain = gain.rolling(window=RSI_FILTER_PERIOD).mean()
-            avg_loss = loss.rolling(window=RSI_FILTER_PERIOD).mean()
-            rs = avg_gain / avg_loss
-            rsi_1h = 100 - (100 / (1 + rs))
-            rsi_latest = rsi_1h.dropna().iloc[-1]
+            rsi_1h = get_indicators(df_1h, symbol, "1h").rsi(window=RSI_FILTER_PERIOD)
+            rsi_latest = rsi_1h[~np.isnan(rsi_1h)][-1]
 
             if suggested_signal == "buy" and rsi_latest > RSI_FILTER_BUY_MAX:
                 print(f"❌ RSI-filter denied a buy-signal (RSI={rsi_latest:.2f} > {RSI_FILTER_BUY_MAX})")
@@ -1,10 +1,11 @@
 # signals/rsi_analyzer.py
 
 import pandas as pd
-import ta
+import numpy as np
 from datetime import datetime
 from scripts.signal_limiter import is_signal_allowed, update_signal_log
-from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
+from integrations.multi_interval_ohlcv.resampled_ohlcv import fetch_ohlcv_resampled
+from modules.indicator_engine.indicator_engine import get_indicators
 from configs.config import RSI_THRESHOLDS, RSI_PERIOD, DEFAULT_BUY_LIMIT, DEFAULT_SELL_LIMIT, TIMEZONE
 from pytz import timezone
 import pytz
@@ -13,13 +14,14 @@ INTERVALS = list(RSI_THRESHOLDS.keys())
 
 # Calculate RSI
 def calculate_rsi(close_prices, period=RSI_PERIOD):
-    rsi = ta.momentum.RSIIndicator(close=close_prices, window=period)
-    return rsi.rsi()
+    rsi = get_indicators(close_prices.to_frame("close")).rsi(window=period)
+    return pd.Series(rsi, index=close_prices.index)
 
 # Run RSI analyzer
 def rsi_analyzer(symbol):
 
-    result = fetch_ohlcv_fallback(symbol=symbol, intervals=INTERVALS, limit=200)
+    # Only the base intervals are requested; the rest are resampled from them
+    result = fetch_ohlcv_resampled(symbol=symbol, intervals=INTERVALS, limit=200)
     if not result:
         return {
             "signal": "none",
@@ -41,10 +43,12 @@ def rsi_analyzer(symbol):
         if df is None or df.empty or thresholds is None:
             continue
 
-        rsi_series = calculate_rsi(df['close']).dropna()
-        if rsi_series.empty:
+        # Memoized per candle, so the data preview and divergence checks reuse this RSI
+        rsi_values = get_indicators(df, symbol, interval).rsi(window=RSI_PERIOD)
+        rsi_values = rsi_values[~np.isnan(rsi_values)]
+        if not len(rsi_values):
             continue
-        latest_rsi = rsi_series.iloc[-1]
+        latest_rsi = rsi_values[-1]
         if isinstance(df.index, pd.DatetimeIndex):
             last_timestamp = df.index[-1]
             if last_timestamp.tzinfo is None:
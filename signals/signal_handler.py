@@ -49,7 +49,7 @@ def get_signal(symbol: str, interval: str, rsi: str, is_first_run: bool = False,
     if df.index.name == 'timestamp':
         df = df.reset_index()
 
-    detector = DivergenceDetector(df)
+    detector = DivergenceDetector(df, symbol=symbol, interval="1h")
     divergence = detector.detect_all_divergences(symbol=symbol, interval=interval)
     if divergence:
         signal_type = "buy" if divergence["type"] == "bull" else "sell"
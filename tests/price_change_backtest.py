@@ -3,7 +3,10 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import pytz
-from riskmanagement.price_change_analyzer import calculate_price_changes, should_block_signal
+from riskmanagement.price_change_analyzer import (
+    calculate_price_changes, should_block_signal, covers_price_change_timeframes, PRICE_CHANGE_CANDLES
+)
+from integrations.multi_interval_ohlcv.multi_ohlcv_handler import fetch_ohlcv_fallback
 
 # Määrittele testattava symboli ja signaali (buy tai sell)
 SYMBOL = "BTCUSDC"
@@ -18,25 +21,54 @@ tz = pytz.utc
 end_time = datetime.now(tz)
 start_time = end_time - timedelta(hours=LOOKBACK_HOURS)
 
-# Iteroi aikaleimoja ja testaa, estettäisiinkö signaali
+# Testattavat aikaleimat
+check_times = []
 current_time = start_time
+while current_time <= end_time:
+    check_times.append(current_time)
+    current_time += timedelta(minutes=INTERVAL_MINUTES)
+
+# 5m-kynttilät koko jaksolle + 24h taaksepäin haetaan kerran, ja koko aikataulukko lasketaan yhdellä kutsulla.
+# Yksi pyyntö palauttaa enintään PRICE_CHANGE_CANDLES kynttilää (OKX: 300), joten haetaan sivuittain taaksepäin.
+# Jokaisella sivulla on sekä start_time että end_time: pelkkä toinen raja ei välity pörssille asti.
+oldest_needed = start_time - timedelta(hours=24, minutes=10)
+page_span = timedelta(minutes=5 * (PRICE_CHANGE_CANDLES - 1))
+pages = []
+page_end = end_time
+while page_end > oldest_needed:
+    page_start = page_end - page_span
+    result = fetch_ohlcv_fallback(SYMBOL, intervals=["5m"], limit=PRICE_CHANGE_CANDLES,
+                                  start_time=page_start, end_time=page_end, save=False)
+    page = result.get("data_by_interval", {}).get("5m") if result else None
+    if page is None or page.empty:
+        break
+    pages.append(page)
+    page_end = page_start - timedelta(milliseconds=1)
+
+df_5m = pd.concat(pages).sort_index() if pages else None
+if df_5m is not None:
+    df_5m = df_5m[~df_5m.index.duplicated(keep="last")]
+
+# Ilman koko 24h taaksepäin ulottuvaa dataa alun muutokset olisivat None ja signaali näyttäisi sallitulta
+if not covers_price_change_timeframes(df_5m, start_time):
+    oldest = df_5m.index.min() if df_5m is not None else None
+    raise RuntimeError(f"❌ 5m data for {SYMBOL} starts at {oldest}, the backtest needs it from {oldest_needed}")
+
+all_price_changes = calculate_price_changes(SYMBOL, df_5m=df_5m, as_of=check_times)
+
 allowed_times = []
 
 print(f"\n🔁 Backtest signal: {SIGNAL.upper()} | Symbol: {SYMBOL} | Period: {LOOKBACK_HOURS}h | TZ: UTC\n")
 
-while current_time <= end_time:
+for current_time, price_changes in zip(check_times, all_price_changes):
     print(f"\n⏱️ Checking at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
-    price_changes = calculate_price_changes(SYMBOL, current_time)
-
     if not should_block_signal(SIGNAL, price_changes):
         print(f"✅ Signal NOT blocked at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
         allowed_times.append(current_time)
     else:
         print(f"🚫 Signal blocked at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
-    current_time += timedelta(minutes=INTERVAL_MINUTES)
-
 # Tulosta yhteenvedot
 print("\n📈 SIGNAL ALLOWED AT THESE TIMES:")
 for t in allowed_times:
@@ -0,0 +1,64 @@
+# tests/test_candle_store.py
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from integrations.multi_interval_ohlcv.candle_store import fetch_with_store, read_candles, get_store_path, CANDLE_DTYPE
+
+MINUTE = 60_000
+START = 1755165600000  # 2025-08-14T10:00:00Z
+
+class FakeExchange:
+    """1m candles from START; the candle open at now_ms has a close that still changes."""
+
+    def __init__(self):
+        self.now_ms = START
+        self.calls = []
+
+    def candles(self, first, last):
+        opens = np.arange(first, last + 1, MINUTE)
+        close = (opens - START) / MINUTE + 100.0
+        close[opens + MINUTE > self.now_ms] += 0.5  # forming candle
+        index = pd.to_datetime(opens, unit="ms")
+        index.name = "timestamp"
+        return pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=index)
+
+    def fetch(self, start, end, limit):
+        self.calls.append((start, end, limit))
+        current = self.now_ms - self.now_ms % MINUTE
+        first = int(start.timestamp() * 1000) if start else current - (limit - 1) * MINUTE
+        return self.candles(first, current).tail(limit)
+
+def test_only_new_candles_are_fetched():
+    exchange = FakeExchange()
+    with tempfile.TemporaryDirectory() as tmp:
+        exchange.now_ms = START + 500 * MINUTE + 30_000
+        first = fetch_with_store("fake", "BTCUSDT", "1m", 100, exchange.fetch, now_ms=exchange.now_ms, store_dir=tmp)
+        assert exchange.calls[-1] == (None, None, 100)
+        assert len(read_candles(get_store_path("fake", "BTCUSDT", "1m", tmp))) == 99
+
+        exchange.now_ms += 3 * MINUTE
+        second = fetch_with_store("fake", "BTCUSDT", "1m", 100, exchange.fetch, now_ms=exchange.now_ms, store_dir=tmp)
+        start, end, limit = exchange.calls[-1]
+        assert int(start.timestamp() * 1000) == START + 500 * MINUTE and limit == 5
+
+        expected = exchange.fetch(None, None, 100)
+        assert second.equals(expected)
+        assert second.index[0] == first.index[3]
+        assert len(read_candles(get_store_path("fake", "BTCUSDT", "1m", tmp))) == 102
+
+def test_gap_and_torn_record_refetch_window():
+    exchange = FakeExchange()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = get_store_path("fake", "ETHUSDT", "1m", tmp)
+        exchange.now_ms = START + 200 * MINUTE
+        fetch_with_store("fake", "ETHUSDT", "1m", 50, exchange.fetch, now_ms=exchange.now_ms, store_dir=tmp)
+        with open(path, "ab") as f:
+            f.write(b"\0" * (CANDLE_DTYPE.itemsize // 2))
+
+        # Too far behind for a range request: the full window replaces the store
+        exchange.now_ms += 1000 * MINUTE
+        result = fetch_with_store("fake", "ETHUSDT", "1m", 50, exchange.fetch, now_ms=exchange.now_ms, store_dir=tmp)
+        assert exchange.calls[-1] == (None, None, 50)
+        assert result.equals(exchange.fetch(None, None, 50))
+        assert os.path.getsize(path) == 49 * CANDLE_DTYPE.itemsize
@@ -0,0 +1,75 @@
+# tests/test_concurrent_fetch.py
+import time
+import random
+import threading
+import modules.symbol_data_fetcher.concurrent_fetch as concurrent_fetch
+from utils.rate_limiter import RateLimiter
+from integrations.multi_interval_ohlcv.parallel_intervals import fetch_intervals
+
+def test_log_entries_are_batched_in_symbol_order(monkeypatch):
+    batches = []
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_fetch(symbol, intervals, limit, log_path, save):
+        assert save is False
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(random.uniform(0, 0.02))
+        with lock:
+            in_flight[0] -= 1
+        if symbol == "BADUSDT":
+            return None
+        return {"symbol": symbol, "timestamp": "2025-08-14T10:00:00+03:00", "data_by_interval": {}, "from_cache": symbol == "HITUSDT"}
+
+    monkeypatch.setattr(concurrent_fetch, "fetch_ohlcv_fallback", fake_fetch)
+    monkeypatch.setattr(concurrent_fetch, "save_and_validate", lambda data, **kwargs: batches.append([e["symbol"] for e in data]))
+
+    symbols = [f"S{i:02d}USDT" for i in range(25)] + ["BADUSDT", "HITUSDT"]
+    results = concurrent_fetch.fetch_symbols_concurrently(symbols, ["1h"], 100, "unused.jsonl", max_workers=6, batch_size=10, schema_path="unused")
+
+    assert list(results) == symbols and results["BADUSDT"] is None
+    assert "data_by_interval" not in results["S00USDT"]
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert sum(batches, []) == symbols[:25]
+    assert 1 < peak[0] <= 6
+
+def test_rate_limiter_caps_requests_per_second():
+    limiter = RateLimiter(max_concurrency=4, requests_per_second=50)
+    started = time.monotonic()
+
+    def call():
+        with limiter:
+            pass
+
+    threads = [threading.Thread(target=call) for _ in range(100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Burst of 50, the other 50 need about a second
+    assert time.monotonic() - started >= 0.9
+
+def test_intervals_are_fetched_in_parallel():
+    intervals = ["1m", "5m", "15m", "1h", "4h", "1d"]
+
+    def slow(interval):
+        time.sleep(0.1)
+        return interval.upper()
+
+    started = time.monotonic()
+    result = fetch_intervals(intervals, slow)
+    assert time.monotonic() - started < 0.3
+    assert list(result.items()) == [(i, i.upper()) for i in intervals]
+
+    def failing(interval):
+        if interval in ("15m", "1d"):
+            raise ValueError(interval)
+        return interval
+
+    try:
+        fetch_intervals(intervals, failing)
+        assert False, "expected ValueError"
+    except ValueError as e:
+        assert str(e) == "15m"
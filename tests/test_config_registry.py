@@ -0,0 +1,39 @@
+# tests/test_config_registry.py
+import json
+import os
+import tempfile
+from modules.load_and_validate.config_registry import load_config_cached
+
+def test_config_is_cached_until_file_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "config.json")
+        schema_path = os.path.join(tmp, "schema.json")
+        with open(schema_path, "w") as f:
+            json.dump({"type": "object", "required": ["timezone"]}, f)
+        with open(config_path, "w") as f:
+            json.dump({"timezone": "UTC"}, f)
+
+        first = load_config_cached(config_path, schema_path)
+        assert first == {"timezone": "UTC"}
+        assert load_config_cached(config_path, schema_path) is first
+
+        with open(config_path, "w") as f:
+            json.dump({"timezone": "Europe/Helsinki"}, f)
+        os.utime(config_path, ns=(0, 10**9))
+
+        assert load_config_cached(config_path, schema_path) == {"timezone": "Europe/Helsinki"}
+
+def test_invalid_config_is_not_cached():
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "config.json")
+        schema_path = os.path.join(tmp, "schema.json")
+        with open(schema_path, "w") as f:
+            json.dump({"type": "object", "required": ["timezone"]}, f)
+        with open(config_path, "w") as f:
+            json.dump({}, f)
+
+        assert load_config_cached(config_path, schema_path) is None
+
+        with open(config_path, "w") as f:
+            json.dump({"timezone": "UTC"}, f)
+        assert load_config_cached(config_path, schema_path) == {"timezone": "UTC"}
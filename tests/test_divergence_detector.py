@@ -0,0 +1,58 @@
+# tests/test_divergence_detector.py
+import numpy as np
+import pandas as pd
+import signals.divergence_detector as divergence
+from signals.divergence_detector import DivergenceDetector
+from configs.config import BEARISH_RSI_DIFF, BEARISH_PRICE_FACTOR, BULLISH_RSI_DIFF, BULLISH_PRICE_FACTOR
+
+def _detector(seed, periods=300):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1.5, periods).cumsum()
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-08-01", periods=periods, freq="1h", tz="UTC"),
+        "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0,
+    })
+    detector = DivergenceDetector(df)
+    # the newest third of the candles counts as recent
+    detector.now = detector.df.index[2 * periods // 3] + pd.Timedelta(minutes=divergence.RECENT_THRESHOLD_MINUTES)
+    return detector
+
+def _reference(detector, extrema, bearish):
+    # The pair-by-pair walk of the original loop
+    rsi, close, found = detector.df["rsi"], detector.df["close"], None
+    for i in range(1, len(extrema)):
+        curr, prev = extrema[i], extrema[i - 1]
+        if not detector._is_recent(detector.df.index[curr]):
+            continue
+        if bearish and rsi.iloc[curr] < rsi.iloc[prev] - BEARISH_RSI_DIFF and close.iloc[curr] > close.iloc[prev] * BEARISH_PRICE_FACTOR:
+            found = curr
+        if not bearish and rsi.iloc[curr] > rsi.iloc[prev] + BULLISH_RSI_DIFF and close.iloc[curr] < close.iloc[prev] * BULLISH_PRICE_FACTOR:
+            found = curr
+    return found
+
+def test_array_pair_checks_match_the_loop():
+    found = 0
+    for seed in range(20):
+        detector = _detector(seed)
+        peaks, troughs = detector._find_peaks_and_troughs()
+        for extrema, bearish in ((peaks, True), (troughs, False)):
+            expected = _reference(detector, extrema, bearish)
+            assert detector._latest_divergence(extrema, bearish) == expected
+            found += expected is not None
+    assert found
+
+def test_limiter_is_asked_once_for_the_newest_divergence(monkeypatch):
+    calls = []
+    monkeypatch.setattr(divergence, "is_signal_allowed", lambda *args, **kwargs: calls.append(args) or True)
+    monkeypatch.setattr(divergence, "update_signal_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(divergence, "log_signal", lambda *args, **kwargs: None)
+
+    for seed in range(20):
+        detector = _detector(seed)
+        expected = _reference(detector, detector._find_peaks_and_troughs()[0], True)
+        calls.clear()
+        signal = detector.detect_bearish_divergence("BTCUSDT")
+        if expected is None:
+            assert signal is None and not calls
+        else:
+            assert signal["index"] == expected and len(calls) == 1
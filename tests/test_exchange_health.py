@@ -0,0 +1,107 @@
+# tests/test_exchange_health.py
+
+import os
+import time
+import tempfile
+from integrations.exchange_health import ExchangeHealth, FAILURE_THRESHOLD, COOLDOWN_SECONDS, PAIR_TTL_SECONDS
+
+def test_order_prefers_healthy_and_fast_exchanges():
+    with tempfile.TemporaryDirectory() as tmp:
+        health = ExchangeHealth("ohlcv", path=os.path.join(tmp, "health.json"))
+        for _ in range(5):
+            health.record("okx", "BTCUSDT", False, 2.0, symbol_error=True, now=1000)
+            health.record("binance", "BTCUSDT", True, 0.4, now=1000)
+            health.record("bybit", "BTCUSDT", True, 0.1, now=1000)
+
+        # okx has its BTCUSDT circuit open; kucoin is unknown and goes after the known good ones
+        assert health.order(["okx", "binance", "kucoin", "bybit"], "BTCUSDT", now=1001) == ["bybit", "binance", "kucoin"]
+        # symbol errors do not cool down the exchange for other symbols
+        assert health.order(["okx", "binance"], "ETHUSDT", now=1001) == ["binance", "okx"]
+
+        stats = health.stats("binance", "BTCUSDT")
+        assert stats["success_rate"] == 1.0 and stats["p50"] == 0.4 and stats["p95"] == 0.4
+
+def test_circuit_cools_down_and_state_persists():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "health.json")
+        health = ExchangeHealth("price", path=path)
+        for _ in range(FAILURE_THRESHOLD):
+            health.record("okx", None, False, 10.0, now=1000)
+        health.save()
+
+        assert not health.is_available("okx", now=1000 + COOLDOWN_SECONDS - 1)
+        assert health.is_available("okx", now=1000 + COOLDOWN_SECONDS + 1)
+        # every exchange open: configured order so there is still one attempt
+        assert health.order(["okx"], now=1001) == ["okx"]
+
+        reloaded = ExchangeHealth("price", path=path)
+        assert not reloaded.is_available("okx", now=1001)
+        assert reloaded.stats("okx")["attempts"] == FAILURE_THRESHOLD
+        assert ExchangeHealth("ohlcv", path=path).is_available("okx", now=1001)
+
+def test_processes_merge_and_old_pairs_expire():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "health.json")
+        now = time.time()
+        first, second = ExchangeHealth("ohlcv", path=path), ExchangeHealth("ohlcv", path=path)
+        first.record("okx", "BTCUSDT", True, 0.2, now=now)
+        first.record("okx", "OLDUSDT", True, 0.2, now=now - PAIR_TTL_SECONDS - 1)
+        second.record("bybit", "ETHUSDT", True, 0.1, now=now)
+        first.save()
+        second.save()
+
+        reloaded = ExchangeHealth("ohlcv", path=path)
+        assert reloaded.stats("okx", "BTCUSDT")["attempts"] == 1
+        assert reloaded.stats("bybit", "ETHUSDT")["attempts"] == 1
+        assert reloaded.stats("okx", "OLDUSDT")["attempts"] == 0
+        assert reloaded.stats("okx")["attempts"] == 2
+
+def test_network_errors_from_real_fetchers_open_the_exchange_circuit(monkeypatch):
+    import pytest
+    import requests
+    import integrations.multi_interval_ohlcv.multi_ohlcv_handler as handler
+    import integrations.multi_interval_ohlcv.fetch_ohlcv_binance_for_intervals as binance_ohlcv
+    import integrations.multi_interval_ohlcv.fetch_ohlcv_okx_for_intervals as okx_ohlcv
+    import integrations.price_data_fetcher.fetchers.fetch_from_binance as binance_price
+    import integrations.price_data_fetcher.fetchers.PriceDataFetcher as price_fetcher
+
+    def unreachable(*args, **kwargs):
+        raise requests.ConnectionError("connection refused")
+
+    config = {"candle_store": False, "fetch_retry": {"max_retries": 1}, "interval_map_okx": {"5m": "5m"}}
+    for module in (binance_ohlcv, okx_ohlcv):
+        monkeypatch.setattr(module, "http_get", unreachable)
+        monkeypatch.setattr(module, "get_ohlcv_config", lambda: config)
+    monkeypatch.setattr(binance_price, "http_get", unreachable)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        health = ExchangeHealth("ohlcv", path=os.path.join(tmp, "health.json"))
+        for exchange in ("binance", "okx"):
+            for symbol in ("BTCUSDT", "ETHUSDT", "XRPUSDT")[:FAILURE_THRESHOLD]:
+                with pytest.raises(requests.ConnectionError):
+                    handler._fetch_from_exchange(exchange, f"fetch_ohlcv_{exchange}", symbol, ["5m"], 30, None, None, health)
+            assert not health.is_available(exchange)
+
+        price_health = ExchangeHealth("price", path=os.path.join(tmp, "health.json"))
+        monkeypatch.setattr(price_fetcher, "get_exchange_health", lambda name: price_health)
+        price_config = {"binance": {"base_url": "https://binance.invalid", "timeout": 1},
+                        "settings": {"exchange_order": ["binance"], "adaptive_exchange_order": False}}
+        for symbol in ("BTCUSDT", "ETHUSDT", "XRPUSDT")[:FAILURE_THRESHOLD]:
+            assert price_fetcher.PriceDataFetcher(symbol, price_config).fetch() is None
+        assert not price_health.is_available("binance")
+
+def test_unknown_symbol_responses_only_cool_down_the_pair():
+    import requests
+    from integrations.exchange_health import is_exchange_failure
+    from utils.rate_limiter import RequestBudgetExceeded
+
+    def http_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.HTTPError(response=response)
+
+    assert is_exchange_failure(requests.Timeout()) and is_exchange_failure(http_error(503))
+    assert is_exchange_failure(http_error(429))
+    assert not is_exchange_failure(http_error(400))
+    assert not is_exchange_failure(RequestBudgetExceeded("budget"))
+    assert not is_exchange_failure(ValueError("Empty DataFrames"))
@@ -0,0 +1,47 @@
+# tests/test_file_checker.py
+import json
+import os
+import tempfile
+from modules.save_and_validate import file_checker as fc
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+def test_only_appended_bytes_are_checked(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _append(path, "".join(json.dumps({"i": i}) + "\n" for i in range(100)))
+        assert fc.file_checker(path, verbose=False)
+        size_after_first = os.path.getsize(path)
+        assert fc.get_validated_offset(path) == size_after_first
+
+        checked_from = []
+        original = fc.is_valid_jsonl
+        monkeypatch.setattr(fc, "is_valid_jsonl", lambda p, start_offset=0: checked_from.append(start_offset) or original(p, start_offset))
+
+        _append(path, json.dumps({"i": 100}) + "\n")
+        assert fc.file_checker(path, verbose=False)
+        assert checked_from == [size_after_first]
+
+def test_half_written_line_is_rechecked():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _append(path, json.dumps({"i": 1}) + "\n" + '{"i": 2}')
+        assert fc.file_checker(path, verbose=False)
+        assert fc.get_validated_offset(path) == len(json.dumps({"i": 1}) + "\n")
+
+        _append(path, ', "broken\n')
+        assert not fc.file_checker(path, verbose=False)
+        assert os.path.getsize(path) == 0
+
+def test_rewritten_file_gets_full_check():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _append(path, "".join(json.dumps({"i": i}) + "\n" for i in range(10)))
+        assert fc.file_checker(path, verbose=False)
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("not json\n")
+        assert fc.get_validated_offset(path) == 0
+        assert not fc.file_checker(path, verbose=False)
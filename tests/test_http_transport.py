@@ -0,0 +1,58 @@
+# tests/test_http_transport.py
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import integrations.http_transport as transport
+from utils.rate_limiter import RateLimiter, RequestBudgetExceeded
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 2
+    connections = set()
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        if Handler.failures_left > 0:
+            Handler.failures_left -= 1
+            status, body = 503, b"busy"
+        else:
+            status, body = 200, b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    httpd.shutdown()
+    transport.close_sessions()
+
+def test_retries_and_reuses_connection(server, monkeypatch):
+    monkeypatch.setattr(transport, "backoff_delay", lambda attempt, base=0: 0)
+    Handler.failures_left, Handler.connections = 2, set()
+
+    response = transport.http_get(server, exchange="test-local", retries=3)
+    assert response.status_code == 200 and response.json() == {"ok": True}
+    for _ in range(5):
+        assert transport.http_get(server).status_code == 200
+    # Eight requests over one keep-alive connection
+    assert len(Handler.connections) == 1
+
+    Handler.failures_left = 5
+    assert transport.http_get(server, retries=1).status_code == 503
+
+def test_budget_fails_fast():
+    limiter = RateLimiter(max_concurrency=1, requests_per_second=1)
+    limiter.acquire()
+    with pytest.raises(RequestBudgetExceeded):
+        limiter.acquire(max_wait=0.05)
+    limiter.release()
+    with pytest.raises(RequestBudgetExceeded):
+        limiter.acquire(max_wait=0.05)  # slot is free, but the token bucket is empty
@@ -0,0 +1,39 @@
+# tests/test_indicator_engine.py
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import MACD, ADXIndicator
+from modules.indicator_engine.indicator_engine import get_indicators, clear_indicator_memo, get_indicator_memo_stats
+
+def _frame(periods=120):
+    index = pd.date_range("2025-08-14", periods=periods, freq="1h", name="timestamp")
+    close = 100 + np.random.default_rng(3).normal(0, 1, periods).cumsum()
+    return pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=index)
+
+def test_series_match_ta_and_are_shared_per_candle():
+    clear_indicator_memo()
+    df = _frame()
+
+    rsi = get_indicators(df, "BTCUSDT", "1h").rsi(14)
+    np.testing.assert_allclose(rsi, RSIIndicator(df["close"], window=14).rsi().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(get_indicators(df).macd()["signal"], MACD(df["close"]).macd_signal().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(
+        get_indicators(df).adx(14),
+        ADXIndicator(df["high"], df["low"], df["close"], window=14).adx().to_numpy(),
+        equal_nan=True
+    )
+
+    # another consumer of the same candles gets the same array without recomputing
+    assert get_indicators(df.copy(), "BTCUSDT", "1h").rsi(14) is rsi
+    assert get_indicator_memo_stats()["hits"] == 1
+    assert not rsi.flags.writeable
+
+    # the forming candle moved: new series
+    moved = df.copy()
+    moved.iloc[-1, moved.columns.get_loc("close")] += 5
+    assert get_indicators(moved, "BTCUSDT", "1h").rsi(14) is not rsi
+
+    # same last candle from another exchange, different history: not mixed up
+    other = df.copy()
+    other.iloc[10, other.columns.get_loc("close")] += 1
+    assert get_indicators(other, "BTCUSDT", "1h").rsi(14) is not rsi
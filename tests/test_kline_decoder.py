@@ -0,0 +1,31 @@
+# tests/test_kline_decoder.py
+import pandas as pd
+from integrations.multi_interval_ohlcv.kline_decoder import decode_klines
+
+def _reference(rows, time_unit, columns):
+    df = pd.DataFrame(rows, columns=columns)
+    df["timestamp"] = pd.to_datetime(pd.to_numeric(df["timestamp"]), unit=time_unit)
+    df.set_index("timestamp", inplace=True)
+    return df[["open", "high", "low", "close", "volume"]].astype(float).sort_index()
+
+def test_decoders_match_the_pandas_path():
+    opens = [1755129600000 + i * 300_000 for i in range(5)]
+    binance = [[t, "1.5", "2.25", "1.25", f"{2 + i}.1", "10.0", t + 299_999, "0", 3, "0", "0", "0"] for i, t in enumerate(opens)]
+    okx = [[str(t), "1.5", "2.25", "1.25", f"{2 + i}.1", "10.0", "0", "0", "1"] for i, t in enumerate(opens)][::-1]
+    kucoin = [[str(t // 1000), "1.5", f"{2 + i}.1", "2.25", "1.25", "10.0", "0"] for i, t in enumerate(opens)][::-1]
+
+    binance_columns = ["timestamp", "open", "high", "low", "close", "volume", "c", "q", "n", "tb", "tq", "i"]
+    pd.testing.assert_frame_equal(decode_klines(binance, "binance"), _reference(binance, "ms", binance_columns))
+    pd.testing.assert_frame_equal(
+        decode_klines(okx, "okx"),
+        _reference(okx, "ms", ["timestamp", "open", "high", "low", "close", "volume", "q", "i1", "i2"])
+    )
+    pd.testing.assert_frame_equal(
+        decode_klines(kucoin, "kucoin"),
+        _reference(kucoin, "s", ["timestamp", "open", "close", "high", "low", "volume", "turnover"])
+    )
+
+    # out of order rows are still returned oldest first
+    shuffled = [okx[2], okx[0], okx[4], okx[1], okx[3]]
+    assert decode_klines(shuffled, "bybit").index.is_monotonic_increasing
+    assert decode_klines([], "okx").empty
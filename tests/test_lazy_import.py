@@ -0,0 +1,21 @@
+# tests/test_lazy_import.py
+from utils.lazy_import import LazyObject, lazy_import
+
+def test_lazy_object_is_created_once_on_first_use():
+    created = []
+
+    class Client:
+        def ping(self):
+            return "pong"
+
+    def factory():
+        created.append(1)
+        return Client()
+
+    client = LazyObject(factory)
+    assert created == []
+    assert client.ping() == "pong" and client.ping() == "pong"
+    assert created == [1]
+
+    json_module = lazy_import("json")
+    assert json_module.loads("[1]") == [1]
@@ -0,0 +1,122 @@
+# tests/test_load_latest_entry.py
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from utils.load_latest_entry import load_latest_entry, _load_all_entries
+from utils.jsonl_tail_reader import iter_lines_reversed
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "XRPUSDT"]
+
+def _write_log(path, count=3000):
+    start = datetime(2025, 8, 14, 10, 0, 0)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            entry = {
+                "symbol": SYMBOLS[i % 7 % 3],
+                "timestamp": (start + timedelta(minutes=i // 2)).isoformat(),
+                "value": i,
+                "padding": "x" * (i % 50)
+            }
+            f.write(json.dumps(entry) + "\n")
+            if i % 500 == 0:
+                f.write("not json\n\n")
+
+def _full_scan(path, limit, use_timestamp, symbol=None, start_time=None, end_time=None):
+    from dateutil import parser as date_parser
+    entries = _load_all_entries(path)
+    if symbol is not None:
+        entries = [e for e in entries if e.get("symbol") == symbol]
+    if start_time or end_time:
+        start_dt = date_parser.isoparse(start_time) if start_time else None
+        end_dt = date_parser.isoparse(end_time) if end_time else None
+        entries = [
+            e for e in entries
+            if (not start_dt or date_parser.isoparse(e["timestamp"]) >= start_dt)
+            and (not end_dt or date_parser.isoparse(e["timestamp"]) <= end_dt)
+        ]
+    if use_timestamp:
+        entries.sort(key=lambda e: date_parser.isoparse(e["timestamp"]), reverse=True)
+        return entries[:limit]
+    return entries[-limit:]
+
+def test_reverse_lines_match_forward_lines():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write_log(path, count=400)
+        with open(path, "rb") as f:
+            forward = [line.rstrip(b"\n") for line in f if line.strip()]
+        backward = [line for _, line in iter_lines_reversed(path, block_size=97)]
+        assert backward == list(reversed(forward))
+
+def test_tail_reader_matches_full_scan():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write_log(path)
+        window = ("2025-08-14T20:00:00", "2025-08-14T22:30:00")
+
+        for use_timestamp in (False, True):
+            for limit in (1, 3, 10, 5000):
+                for symbol in (None, "ETHUSDT", "DOGEUSDT"):
+                    for start_time, end_time in ((None, None), window):
+                        expected = _full_scan(path, limit, use_timestamp, symbol, start_time, end_time)
+                        result = load_latest_entry(
+                            path, limit=limit, use_timestamp=use_timestamp, symbol=symbol,
+                            start_time=start_time, end_time=end_time
+                        )
+                        assert result == expected
+
+def test_multi_symbol_scan_matches_per_symbol_calls():
+    from utils.load_latest_entries_for_symbols import load_latest_entries_for_symbols
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write_log(path)
+        symbols = SYMBOLS + ["DOGEUSDT"]
+
+        for limit in (1, 4, 999999):
+            for start_time, end_time in ((None, None), ("2025-08-14T20:00:00", "2025-08-14T22:30:00")):
+                expected = {}
+                for sym in symbols:
+                    entries = load_latest_entry(path, limit=limit, use_timestamp=True, symbol=sym,
+                                                start_time=start_time, end_time=end_time)
+                    if entries:
+                        expected[sym] = entries
+                assert load_latest_entries_for_symbols(path, symbols, limit=limit,
+                                                       start_time=start_time, end_time=end_time) == expected
+
+def test_symbol_index_matches_full_scan_across_appends():
+    from utils.load_latest_entries_for_symbols import load_latest_entries_for_symbols
+    from utils.jsonl_symbol_index import get_index_path, refresh_symbol_index
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write_log(path, count=1000)
+        window = ("2025-08-14T15:00:00", "2025-08-14T20:00:00")
+
+        def check():
+            for use_timestamp in (False, True):
+                for limit in (1, 5, 5000):
+                    for symbol in ("ETHUSDT", "DOGEUSDT"):
+                        for start_time, end_time in ((None, None), window):
+                            expected = _full_scan(path, limit, use_timestamp, symbol, start_time, end_time)
+                            assert load_latest_entry(path, limit=limit, use_timestamp=use_timestamp, symbol=symbol,
+                                                     start_time=start_time, end_time=end_time, use_index=True) == expected
+            for start_time, end_time in ((None, None), window):
+                assert load_latest_entries_for_symbols(path, SYMBOLS, limit=3, start_time=start_time, end_time=end_time,
+                                                       use_index=True) == \
+                    load_latest_entries_for_symbols(path, SYMBOLS, limit=3, start_time=start_time, end_time=end_time)
+
+        check()
+        with open(get_index_path(path), "rb") as f:
+            sidecar = f.read()
+
+        # Appends extend the sidecar instead of rewriting it
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"symbol": "DOGEUSDT", "timestamp": "2025-08-15T00:00:00", "value": -1}) + "\n")
+        refresh_symbol_index(path)
+        with open(get_index_path(path), "rb") as f:
+            assert f.read().startswith(sidecar)
+        check()
+
+        # A rewritten log is indexed again
+        _write_log(path, count=300)
+        check()
@@ -0,0 +1,58 @@
+# tests/test_log_writer.py
+import json
+import os
+import tempfile
+from utils.log_writer import LogWriter, append_lines
+from utils.load_latest_entry import load_latest_entry
+from modules.save_and_validate.save_and_validate import save_and_validate
+
+schema = {
+    "type": "object",
+    "properties": {"symbol": {"type": "string"}, "timestamp": {"type": "string"}},
+    "required": ["symbol", "timestamp"]
+}
+
+def test_pending_items_are_written_in_one_batch():
+    writer = LogWriter(flush_interval=60)
+    calls = []
+
+    def write_fn(path, items):
+        calls.append(list(items))
+        append_lines(path, items)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        for i in range(5):
+            writer.enqueue(path, f"{i}\n", write_fn)
+
+        assert writer.stats()["pending_items"] == 5
+        assert writer.flush(path, timeout=5)
+        with open(path) as f:
+            assert f.read() == "0\n1\n2\n3\n4\n"
+        assert calls == [["0\n", "1\n", "2\n", "3\n", "4\n"]]
+
+        stats = writer.stats()
+        assert stats["written"] == 5 and stats["flushes"] == 1 and stats["queue_depth"] == {}
+        writer.shutdown()
+
+def test_shutdown_writes_everything():
+    writer = LogWriter(flush_interval=60, max_queue=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        for i in range(10):
+            writer.enqueue(path, f"{i}\n", append_lines)
+        writer.shutdown()
+        with open(path) as f:
+            assert f.read().split() == [str(i) for i in range(10)]
+
+def test_background_save_is_visible_to_readers():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        for i in range(3):
+            save_and_validate(data={"symbol": "BTCUSDT", "timestamp": f"2025-08-14T10:0{i}:00"},
+                              path=path, schema=schema, verbose=False, background=True)
+
+        latest = load_latest_entry(path, limit=1, use_timestamp=True, symbol="BTCUSDT")
+        assert latest == [{"symbol": "BTCUSDT", "timestamp": "2025-08-14T10:02:00"}]
+        with open(path) as f:
+            assert [json.loads(line)["timestamp"][-5:] for line in f] == ["00:00", "01:00", "02:00"]
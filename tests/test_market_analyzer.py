@@ -0,0 +1,41 @@
+# tests/test_market_analyzer.py
+import numpy as np
+import pandas as pd
+from market.market_analyzer import MarketAnalyzer, MARKET_STATES
+
+def _frame(seed, periods=200):
+    rng = np.random.default_rng(seed)
+    # trending, flat and choppy stretches so every state shows up
+    drift = np.repeat(rng.choice([-0.6, 0.0, 0.6, 0.0], size=periods // 25 + 1), 25)[:periods]
+    close = 100 + (drift + rng.normal(0, 1.2, periods)).cumsum()
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2025-06-01", periods=periods, freq="1h"),
+        "open": close,
+        "high": close + rng.random(periods) * 2,
+        "low": close - rng.random(periods) * 2,
+        "close": close,
+        "volume": rng.random(periods) * 100,
+    })
+
+def _reference(analyzer):
+    # The row-by-row walk get_market_state_with_start_date did before vectorizing
+    current = analyzer.get_market_state()
+    for i in range(len(analyzer.df) - 2, -1, -1):
+        if analyzer.get_market_state(i) != current:
+            return current, analyzer.df.index[i + 1].isoformat()
+    return current, analyzer.df.index[0].isoformat()
+
+def test_vectorized_states_match_row_by_row_rules():
+    seen = set()
+    for seed in range(12):
+        for use_volume_filter in (True, False):
+            analyzer = MarketAnalyzer(_frame(seed), timeframe="1h", use_volume_filter=use_volume_filter)
+            codes = analyzer.get_state_codes()
+            states = [analyzer.get_market_state(i) for i in range(len(analyzer.df))]
+            assert states == [MARKET_STATES[code] for code in codes]
+            seen.update(states)
+
+            result = analyzer.get_market_state_with_start_date()
+            assert (result["state"], result["started_on"]) == _reference(analyzer)
+
+    assert seen == set(MARKET_STATES)
@@ -0,0 +1,42 @@
+# tests/test_mmap_jsonl_reader.py
+import json
+import os
+import tempfile
+from utils.mmap_jsonl_reader import load_jsonl_time_range
+from utils.load_entries_in_time_range import load_entries_in_time_range
+from utils.load_latest_entry import load_latest_entry
+
+def _write(path, entries, mode="w"):
+    with open(path, mode) as f:
+        for e in entries:
+            f.write((e if isinstance(e, str) else json.dumps(e)) + "\n")
+
+def _entries(hours, symbols=("BTCUSDT", "ETHUSDT")):
+    return [{"timestamp": f"2025-08-14T{h:02d}:00:00+00:00", "symbol": s, "h": h} for h in hours for s in symbols]
+
+def test_time_range_matches_full_scan():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write(path, _entries(range(0, 10)) + ['{"symbol": "BTCUSDT"}', "not json"])
+        start, end = "2025-08-14T03:00:00+00:00", "2025-08-14T06:00:00+00:00"
+
+        expected = load_latest_entry(path, limit=999999, use_timestamp=True, start_time=start, end_time=end)
+        by_symbol = load_entries_in_time_range(path, symbols=["ETHUSDT", "BTCUSDT"], start_time=start, end_time=end)
+        assert list(by_symbol) == ["ETHUSDT", "BTCUSDT"]
+        assert by_symbol["BTCUSDT"] == [e for e in expected if e["symbol"] == "BTCUSDT"]
+        assert [e["h"] for e in by_symbol["ETHUSDT"]] == [6, 5, 4, 3]
+
+        # Appended lines are indexed incrementally, also out of order ones
+        _write(path, _entries([7, 1]), mode="a")
+        assert [e["h"] for e in load_jsonl_time_range(path, start, end)] == [3, 3, 4, 4, 5, 5, 6, 6]
+        assert len(load_jsonl_time_range(path, start, "2025-08-14T07:00:00+00:00")) == 12
+
+def test_rewritten_file_is_reindexed():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.jsonl")
+        _write(path, _entries(range(0, 5)))
+        assert len(load_jsonl_time_range(path, "2025-08-14T00:00:00Z", "2025-08-14T23:00:00Z")) == 10
+
+        _write(path, _entries(range(10, 20), symbols=("BTCUSDT",)))
+        hours = [e["h"] for e in load_jsonl_time_range(path, "2025-08-14T00:00:00Z", "2025-08-14T12:00:00Z")]
+        assert hours == [10, 11, 12]
@@ -0,0 +1,107 @@
+# tests/test_ohlcv_cache.py
+import os
+import sys
+import types
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+import integrations.multi_interval_ohlcv.multi_ohlcv_handler as handler
+from integrations.exchange_health import ExchangeHealth
+from modules.indicator_engine.streaming_indicators import StreamingIndicatorStore
+
+def _frame(limit):
+    index = pd.date_range("2025-08-14", periods=limit, freq="5min")
+    close = np.linspace(100, 120, limit)
+    return pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=index)
+
+def _setup(monkeypatch):
+    calls = []
+
+    def fetch_fake(symbol, intervals=None, limit=None, start_time=None, end_time=None):
+        calls.append((symbol, tuple(intervals), limit))
+        return {interval: _frame(limit) for interval in intervals}, "Fake"
+
+    module = types.ModuleType("integrations.multi_interval_ohlcv.fetch_ohlcv_fake_for_intervals")
+    module.fetch_ohlcv_fake = fetch_fake
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(handler, "config", {"exchange_priority": ["fake"], "fetch_functions": {"fake": "fetch_ohlcv_fake"}})
+    monkeypatch.setattr(handler, "save_and_validate", lambda **kwargs: None)
+    health = ExchangeHealth("ohlcv", path=os.path.join(tempfile.mkdtemp(), "health.json"))
+    monkeypatch.setattr(handler, "get_exchange_health", lambda name: health)
+    store = StreamingIndicatorStore(path=os.path.join(tempfile.mkdtemp(), "indicator_state.json"))
+    monkeypatch.setattr(handler, "get_streaming_store", lambda: store)
+    handler.clear_ohlcv_cache()
+    return calls
+
+def test_smaller_limits_are_sliced_from_cache(monkeypatch):
+    calls = _setup(monkeypatch)
+
+    first = handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m"], limit=300)
+    second = handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m"], limit=30)
+    assert calls == [("BTCUSDT", ("5m",), 300)]
+    assert second["data_by_interval"]["5m"].equals(first["data_by_interval"]["5m"].tail(30))
+    assert second["source_exchange"] == "Fake" and "5m" in second["data_preview"]
+
+    # Only the interval that is not cached is requested; a bigger limit refetches
+    handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m", "1h"], limit=100)
+    handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["1h"], limit=200)
+    handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m"], limit=30, start_time=1, end_time=2)
+    assert calls[1:] == [("BTCUSDT", ("1h",), 100), ("BTCUSDT", ("1h",), 200), ("BTCUSDT", ("5m",), 30)]
+
+def test_entries_expire_at_candle_close(monkeypatch):
+    calls = _setup(monkeypatch)
+    now = 1755165600.0 + 10  # 2025-08-14T10:00:10Z
+    assert handler.next_candle_close("5m", now) == 1755165600 + 300
+    assert handler.next_candle_close("4h", now) == 1755172800
+    assert handler.next_candle_close("1w", now) == 1755475200  # Monday 2025-08-18
+
+    handler.config["ohlcv_cache_max_age_seconds"] = 3600
+    handler.store_cached_ohlcv("BTCUSDT", {"5m": _frame(10)}, 10, "Fake", now=now)
+    assert handler.get_cached_ohlcv("BTCUSDT", "5m", 10, now=now + 280) is not None
+    assert handler.get_cached_ohlcv("BTCUSDT", "5m", 10, now=now + 290) is None
+
+    # The forming candle is not kept longer than the max age, even on long intervals
+    handler.config["ohlcv_cache_max_age_seconds"] = 60
+    handler.store_cached_ohlcv("BTCUSDT", {"1h": _frame(10)}, 10, "Fake", now=now)
+    assert handler.get_cached_ohlcv("BTCUSDT", "1h", 10, now=now + 59) is not None
+    assert handler.get_cached_ohlcv("BTCUSDT", "1h", 10, now=now + 60) is None
+    assert calls == []
+
+def test_hedged_request_uses_the_faster_exchange(monkeypatch):
+    _setup(monkeypatch)
+    calls = []
+
+    def fetch_slow(symbol, intervals=None, limit=None, start_time=None, end_time=None):
+        calls.append("slow")
+        time.sleep(1.0)
+        return {interval: _frame(limit) for interval in intervals}, "Slow"
+
+    module = types.ModuleType("integrations.multi_interval_ohlcv.fetch_ohlcv_slow_for_intervals")
+    module.fetch_ohlcv_slow = fetch_slow
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    handler.config.update({
+        "exchange_priority": ["slow", "fake"],
+        "fetch_functions": {"slow": "fetch_ohlcv_slow", "fake": "fetch_ohlcv_fake"},
+        "adaptive_exchange_order": False,
+        "hedged_requests": True,
+        "hedge_after_seconds": 0.05,
+    })
+
+    started = time.monotonic()
+    result = handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m"], limit=30)
+    assert result["source_exchange"] == "Fake"
+    assert time.monotonic() - started < 0.8
+    assert calls == ["slow"]
+
+def test_partial_hit_reports_the_source_of_each_interval(monkeypatch):
+    _setup(monkeypatch)
+    handler.store_cached_ohlcv("BTCUSDT", {"1h": _frame(50)}, 50, "Other")
+
+    result = handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m", "1h"], limit=50)
+    assert result["source_by_interval"] == {"5m": "Fake", "1h": "Other"}
+    assert result["source_exchange"] == "Fake/Other"
+
+    cached = handler.fetch_ohlcv_fallback("BTCUSDT", intervals=["5m", "1h"], limit=50)
+    assert cached["from_cache"] and cached["source_exchange"] == "Fake/Other"
+    assert cached["data_preview"] == result["data_preview"]
@@ -0,0 +1,54 @@
+# tests/test_price_change_analyzer.py
+import numpy as np
+import pandas as pd
+import pytz
+from datetime import timedelta
+from riskmanagement.price_change_analyzer import calculate_price_changes, covers_price_change_timeframes, PRICE_CHANGE_TIMEFRAMES
+
+def _frame():
+    index = pd.date_range("2025-08-10", periods=400, freq="5min", name="timestamp")
+    close = 100 + np.random.default_rng(9).normal(0, 0.5, len(index)).cumsum()
+    df = pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=index)
+    # a gap of more than the tolerance, so some timeframes find no datapoint
+    return df.drop(df.index[40:50])
+
+def _reference(df, current_time):
+    # The per-timeframe filter and idxmin the function used before
+    df = df.reset_index().rename(columns={"close": "price"})[["timestamp", "price"]]
+    df["timestamp"] = df["timestamp"].dt.tz_localize(pytz.UTC)
+    current_row = df[df["timestamp"] <= current_time]
+    if current_row.empty:
+        return {key: None for key in PRICE_CHANGE_TIMEFRAMES}
+    current_price = current_row.iloc[-1]["price"]
+    result = {}
+    for label, delta in PRICE_CHANGE_TIMEFRAMES.items():
+        df["timedelta"] = (df["timestamp"] - (current_time - delta)).abs()
+        filtered_df = df[df["timedelta"] <= timedelta(minutes=10)]
+        if filtered_df.empty:
+            result[label] = None
+            continue
+        past_price = filtered_df.loc[filtered_df["timedelta"].idxmin()]["price"]
+        result[label] = round(((current_price - past_price) / past_price) * 100, 2)
+    return result
+
+def test_time_grid_matches_per_time_scan():
+    df = _frame()
+    start = pd.Timestamp("2025-08-09 23:00", tz="UTC")
+    # 150 s steps put some targets exactly between two candles
+    grid = [start + timedelta(seconds=150 * step) for step in range(300)]
+
+    results = calculate_price_changes("BTCUSDT", df_5m=df, as_of=grid)
+    assert results == [_reference(df, time) for time in grid]
+    assert any(value is None for result in results[100:] for value in result.values())
+
+    # a single time gives the same dict
+    assert calculate_price_changes("BTCUSDT", grid[250], df_5m=df) == results[250]
+
+def test_defaults_to_now_and_checks_frame_coverage():
+    df = _frame()
+    end = df.index[-1].tz_localize(pytz.UTC)
+    assert covers_price_change_timeframes(df, end)
+    assert not covers_price_change_timeframes(df.tail(30), end)
+
+    # candles from 2025 are all more than 24h before now: no past point, but no NaT error either
+    assert calculate_price_changes("BTCUSDT", df_5m=df) == {key: None for key in PRICE_CHANGE_TIMEFRAMES}
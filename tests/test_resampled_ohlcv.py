@@ -0,0 +1,77 @@
+# tests/test_resampled_ohlcv.py
+import numpy as np
+import pandas as pd
+import integrations.multi_interval_ohlcv.multi_ohlcv_handler as handler
+import integrations.multi_interval_ohlcv.resampled_ohlcv as resampled
+
+def _frame(start, periods, freq):
+    index = pd.date_range(start, periods=periods, freq=freq, name="timestamp")
+    rng = np.random.default_rng(1)
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.1, periods),
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": rng.uniform(1, 5, periods),
+    }, index=index)
+
+def test_resample_matches_exchange_aggregation():
+    # starts mid-bucket, so the first 15m and 1w buckets are incomplete and dropped
+    base = _frame("2025-08-13 10:07", 3000, "5min")
+    for interval, rule in (("15m", "15min"), ("1w", "W-MON")):
+        expected = base.resample(rule, label="left", closed="left").agg(
+            {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+        ).iloc[1:]
+        result = resampled.resample_candles(base, interval)
+        assert list(result.index) == list(expected.index)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    assert resampled.resample_candles(base, "1w").index[0].dayofweek == 0
+
+def test_only_base_intervals_are_fetched(monkeypatch):
+    calls, max_rows = [], [1000]
+
+    def fake_fallback(symbol, intervals, limit, start_time=None, end_time=None, log_path=None, save=True):
+        calls.append((tuple(intervals), limit))
+        rows = min(limit, max_rows[0])
+        return {"source_exchange": "Fake", "data_by_interval": {i: _frame("2025-08-14", rows, i.replace("m", "min")) for i in intervals}}
+
+    monkeypatch.setattr(handler, "config", {})
+    monkeypatch.setattr(handler, "fetch_ohlcv_fallback", fake_fallback)
+    monkeypatch.setattr(handler, "summarize_data_for_logging", lambda data, symbol=None, live=False: {})
+    monkeypatch.setattr(resampled, "save_and_validate", lambda **kwargs: None)
+
+    result = resampled.fetch_ohlcv_resampled("BTCUSDT", intervals=["5m", "15m"], limit=30, log_path="unused")
+    assert calls == [(("5m",), 93)]
+    assert len(result["data_by_interval"]["5m"]) == 30 and len(result["data_by_interval"]["15m"]) == 30
+
+    # the exchange returns less base history than asked: the derived interval is fetched directly
+    calls.clear()
+    max_rows[0] = 60
+    result = resampled.fetch_ohlcv_resampled("BTCUSDT", intervals=["5m", "15m"], limit=30, log_path="unused")
+    assert calls == [(("5m",), 93), (("15m",), 30)]
+    assert len(result["data_by_interval"]["15m"]) == 30
+
+def test_each_base_is_fetched_with_its_planned_limit(monkeypatch):
+    calls = []
+
+    def fake_fallback(symbol, intervals, limit, start_time=None, end_time=None, log_path=None, save=True):
+        calls.append((tuple(intervals), limit))
+        freq = {"m": "min", "h": "h", "d": "D", "w": "W-MON"}
+        return {"source_exchange": "Fake", "data_by_interval": {
+            i: _frame("2025-08-04", limit, i[:-1] + freq[i[-1]]) for i in intervals
+        }}
+
+    monkeypatch.setattr(handler, "config", {})
+    monkeypatch.setattr(handler, "fetch_ohlcv_fallback", fake_fallback)
+    monkeypatch.setattr(handler, "summarize_data_for_logging", lambda data, symbol=None, live=False: {})
+    monkeypatch.setattr(resampled, "save_and_validate", lambda **kwargs: None)
+
+    intervals = ["1m", "5m", "15m", "30m", "1h", "2h", "4h", "1d", "1w"]
+    _, base_limits = resampled.plan_intervals(intervals, 200)
+    result = resampled.fetch_ohlcv_resampled("BTCUSDT", intervals=intervals, limit=200, log_path="unused")
+
+    assert {interval: limit for group, limit in calls for interval in group} == base_limits
+    assert calls == [(("1m", "4h", "1d", "1w"), 200), (("5m",), 603), (("30m",), 804)]
+    assert all(len(result["data_by_interval"][interval]) == 200 for interval in intervals)
+    assert result["source_exchange"] == "Fake"
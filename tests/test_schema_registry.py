@@ -0,0 +1,70 @@
+# tests/test_schema_registry.py
+import json
+import os
+import tempfile
+import pytest
+from jsonschema import validate, ValidationError
+from modules.schema_registry.schema_registry import get_validator, compile_schema
+
+schema = {
+    "type": "object",
+    "properties": {
+        "symbol": {"type": "string"},
+        "price": {"type": "number"},
+        "count": {"type": "integer"},
+        "intervals": {"type": "array", "items": {"type": "string"}},
+        "data_preview": {"type": "object", "additionalProperties": {"type": ["number", "null"]}}
+    },
+    "required": ["symbol", "price"]
+}
+
+instances = [
+    {"symbol": "BTCUSDT", "price": 1.5},
+    {"symbol": "BTCUSDT", "price": 1, "count": 3, "intervals": ["1h"], "data_preview": {"rsi": None}},
+    {"symbol": "BTCUSDT", "price": True},
+    {"symbol": "BTCUSDT", "price": 1.0, "count": 2.0},
+    {"symbol": "BTCUSDT"},
+    {"symbol": 1, "price": 1},
+    {"symbol": "BTCUSDT", "price": 1, "intervals": ["1h", 4]},
+    {"symbol": "BTCUSDT", "price": 1, "data_preview": {"rsi": "high"}},
+    ["not", "an", "object"],
+]
+
+def _error_of(func, instance):
+    try:
+        func(instance)
+        return None
+    except ValidationError as e:
+        return (e.message, list(e.path))
+
+def test_cached_validator_matches_jsonschema():
+    assert compile_schema(schema) is not None
+    validator = get_validator(schema)
+    for instance in instances:
+        expected = _error_of(lambda i: validate(instance=i, schema=schema), instance)
+        assert _error_of(validator.validate, instance) == expected
+
+def test_unsupported_keywords_use_full_validator():
+    pattern_schema = {"type": "string", "pattern": "^[A-Z]+USDT$"}
+    assert compile_schema(pattern_schema) is None
+    with pytest.raises(ValidationError):
+        get_validator(pattern_schema).validate("btc")
+
+def test_schema_file_reloaded_after_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "schema.json")
+        with open(path, "w") as f:
+            json.dump({"type": "object"}, f)
+
+        first = get_validator(schema_path=path)
+        assert get_validator(schema_path=path) is first
+
+        with open(path, "w") as f:
+            json.dump({"type": "array", "items": {"type": "object"}}, f)
+        os.utime(path, ns=(0, 10**9))
+
+        line_validator = get_validator(schema_path=path, items=True)
+        assert line_validator is not first
+        line_validator.validate({"a": 1})
+        with pytest.raises(ValidationError):
+            line_validator.validate([1])
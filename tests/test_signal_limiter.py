@@ -0,0 +1,77 @@
+# tests/test_signal_limiter.py
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+import pytest
+import scripts.signal_store as signal_store
+from scripts.signal_limiter import is_signal_allowed, update_signal_log, load_signal_log, save_signal_log
+
+@pytest.fixture
+def store_paths(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "signals_log.json")
+        db_path = os.path.join(tmp, "signals_log.sqlite3")
+        monkeypatch.setattr(signal_store, "LOG_FILE", json_path)
+        monkeypatch.setattr(signal_store, "SIGNAL_DB_FILE", db_path)
+        yield json_path, db_path
+
+def _update(symbol, interval, signal_type, mode, now, status="unused", market_state="bull"):
+    update_signal_log(symbol, interval, None, signal_type, mode, now, status,
+                      "strong", None, 1.0, None, market_state, now.isoformat())
+
+def test_existing_json_is_imported_and_exported(store_paths):
+    json_path, _ = store_paths
+    now = datetime(2025, 8, 14, 10, 0, 0)
+    legacy = {
+        "BTCUSDT": {"1h": {"buy": {"rsi": (now - timedelta(minutes=5)).isoformat()}}},
+        "ETHUSDT": {"5m": {"sell": {"rsi": {"time": now.isoformat(), "status": "completed"}}}}
+    }
+    with open(json_path, "w") as f:
+        json.dump(legacy, f)
+
+    assert load_signal_log() == legacy
+    assert not is_signal_allowed("BTCUSDT", "1h", "buy", now, mode="rsi")
+    assert is_signal_allowed("BTCUSDT", "1h", "buy", now + timedelta(hours=2), mode="rsi")
+    assert is_signal_allowed("ETHUSDT", "5m", "sell", now, mode="rsi")
+    assert is_signal_allowed("XRPUSDT", "5m", "sell", now, mode="rsi")
+
+    _update("BTCUSDT", "1h", "buy", "rsi", now)
+    exported = signal_store.export_signal_log()
+    with open(json_path) as f:
+        assert json.load(f) == exported
+    assert exported["BTCUSDT"]["1h"]["buy"]["rsi"]["time"].startswith("2025-08-14")
+    assert list(exported) == ["BTCUSDT", "ETHUSDT"]
+
+def test_previous_market_state_uses_symbol_rows(store_paths):
+    now = datetime(2025, 8, 14, 10, 0, 0)
+    _update("BTCUSDT", "1h", "buy", "rsi", now, market_state="bear")
+    _update("ETHUSDT", "1h", "buy", "rsi", now, market_state="volatile")
+    _update("BTCUSDT", "5m", "sell", "momentum", now, market_state="bull")
+
+    entry = load_signal_log("BTCUSDT")["BTCUSDT"]["5m"]["sell"]["momentum"]
+    assert entry["previous_market_state"] == "bear"
+    assert "previous_market_state" not in load_signal_log("ETHUSDT")["ETHUSDT"]["1h"]["buy"]["rsi"]
+
+def test_save_signal_log_replaces_store(store_paths):
+    save_signal_log({"BTCUSDT": {"1h": {"buy": {"rsi": {"time": "2025-08-14T10:00:00", "status": "completed"}}}}})
+    assert list(load_signal_log()) == ["BTCUSDT"]
+
+def test_archive_deletes_only_what_was_written(store_paths):
+    save_signal_log({
+        "BTCUSDT": {"1h": {"buy": {"rsi": {"time": "2025-08-01T10:00:00", "status": "completed"}}}},
+        "ETHUSDT": {"1h": {"buy": {"rsi": {"time": "2025-08-14T10:00:00", "status": "unused"}}}}
+    })
+    old = lambda symbol, interval, direction, mode, entry: entry["time"] < "2025-08-10"
+
+    def failing_write(data):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        signal_store.archive_signal_entries(old, failing_write)
+    assert list(load_signal_log()) == ["BTCUSDT", "ETHUSDT"]
+
+    written = []
+    archived = signal_store.archive_signal_entries(old, written.append)
+    assert written == [archived] and list(archived) == ["BTCUSDT"]
+    assert list(load_signal_log()) == ["ETHUSDT"]
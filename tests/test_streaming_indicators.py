@@ -0,0 +1,91 @@
+# tests/test_streaming_indicators.py
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+import integrations.multi_interval_ohlcv.multi_ohlcv_handler as handler
+from modules.indicator_engine.indicator_engine import get_indicators
+from modules.indicator_engine.streaming_indicators import StreamingIndicators, StreamingIndicatorStore, MIN_SEED_CANDLES
+
+def _frame(periods=150):
+    index = pd.date_range("2025-08-14", periods=periods, freq="1h", name="timestamp")
+    rng = np.random.default_rng(5)
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+    return pd.DataFrame({
+        "open": close, "high": close + rng.random(periods), "low": close - rng.random(periods),
+        "close": close, "volume": rng.random(periods) * 10
+    }, index=index)
+
+def _reference(df):
+    indicators = get_indicators(df)
+    return {
+        "rsi": indicators.rsi(14)[-1],
+        "ema": indicators.ema(20)[-1],
+        "macd_signal": indicators.macd()["signal"][-1],
+        "bb_lower": indicators.bollinger(20)["lower"][-1],
+        "adx": indicators.adx(14)[-1],
+        "volume_ma": indicators.sma("volume", 20)[-1],
+    }
+
+def test_updates_match_the_full_recomputation():
+    df = _frame()
+    state = StreamingIndicators()
+    for position in range(len(df)):
+        state.update(df.iloc[position], int(df.index[position].value))
+        if position in (40, 80, len(df) - 1):
+            values = state.values()
+            for key, expected in _reference(df.iloc[:position + 1]).items():
+                np.testing.assert_allclose(values[key], expected, rtol=1e-9, equal_nan=True)
+
+def test_sync_applies_new_candles_and_keeps_forming_one_provisional():
+    df = _frame()
+    now = (df.index[-1] + pd.Timedelta(minutes=20)).timestamp()
+    state = StreamingIndicators()
+    state.sync(df.iloc[:-10], "1h", now)
+
+    values = state.sync(df, "1h", now)
+    assert state.last_time == df.index[-2].value
+    np.testing.assert_allclose(values["rsi"], _reference(df)["rsi"], rtol=1e-9)
+
+    # the forming candle moves: only the provisional values change
+    moved = df.copy()
+    moved.iloc[-1, moved.columns.get_loc("close")] += 3
+    assert state.sync(moved, "1h", now)["rsi"] != values["rsi"]
+    assert state.last_time == df.index[-2].value
+
+def test_state_survives_a_restart():
+    df = _frame()
+    path = os.path.join(tempfile.mkdtemp(), "indicator_state.json")
+    now = (df.index[-1] + pd.Timedelta(minutes=20)).timestamp()
+    store = StreamingIndicatorStore(path)
+    expected = store.sync("BTCUSDT", "1h", df.iloc[:-1], now)
+    store.save()
+
+    restored = StreamingIndicatorStore(path)
+    assert restored.get("BTCUSDT", "1h").last_time == df.index[-2].value
+    values = restored.sync("BTCUSDT", "1h", df, now)
+    np.testing.assert_allclose(values["adx"], _reference(df)["adx"], rtol=1e-9)
+    assert expected["adx"] != values["adx"]
+
+def test_short_frames_do_not_seed_and_only_live_opt_in_fetches_sync(monkeypatch):
+    df = _frame()
+    now = (df.index[-1] + pd.Timedelta(minutes=20)).timestamp()
+    state = StreamingIndicators()
+    assert state.sync(df.tail(MIN_SEED_CANDLES), "1h", now) is None
+    assert state.last_time is None
+
+    store = StreamingIndicatorStore(os.path.join(tempfile.mkdtemp(), "indicator_state.json"))
+    monkeypatch.setattr(handler, "get_streaming_store", lambda: store)
+    monkeypatch.setattr(handler, "get_config", lambda: {"streaming_indicators": True})
+    expected = handler.analyze_ohlcv(df, "BTCUSDT", "1h")
+    assert store.get("BTCUSDT", "1h").last_time is None
+
+    assert handler.analyze_ohlcv(df, "BTCUSDT", "1h", live=True) == expected
+    assert store.get("BTCUSDT", "1h").last_time is not None
+    # a short live frame falls back to the engine path instead of seeding
+    assert handler.analyze_ohlcv(df.tail(30), "ETHUSDT", "1h", live=True) == handler.analyze_ohlcv(df.tail(30))
+    assert store.get("ETHUSDT", "1h").last_time is None
+
+    monkeypatch.setattr(handler, "get_config", lambda: {})
+    handler.analyze_ohlcv(df, "SOLUSDT", "1h", live=True)
+    assert store.get("SOLUSDT", "1h").last_time is None
@@ -0,0 +1,43 @@
+# tests/test_ticker_snapshots.py
+import os
+import tempfile
+from integrations.exchange_health import ExchangeHealth
+import integrations.price_data_fetcher.fetchers.ticker_snapshots as ticker_snapshots
+import integrations.price_data_fetcher.fetchers.PriceDataFetcher as price_fetcher_module
+from integrations.price_data_fetcher.fetchers.PriceDataFetcher import PriceDataFetcher
+
+def _ticker(price):
+    return {"lastPrice": price, "priceChangePercent": 1.0, "highPrice": price, "lowPrice": price, "volume": "5", "turnover": "50"}
+
+def test_symbols_are_served_from_one_snapshot_per_exchange(monkeypatch):
+    health = ExchangeHealth("price", path=os.path.join(tempfile.mkdtemp(), "health.json"))
+    monkeypatch.setattr(ticker_snapshots, "get_exchange_health", lambda name: health)
+    monkeypatch.setattr(price_fetcher_module, "get_exchange_health", lambda name: health)
+
+    requests_made = []
+
+    def fetch_all_binance(config):
+        requests_made.append("binance")
+        return {"BTCUSDT": _ticker("100"), "ETHUSDT": _ticker("10")}
+
+    def fetch_all_bybit(config):
+        requests_made.append("bybit")
+        return {"NEWUSDT": _ticker("1")}
+
+    monkeypatch.setitem(ticker_snapshots.SNAPSHOT_FETCHERS, "binance", (fetch_all_binance, lambda s, c: s.replace("USDC", "USDT")))
+    monkeypatch.setitem(ticker_snapshots.SNAPSHOT_FETCHERS, "bybit", (fetch_all_bybit, lambda s, c: s))
+
+    config = {"settings": {"exchange_order": ["binance", "bybit"], "adaptive_exchange_order": False}}
+    snapshots = ticker_snapshots.TickerSnapshots(config)
+    results = {
+        symbol: PriceDataFetcher(symbol=symbol, config=config, snapshots=snapshots).fetch()
+        for symbol in ["BTCUSDT", "ETHUSDC", "NEWUSDT", "GONEUSDT"]
+    }
+
+    assert requests_made == ["binance", "bybit"]
+    assert results["BTCUSDT"]["source"] == "binance" and results["BTCUSDT"]["lastPrice"] == "100"
+    assert results["ETHUSDC"]["lastPrice"] == "10"
+    assert results["NEWUSDT"]["source"] == "bybit"
+    assert results["GONEUSDT"] is None
+    # lookups hand out copies, the snapshot itself is not tagged
+    assert "source" not in snapshots.get("binance")["BTCUSDT"]
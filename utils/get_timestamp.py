@@ -5,21 +5,30 @@ import pytz
 import logging
 from datetime import datetime
 
-from modules.load_and_validate.load_and_validate import load_and_validate
+from modules.load_and_validate.config_registry import load_config_cached
 
-def get_timestamp():
+_timezones = {}
 
-    general_config = load_and_validate()
+def get_timezone():
+    """Returns the configured timezone object; the general config is cached and re-read only when it changes."""
+    general_config = load_config_cached()
 
     timezone_str = general_config.get("timezone", "UTC")
 
-    try:
-        tz = pytz.timezone(timezone_str)
-    except Exception as e:
-        logging.warning(f"⚠️ Invalid timezone in config: {timezone_str}, defaulting to UTC. Error: {e}")
-        tz = pytz.UTC
+    tz = _timezones.get(timezone_str)
+    if tz is None:
+        try:
+            tz = pytz.timezone(timezone_str)
+        except Exception as e:
+            logging.warning(f"⚠️ Invalid timezone in config: {timezone_str}, defaulting to UTC. Error: {e}")
+            tz = pytz.UTC
+        _timezones[timezone_str] = tz
+
+    return tz
+
+def get_timestamp():
 
-    timestamp = datetime.now(tz).isoformat()
+    timestamp = datetime.now(get_timezone()).isoformat()
 
     return timestamp
 
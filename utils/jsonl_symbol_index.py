@@ -0,0 +1,174 @@
+# utils/jsonl_symbol_index.py
+# version 2.0, aug 2025
+
+import os
+import json
+import zlib
+import threading
+from typing import Dict, Iterable, List, Optional
+try:
+    import fcntl
+except ImportError:  # Windows: updates are not serialized between processes
+    fcntl = None
+
+INDEX_SUFFIX = ".idx"
+HEAD_CHECK_BYTES = 4096
+
+# The sidecar is append-only JSON lines: [offset, symbol] for every indexed log line,
+# followed after each batch by a checkpoint {"size", "inode", "head_crc"} that records how
+# far the log is covered. Records after the last checkpoint (an interrupted update) are
+# ignored and cut off by the next update. An append costs about the size of the new lines.
+
+class _SymbolIndex:
+    def __init__(self):
+        self.offsets: Dict[str, List[int]] = {}
+        self.size = 0              # log bytes covered, up to the end of the last indexed line
+        self.inode = None          # of the log
+        self.head_crc = None       # of the first HEAD_CHECK_BYTES of the log
+        self.index_inode = None    # of the sidecar; a rebuild replaces the file
+        self.index_bytes = 0       # sidecar bytes applied so far
+
+_indexes: Dict[str, _SymbolIndex] = {}
+_index_lock = threading.Lock()
+
+def get_index_path(file_path: str) -> str:
+    return f"{file_path}{INDEX_SUFFIX}"
+
+def _head_crc(file_path: str, length: int) -> int:
+    with open(file_path, "rb") as f:
+        return zlib.crc32(f.read(min(length, HEAD_CHECK_BYTES)))
+
+def _is_valid(index: _SymbolIndex, file_path: str, stat: os.stat_result) -> bool:
+    if index.size == 0:
+        return True
+    return (
+        index.inode == stat.st_ino
+        and index.size <= stat.st_size
+        and index.head_crc == _head_crc(file_path, index.size)
+    )
+
+def _apply_sidecar(index: _SymbolIndex, f) -> bool:
+    """Applies the checkpointed records appended since index_bytes. Returns True if a partial batch follows."""
+    f.seek(index.index_bytes)
+    position = index.index_bytes
+    pending = []
+    for line in f:
+        position += len(line)
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            break
+        if isinstance(record, list) and len(record) == 2:
+            pending.append(record)
+            continue
+        if not isinstance(record, dict) or not line.endswith(b"\n"):
+            break
+        for offset, symbol in pending:
+            index.offsets.setdefault(symbol, []).append(offset)
+        pending = []
+        index.size, index.inode, index.head_crc = record["size"], record["inode"], record["head_crc"]
+        index.index_bytes = position
+    return position > index.index_bytes or bool(pending)
+
+def _index_lines(index: _SymbolIndex, file_path: str, stat: os.stat_result) -> List[str]:
+    """Sidecar lines for the complete log lines after index.size, applied to index."""
+    with open(file_path, "rb") as f:
+        f.seek(index.size)
+        new_data = f.read(stat.st_size - index.size)
+    last_newline = new_data.rfind(b"\n")
+    if last_newline < 0:
+        return []
+
+    records = []
+    offset = index.size
+    for line in new_data[:last_newline].split(b"\n"):
+        line_offset = offset
+        offset += len(line) + 1
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(entry, dict) and "symbol" in entry:
+            symbol = str(entry["symbol"])
+            index.offsets.setdefault(symbol, []).append(line_offset)
+            records.append(json.dumps([line_offset, symbol]) + "\n")
+
+    index.size = index.size + last_newline + 1
+    index.inode = stat.st_ino
+    index.head_crc = _head_crc(file_path, index.size)
+    records.append(json.dumps({"size": index.size, "inode": index.inode, "head_crc": index.head_crc}) + "\n")
+    return records
+
+def _update(index: _SymbolIndex, file_path: str, index_path: str) -> _SymbolIndex:
+    while True:
+        with open(index_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            # Another process replaced the sidecar while this one waited for the lock
+            if os.stat(index_path).st_ino != os.fstat(f.fileno()).st_ino:
+                continue
+
+            sidecar = os.fstat(f.fileno())
+            if sidecar.st_ino != index.index_inode or sidecar.st_size < index.index_bytes:
+                index = _SymbolIndex()
+                index.index_inode = sidecar.st_ino
+            if _apply_sidecar(index, f):
+                f.truncate(index.index_bytes)
+
+            stat = os.stat(file_path)
+            if not _is_valid(index, file_path, stat):
+                # Rotated, truncated or rewritten log: index it again into a fresh sidecar
+                index = _SymbolIndex()
+                lines = _index_lines(index, file_path, stat)
+                tmp_path = f"{index_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as tmp:
+                    tmp.write("".join(lines))
+                os.replace(tmp_path, index_path)
+                replaced = os.stat(index_path)
+                index.index_inode, index.index_bytes = replaced.st_ino, replaced.st_size
+                return index
+
+            if index.size < stat.st_size:
+                lines = "".join(_index_lines(index, file_path, stat)).encode("utf-8")
+                if lines:
+                    f.seek(0, os.SEEK_END)
+                    f.write(lines)
+                    f.flush()
+                    index.index_bytes += len(lines)
+            return index
+
+def get_symbol_offsets(file_path: str, symbols: Iterable[str]) -> Optional[Dict[str, List[int]]]:
+    """
+    Byte offsets of each symbol's lines in a JSONL log, oldest first, from the sidecar index
+    next to the log ('<log>.idx'). The index is created on first use and brought up to date
+    with the lines appended since; a rotated or truncated log is indexed again.
+    Returns None if the index is unavailable.
+    """
+    if not os.path.isfile(file_path):
+        return None
+    try:
+        with _index_lock:
+            index = _indexes.get(file_path) or _SymbolIndex()
+            index = _indexes[file_path] = _update(index, file_path, get_index_path(file_path))
+            return {symbol: list(index.offsets.get(str(symbol), [])) for symbol in symbols}
+    except (OSError, KeyError, TypeError) as e:
+        print(f"⚠️ Symbol index unavailable for {file_path}: {e}")
+        return None
+
+def refresh_symbol_index(file_path: str):
+    """Keeps an existing sidecar index current after an append. Does nothing if the log has no index."""
+    if not os.path.isfile(get_index_path(file_path)):
+        return
+    try:
+        with _index_lock:
+            _indexes[file_path] = _update(_indexes.get(file_path) or _SymbolIndex(), file_path, get_index_path(file_path))
+    except (OSError, KeyError, TypeError) as e:
+        print(f"⚠️ Could not update symbol index of {file_path}: {e}")
+
+def read_entry_at(f, offset: int) -> Optional[dict]:
+    """Reads and parses the JSONL line starting at offset from an open binary file."""
+    f.seek(offset)
+    try:
+        return json.loads(f.readline())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
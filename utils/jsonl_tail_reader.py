@@ -0,0 +1,67 @@
+# utils/jsonl_tail_reader.py
+# version 2.0, aug 2025
+
+import os
+import json
+from typing import Iterator, Optional, Tuple
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+def iter_lines_reversed(
+    file_path: str,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yields (byte_offset, raw_line) pairs starting from the end of the file,
+    reading backwards in fixed-size blocks. Only the blocks needed by the
+    caller are read, so stopping early costs about the size of the answer.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b"\n")
+
+            # First piece may continue in the previous block
+            remainder = lines[0]
+            offset = position + len(remainder) + 1
+            complete_lines = lines[1:]
+
+            line_offsets = []
+            for line in complete_lines:
+                line_offsets.append((offset, line))
+                offset += len(line) + 1
+
+            for line_offset, line in reversed(line_offsets):
+                if line.strip():
+                    yield line_offset, line
+
+        if remainder.strip():
+            yield 0, remainder
+
+def iter_entries_reversed(
+    file_path: str,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[dict]:
+    """Yields parsed JSONL entries newest-first, skipping lines that are not valid JSON."""
+    for _, line in iter_lines_reversed(file_path, block_size=block_size):
+        try:
+            yield json.loads(line.decode("utf-8").strip())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
+def read_first_entry(file_path: str) -> Optional[dict]:
+    """Returns the first valid JSONL entry of the file, reading forward only as far as needed."""
+    with open(file_path, "rb") as f:
+        for line in f:
+            try:
+                return json.loads(line.decode("utf-8").strip())
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+    return None
@@ -0,0 +1,41 @@
+# utils/lazy_import.py
+# version 2.0, aug 2025
+
+import importlib
+import threading
+
+class LazyObject:
+    """
+    Stands in for an object that is expensive to create (an API client, a heavy library):
+    factory() runs on the first attribute access, once, and every access after that goes
+    to the real object. Lets `from x import client` keep working without work at import.
+    """
+
+    def __init__(self, factory):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self):
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    instance = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self):
+        instance = object.__getattribute__(self, "_instance")
+        return f"<lazy {instance!r}>" if instance is not None else "<lazy, not created yet>"
+
+def lazy_import(module_name):
+    """Module imported on first attribute access, e.g. pandas_ta or binance.exceptions."""
+    return LazyObject(lambda: importlib.import_module(module_name))
@@ -2,7 +2,7 @@
 # version 2.0, aug 2025
 
 from modules.pathbuilder.pathbuilder import pathbuilder
-from modules.load_and_validate.load_and_validate import load_and_validate
+from modules.load_and_validate.config_registry import load_config_cached
 
 def load_configs_and_logs(items, general_config=None):
     """
@@ -19,7 +19,7 @@ def load_configs_and_logs(items, general_config=None):
         ]
     """
     if general_config is None:
-        general_config = load_and_validate()
+        general_config = load_config_cached()
 
     results = {"general_config": general_config}
 
@@ -33,7 +33,7 @@ def load_configs_and_logs(items, general_config=None):
 
         for key in item["return"]:
             if key == "config":
-                config = load_and_validate(
+                config = load_config_cached(
                     file_path=paths["full_config_path"],
                     schema_path=paths["full_config_schema_path"]
                 )
@@ -8,6 +8,51 @@ from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 from utils.get_timestamp import get_timestamp
 from utils.load_latest_entry import load_latest_entry
+from utils.load_latest_entries_for_symbols import load_latest_entries_for_symbols
+from utils.mmap_jsonl_reader import get_jsonl_index, to_epoch_us
+from utils.jsonl_tail_reader import read_first_entry
+from utils.log_writer import flush_pending_writes
+import numpy as np
+
+def _load_jsonl_in_time_range(file_path, symbols, start_time, end_time):
+    """
+    Same result as the generic path below, using the cached mmap line index: the time
+    range is found by binary search and only the lines inside it are decoded.
+    """
+    flush_pending_writes(file_path)
+    index = get_jsonl_index(file_path)
+    if index is None:
+        return {}
+
+    positions = index.positions_in_range(to_epoch_us(start_time), to_epoch_us(end_time))
+    # Newest first; equal timestamps keep file order (same as the stable sort in load_latest_entry)
+    positions = positions[np.argsort(-index.epochs[positions], kind="stable")]
+    entries = index.decode(positions)
+
+    if symbols:
+        first_entry = read_first_entry(file_path)
+        if first_entry is None:
+            return {}
+        if not isinstance(first_entry, dict) or "symbol" not in first_entry:
+            return {sym: [] for sym in symbols}
+
+        results: Dict[str, List[Dict]] = {}
+        wanted = set(symbols)
+        for entry in entries:
+            sym = entry.get("symbol") if isinstance(entry, dict) else None
+            if sym in wanted:
+                results.setdefault(sym, []).append(entry)
+        return {sym: results[sym] for sym in symbols if sym in results}
+
+    # Jos entryissä EI ole "symbol"-kenttää → palauta suora lista
+    if entries and "symbol" not in entries[0]:
+        return entries
+
+    results = {}
+    for entry in entries:
+        sym = entry.get("symbol", "UNKNOWN")
+        results.setdefault(sym, []).append(entry)
+    return results
 
 def load_entries_in_time_range(
     file_path: str,
@@ -26,22 +71,21 @@ def load_entries_in_time_range(
 
     results: Dict[str, List[Dict]] = {}
 
+    if isinstance(file_path, str) and file_path.endswith(".jsonl"):
+        return _load_jsonl_in_time_range(file_path, symbols, start_time, end_time)
+
     if symbols:
-        for sym in symbols:
-
-            try:
-                entries = load_latest_entry(
-                    file_path=file_path,
-                    use_timestamp=True,
-                    symbol=sym,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=999999
-                )
-                if entries:
-                    results[sym] = entries
-            except ValueError:
-                results[sym] = []
+        try:
+            # One scan for the whole symbol set instead of one full read per symbol
+            results = load_latest_entries_for_symbols(
+                file_path,
+                symbols,
+                limit=999999,
+                start_time=start_time,
+                end_time=end_time
+            )
+        except ValueError:
+            results = {sym: [] for sym in symbols}
     else:
         entries = load_latest_entry(
             file_path=file_path,
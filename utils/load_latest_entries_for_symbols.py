@@ -0,0 +1,136 @@
+# utils/load_latest_entries_for_symbols.py
+# version 2.0, aug 2025
+
+import os
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from dateutil import parser as date_parser
+from utils.log_writer import flush_pending_writes
+from utils.jsonl_tail_reader import iter_entries_reversed, read_first_entry
+from utils.jsonl_symbol_index import get_symbol_offsets
+from utils.load_latest_entry import _load_all_entries, _iter_entries_at
+
+SYMBOL_KEY = "symbol"
+TIMESTAMP_KEY = "timestamp"
+
+def _parse_ts(entry) -> Optional[datetime]:
+    try:
+        return date_parser.isoparse(entry[TIMESTAMP_KEY])
+    except Exception:
+        return None
+
+def _older(a: datetime, b: datetime) -> bool:
+    try:
+        return a < b
+    except TypeError:
+        return False
+
+def load_latest_entries_for_symbols(
+    file_path,
+    symbols: Iterable[str],
+    limit: int = 1,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    use_index: bool = False
+) -> Dict[str, List[Dict]]:
+    """
+    Returns {symbol: [latest entries, newest first]} for a whole symbol set in one scan.
+
+    Equivalent to calling load_latest_entry(use_timestamp=True, symbol=sym, ...) for every
+    symbol, but every line is decoded and its timestamp parsed once, and each symbol keeps
+    only a bounded heap of its `limit` newest entries. JSONL logs are read backwards and
+    the scan stops once the time window is left or no older line can enter any heap.
+    With use_index only the lines of the wanted symbols are read, through the sidecar
+    symbol index of the log (utils/jsonl_symbol_index.py).
+    """
+    if not isinstance(file_path, str):
+        file_path = str(file_path)
+
+    # Read-your-writes for lines still queued in the background log writer
+    flush_pending_writes(file_path)
+
+    ordered_symbols = list(dict.fromkeys(symbols))
+    wanted = set(ordered_symbols)
+    if not wanted or limit <= 0 or not os.path.isfile(file_path):
+        return {}
+
+    start_dt = date_parser.isoparse(start_time) if start_time else None
+    end_dt = date_parser.isoparse(end_time) if end_time else None
+
+    if file_path.endswith(".jsonl"):
+        first_entry = read_first_entry(file_path)
+        if first_entry is None:
+            return {}
+        if not isinstance(first_entry, dict) or SYMBOL_KEY not in first_entry:
+            raise ValueError(f"Expected key '{SYMBOL_KEY}' not found in log entries.")
+        offsets = get_symbol_offsets(file_path, ordered_symbols) if use_index else None
+        if offsets is not None:
+            # The wanted symbols' lines merged newest first; no other line is read
+            newest_first = heapq.merge(*(reversed(offsets[sym]) for sym in ordered_symbols), reverse=True)
+            entries_newest_first = _iter_entries_at(file_path, newest_first)
+        else:
+            entries_newest_first = iter_entries_reversed(file_path)
+    else:
+        entries = _load_all_entries(file_path)
+        if not entries:
+            return {}
+        if SYMBOL_KEY not in entries[0]:
+            raise ValueError(f"Expected key '{SYMBOL_KEY}' not found in log entries.")
+        entries_newest_first = reversed(entries)
+
+    # Heap items: (timestamp, file position, tiebreak, entry). Newest timestamp wins;
+    # on equal timestamps the earlier line wins, as with the stable sort of load_latest_entry.
+    heaps: Dict[str, list] = {}
+    oldest_kept: Optional[datetime] = None
+    full_heaps = 0
+    tiebreak = itertools.count()
+
+    for position, entry in zip(itertools.count(-1, -1), entries_newest_first):
+        if not isinstance(entry, dict):
+            continue
+
+        ts = _parse_ts(entry)
+
+        # Logs are appended in time order: nothing older can be in the window or beat a full heap
+        if ts is not None:
+            if start_dt and _older(ts, start_dt):
+                break
+            if full_heaps == len(wanted) and oldest_kept is not None and _older(ts, oldest_kept):
+                break
+
+        sym = entry.get(SYMBOL_KEY)
+        if sym not in wanted:
+            continue
+
+        if start_dt or end_dt:
+            if ts is None or TIMESTAMP_KEY not in entry:
+                continue
+            try:
+                if (start_dt and ts < start_dt) or (end_dt and ts > end_dt):
+                    continue
+            except TypeError:
+                continue
+
+        sort_ts = ts if ts is not None else datetime.min
+        item = (sort_ts, -position, next(tiebreak), entry)
+        heap = heaps.setdefault(sym, [])
+
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+            if len(heap) == limit:
+                full_heaps += 1
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+        else:
+            continue
+
+        if ts is not None and (oldest_kept is None or _older(ts, oldest_kept)):
+            oldest_kept = ts
+
+    return {
+        sym: [item[3] for item in sorted(heaps[sym], key=lambda i: i[:2], reverse=True)]
+        for sym in ordered_symbols
+        if sym in heaps
+    }
@@ -8,7 +8,7 @@ from dateutil import parser as date_parser
 from collections import defaultdict
 from utils.get_timestamp import get_timestamp 
 from datetime import timedelta
-from utils.load_latest_entry import load_latest_entry
+from utils.load_latest_entries_for_symbols import load_latest_entries_for_symbols
 
 def load_latest_entries_per_symbol(symbols, file_path, limit=1, min_age_minutes=0, max_age_minutes=60):
     
@@ -17,20 +17,19 @@ def load_latest_entries_per_symbol(symbols, file_path, limit=1, min_age_minutes=
     oldest_allowed = now - timedelta(minutes=max_age_minutes)
     newest_allowed = now - timedelta(minutes=min_age_minutes)
 
-    latest_by_symbol = {}
-
-    for sym in symbols:
-        entries = load_latest_entry(
-            file_path=file_path,
-            limit=limit,
-            use_timestamp=True,
-            symbol=sym,
-            start_time=oldest_allowed.isoformat(),
-            end_time=newest_allowed.isoformat(),
-        )
+    # One pass over the symbol set's indexed lines instead of one full read per symbol
+    entries_by_symbol = load_latest_entries_for_symbols(
+        file_path,
+        symbols,
+        limit=limit,
+        start_time=oldest_allowed.isoformat(),
+        end_time=newest_allowed.isoformat(),
+        use_index=True,
+    )
 
-        if entries:
-            latest_by_symbol[sym] = entries[0]
+    latest_by_symbol = {
+        sym: entries[0] for sym, entries in entries_by_symbol.items() if entries
+    }
 
     latest_entries = {
         entry["symbol"]: entry
@@ -6,29 +6,15 @@ import json
 from typing import List, Dict, Optional
 from dateutil import parser as date_parser
 from datetime import datetime, timedelta
+from utils.log_writer import flush_pending_writes
+from utils.jsonl_tail_reader import iter_entries_reversed, read_first_entry
+from utils.jsonl_symbol_index import get_symbol_offsets, read_entry_at
 
-def load_latest_entry(
-    file_path,
-    limit: int = 10,
-    use_timestamp: bool = False,
-    symbol: Optional[str] = None,
-    start_time: Optional[str] = None,
-    end_time: Optional[str] = None
-) -> List[Dict]:
-
-    if not isinstance(file_path, str):
-        file_path = str(file_path)
-
-    if not os.path.isfile(file_path):
-        return []
+SYMBOL_KEY = "symbol"
+TIMESTAMP_KEY = "timestamp"
 
+def _load_all_entries(file_path: str) -> List[Dict]:
     entries: List[Dict] = []
-
-    # Parse time filters
-    start_dt = date_parser.isoparse(start_time) if start_time else None
-    end_dt = date_parser.isoparse(end_time) if end_time else None
-
-    # Read entries from file
     try:
         if file_path.endswith(".jsonl"):
             with open(file_path, "r", encoding="utf-8") as f:
@@ -49,44 +35,154 @@ def load_latest_entry(
             raise ValueError("❌ Unsupported file type. Only .json and .jsonl are supported.")
     except Exception as e:
         raise RuntimeError(f"❌ Failed to read log file: {e}")
+    return entries
+
+def _parse_ts(entry):
+    try:
+        return date_parser.isoparse(entry[TIMESTAMP_KEY])
+    except Exception:
+        return datetime.min
+
+def _is_within_time_range(entry, start_dt, end_dt):
+    try:
+        ts = date_parser.isoparse(entry[TIMESTAMP_KEY])
+        if start_dt and ts < start_dt:
+            return False
+        if end_dt and ts > end_dt:
+            return False
+        return True
+    except Exception:
+        return False
+
+def _is_older(entry, reference_dt) -> bool:
+    try:
+        return date_parser.isoparse(entry[TIMESTAMP_KEY]) < reference_dt
+    except Exception:
+        return False
+
+def _collect_from_tail(entries_newest_first, limit, use_timestamp, symbol, start_dt, end_dt) -> List[Dict]:
+    """
+    Collects the same result as the full scan from entries read newest-first.
+
+    Without use_timestamp the answer is simply the last `limit` matches in file order.
+    With use_timestamp the log is assumed to be appended in time order (as all our logs
+    are), so reading stops once `limit` matches are held and an older match is reached,
+    or once the start of the time window has been passed.
+    """
+    collected: List[Dict] = []
+    oldest_kept_dt = None
+
+    for entry in entries_newest_first:
+        if symbol is not None and (not isinstance(entry, dict) or entry.get(SYMBOL_KEY) != symbol):
+            continue
+
+        if use_timestamp and start_dt and isinstance(entry, dict) and _is_older(entry, start_dt):
+            break
+
+        if start_dt or end_dt:
+            if not isinstance(entry, dict) or TIMESTAMP_KEY not in entry or not _is_within_time_range(entry, start_dt, end_dt):
+                continue
+
+        if use_timestamp and len(collected) >= limit and oldest_kept_dt is not None and _is_older(entry, oldest_kept_dt):
+            break
+
+        collected.append(entry)
+        if not use_timestamp and len(collected) >= limit:
+            break
+
+        if use_timestamp:
+            entry_dt = _parse_ts(entry)
+            if entry_dt != datetime.min:
+                try:
+                    if oldest_kept_dt is None or entry_dt < oldest_kept_dt:
+                        oldest_kept_dt = entry_dt
+                except TypeError:
+                    pass
+
+    # Back to file order so that the result matches the full scan
+    collected.reverse()
+
+    if use_timestamp:
+        collected.sort(key=_parse_ts, reverse=True)
+        return collected[:limit]
+    return collected
+
+def _iter_entries_at(file_path: str, offsets):
+    """Yields the entries at the given line offsets in that order, seeking straight to each line."""
+    with open(file_path, "rb") as f:
+        for offset in offsets:
+            entry = read_entry_at(f, offset)
+            if entry is not None:
+                yield entry
+
+def load_latest_entry(
+    file_path,
+    limit: int = 10,
+    use_timestamp: bool = False,
+    symbol: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    use_index: bool = False
+) -> List[Dict]:
+    """
+    With use_index and a symbol, a JSONL log is read through its sidecar symbol index
+    (utils/jsonl_symbol_index.py), so only that symbol's lines are read.
+    """
+
+    if not isinstance(file_path, str):
+        file_path = str(file_path)
+
+    # Read-your-writes for lines still queued in the background log writer
+    flush_pending_writes(file_path)
+
+    if not os.path.isfile(file_path):
+        return []
+
+    # Parse time filters
+    start_dt = date_parser.isoparse(start_time) if start_time else None
+    end_dt = date_parser.isoparse(end_time) if end_time else None
+
+    # JSONL logs are read backwards from the end, only as far as the answer needs
+    if file_path.endswith(".jsonl") and limit > 0:
+        try:
+            if symbol is not None:
+                first_entry = read_first_entry(file_path)
+                if first_entry is None:
+                    return []
+                if not isinstance(first_entry, dict) or SYMBOL_KEY not in first_entry:
+                    raise ValueError(f"Expected key '{SYMBOL_KEY}' not found in log entries.")
+
+                offsets = get_symbol_offsets(file_path, [symbol]) if use_index else None
+                if offsets is not None:
+                    return _collect_from_tail(
+                        _iter_entries_at(file_path, reversed(offsets[symbol])), limit, use_timestamp, symbol, start_dt, end_dt
+                    )
+
+            return _collect_from_tail(
+                iter_entries_reversed(file_path), limit, use_timestamp, symbol, start_dt, end_dt
+            )
+        except OSError as e:
+            raise RuntimeError(f"❌ Failed to read log file: {e}")
+
+    entries = _load_all_entries(file_path)
 
     # Filter by symbol
     if symbol is not None:
-        symbol_key = "symbol"
-
         if not entries:
             return []
 
-        if symbol_key not in entries[0]:
-            raise ValueError(f"Expected key '{symbol_key}' not found in log entries.")
+        if SYMBOL_KEY not in entries[0]:
+            raise ValueError(f"Expected key '{SYMBOL_KEY}' not found in log entries.")
 
-        entries = [e for e in entries if e.get(symbol_key) == symbol]
+        entries = [e for e in entries if e.get(SYMBOL_KEY) == symbol]
 
     # Filter by time range
-    timestamp_key = "timestamp"
     if start_dt or end_dt:
-        def is_within_time_range(entry):
-            try:
-                ts = date_parser.isoparse(entry[timestamp_key])
-                if start_dt and ts < start_dt:
-                    return False
-                if end_dt and ts > end_dt:
-                    return False
-                return True
-            except Exception:
-                return False
-
-        entries = [e for e in entries if timestamp_key in e and is_within_time_range(e)]
+        entries = [e for e in entries if TIMESTAMP_KEY in e and _is_within_time_range(e, start_dt, end_dt)]
 
     # Optional: Sort by timestamp
     if use_timestamp:
-        def parse_ts(entry):
-            try:
-                return date_parser.isoparse(entry[timestamp_key])
-            except Exception:
-                return datetime.min
-
-        entries.sort(key=parse_ts, reverse=True)
+        entries.sort(key=_parse_ts, reverse=True)
 
     return entries[-limit:] if not use_timestamp else entries[:limit]
 
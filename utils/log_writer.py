@@ -0,0 +1,208 @@
+# utils/log_writer.py
+# version 2.0, aug 2025
+
+import os
+import time
+import atexit
+import threading
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_FLUSH_INTERVAL = 1.0          # seconds an item may wait before it is written
+DEFAULT_FLUSH_BYTES = 256 * 1024      # pending size that triggers an early write
+DEFAULT_MAX_QUEUE = 1000              # pending items per file before enqueue blocks
+
+class LogWriter:
+    """
+    Write-behind writer for log files. Items are queued per target file and written by one
+    background thread; all items pending for a file are handed to its write function in a
+    single call, so N appends cost one open/write/close. A file is written when its pending
+    size or age passes a threshold, on flush(), and at interpreter exit.
+
+    In-process readers call flush(path) before reading to see their own writes.
+    """
+
+    def __init__(self, flush_interval=DEFAULT_FLUSH_INTERVAL, flush_bytes=DEFAULT_FLUSH_BYTES, max_queue=DEFAULT_MAX_QUEUE):
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.max_queue = max_queue
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, dict] = {}
+        self._in_flight = set()
+        self._flush_requested = set()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "flushes": 0,
+            "errors": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def enqueue(self, path: str, item, write_fn: Callable[[str, List], None], size: Optional[int] = None):
+        """
+        Queues one item for path. write_fn(path, items) is later called in the writer thread
+        with every pending item for that file, in enqueue order. Blocks while the file's
+        queue is full, so a stalled disk slows producers down instead of growing memory.
+        """
+        key = os.path.abspath(path)
+        size = size if size is not None else (len(item) if isinstance(item, (str, bytes)) else 1)
+
+        with self._cond:
+            self._ensure_started()
+            while len(self._pending.get(key, {}).get("items", ())) >= self.max_queue:
+                self._flush_requested.add(key)
+                self._cond.notify_all()
+                self._cond.wait()
+
+            state = self._pending.setdefault(key, {"items": [], "bytes": 0, "since": time.monotonic(), "path": path})
+            state["items"].append(item)
+            state["bytes"] += size
+            state["write_fn"] = write_fn
+            self._stats["enqueued"] += 1
+            if state["bytes"] >= self.flush_bytes:
+                self._cond.notify_all()
+
+    def _due_keys(self, now):
+        if self._stopping:
+            return list(self._pending)
+        return [
+            key for key, state in self._pending.items()
+            if key in self._flush_requested
+            or state["bytes"] >= self.flush_bytes
+            or now - state["since"] >= self.flush_interval
+        ]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    due = [key for key in self._due_keys(now) if key not in self._in_flight]
+                    if due or (self._stopping and not self._pending):
+                        break
+                    if self._pending:
+                        oldest = min(state["since"] for state in self._pending.values())
+                        timeout = max(0.0, self.flush_interval - (now - oldest))
+                    else:
+                        timeout = None
+                    self._cond.wait(timeout)
+
+                if not due:
+                    return
+
+                batches = []
+                for key in due:
+                    batches.append((key, self._pending.pop(key)))
+                    self._in_flight.add(key)
+                    self._flush_requested.discard(key)
+                self._cond.notify_all()
+
+            for key, state in batches:
+                started = time.perf_counter()
+                try:
+                    state["write_fn"](state["path"], state["items"])
+                    ok = True
+                except Exception as e:
+                    ok = False
+                    print(f"❌ Background write to {state['path']} failed: {e}")
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                with self._cond:
+                    self._in_flight.discard(key)
+                    self._stats["flushes"] += 1
+                    self._stats["last_flush_ms"] = elapsed_ms
+                    self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed_ms)
+                    self._stats["total_flush_ms"] += elapsed_ms
+                    if ok:
+                        self._stats["written"] += len(state["items"])
+                    else:
+                        self._stats["errors"] += 1
+                    self._cond.notify_all()
+
+    def has_pending(self, path: Optional[str] = None) -> bool:
+        with self._cond:
+            if path is None:
+                return bool(self._pending or self._in_flight)
+            key = os.path.abspath(path)
+            return key in self._pending or key in self._in_flight
+
+    def flush(self, path: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Blocks until everything queued for path (or for all files) is on disk."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            keys = set(self._pending) | set(self._in_flight) if path is None else {os.path.abspath(path)}
+            if not any(key in self._pending or key in self._in_flight for key in keys):
+                return True
+
+            self._flush_requested.update(key for key in keys if key in self._pending)
+            self._cond.notify_all()
+
+            while any(key in self._pending or key in self._in_flight for key in keys):
+                if self._thread is None or not self._thread.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def shutdown(self, timeout: Optional[float] = 10.0):
+        """Writes everything still queued and stops the writer thread."""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._cond:
+            flushes = self._stats["flushes"]
+            return {
+                **self._stats,
+                "avg_flush_ms": self._stats["total_flush_ms"] / flushes if flushes else 0.0,
+                "queue_depth": {state["path"]: len(state["items"]) for state in self._pending.values()},
+                "pending_items": sum(len(state["items"]) for state in self._pending.values()),
+            }
+
+_log_writer: Optional[LogWriter] = None
+_log_writer_lock = threading.Lock()
+
+def get_log_writer() -> LogWriter:
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = LogWriter()
+            atexit.register(_log_writer.shutdown)
+        return _log_writer
+
+def enqueue_write(path: str, item, write_fn: Callable[[str, List], None], size: Optional[int] = None):
+    get_log_writer().enqueue(path, item, write_fn, size=size)
+
+def flush_pending_writes(path: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+    """Read-your-writes helper for readers; a no-op when nothing was ever queued."""
+    if _log_writer is None:
+        return True
+    return _log_writer.flush(path, timeout=timeout)
+
+def get_log_writer_stats() -> dict:
+    return get_log_writer().stats() if _log_writer is not None else {}
+
+def append_lines(path: str, chunks: List[str]):
+    """write_fn for plain text appends: one open and one write() for the whole batch."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(chunks))
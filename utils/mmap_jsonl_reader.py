@@ -0,0 +1,168 @@
+# utils/mmap_jsonl_reader.py
+# version 2.0, aug 2025
+
+import os
+import re
+import json
+import mmap
+import zlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+import numpy as np
+from dateutil import parser as date_parser
+
+TIMESTAMP_KEY = "timestamp"
+HEAD_CHECK_BYTES = 4096
+MISSING_EPOCH = np.iinfo(np.int64).min
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# A line that starts with the timestamp key has it at the top level, so it can be read
+# without decoding the whole entry
+_LEADING_TS = re.compile(rb'^\s*\{\s*"timestamp"\s*:\s*"([^"\\]+)"')
+
+_index_cache: Dict[str, "JsonlIndex"] = {}
+_cache_lock = threading.Lock()
+
+def to_epoch_us(value) -> int:
+    """ISO string or datetime -> int64 microseconds since epoch. Naive times are taken as UTC."""
+    try:
+        dt = date_parser.isoparse(value) if isinstance(value, str) else value
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return (dt - EPOCH) // timedelta(microseconds=1)
+    except Exception:
+        return MISSING_EPOCH
+
+def _line_epoch(line: bytes) -> int:
+    match = _LEADING_TS.match(line)
+    if match:
+        return to_epoch_us(match.group(1).decode("utf-8", "replace"))
+    try:
+        entry = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return MISSING_EPOCH
+    if isinstance(entry, dict) and isinstance(entry.get(TIMESTAMP_KEY), str):
+        return to_epoch_us(entry[TIMESTAMP_KEY])
+    return MISSING_EPOCH
+
+class JsonlIndex:
+    """
+    Read-only view of a JSONL file: numpy arrays of line start/end offsets and of the
+    parsed epoch timestamp of every line. Entries are decoded only when sliced.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.inode = None
+        self.size = 0
+        self.head_crc = None
+        self.starts = np.empty(0, dtype=np.int64)
+        self.ends = np.empty(0, dtype=np.int64)
+        self.epochs = np.empty(0, dtype=np.int64)
+        self.search_epochs = np.empty(0, dtype=np.int64)
+        self.is_sorted = True
+
+    def _extend(self, mm, start: int, size: int):
+        buffer = np.frombuffer(mm, dtype=np.uint8, count=size - start, offset=start)
+        newline_positions = np.flatnonzero(buffer == 10).astype(np.int64) + start
+
+        # Only complete lines are indexed; a half-written last line is picked up later
+        line_ends = newline_positions
+        line_starts = np.concatenate(([start], newline_positions[:-1] + 1)) if len(line_ends) else np.empty(0, dtype=np.int64)
+
+        keep = line_ends > line_starts
+        line_starts, line_ends = line_starts[keep], line_ends[keep]
+        epochs = np.fromiter(
+            (_line_epoch(mm[s:e]) for s, e in zip(line_starts.tolist(), line_ends.tolist())),
+            dtype=np.int64,
+            count=len(line_starts)
+        )
+
+        if len(epochs):
+            valid_new = epochs[epochs != MISSING_EPOCH]
+            valid_old = self.epochs[self.epochs != MISSING_EPOCH]
+            if len(valid_new) > 1 and np.any(np.diff(valid_new) < 0):
+                self.is_sorted = False
+            if len(valid_new) and len(valid_old) and valid_new[0] < valid_old[-1]:
+                self.is_sorted = False
+
+        self.starts = np.concatenate((self.starts, line_starts))
+        self.ends = np.concatenate((self.ends, line_ends))
+        self.epochs = np.concatenate((self.epochs, epochs))
+        # Lines without a timestamp take the previous value so the array stays searchable
+        self.search_epochs = np.maximum.accumulate(self.epochs) if len(self.epochs) else self.epochs
+        self.size = int(line_ends[-1]) + 1 if len(line_ends) else start
+
+    def refresh(self):
+        stat = os.stat(self.file_path)
+        if stat.st_ino != self.inode or stat.st_size < self.size or not self._head_unchanged():
+            self.__init__(self.file_path)
+            self.inode = stat.st_ino
+        if stat.st_size == self.size or stat.st_size == 0:
+            return self
+        with open(self.file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self._extend(mm, self.size, len(mm))
+                if self.size < HEAD_CHECK_BYTES or self.head_crc is None:
+                    self.head_crc = zlib.crc32(mm[:min(self.size, HEAD_CHECK_BYTES)])
+        return self
+
+    def _head_unchanged(self) -> bool:
+        # Catches a file rewritten in place (same inode) that grew past the indexed size
+        if self.size == 0:
+            return True
+        with open(self.file_path, "rb") as f:
+            return zlib.crc32(f.read(min(self.size, HEAD_CHECK_BYTES))) == self.head_crc
+
+    def positions_in_range(self, start_epoch: Optional[int] = None, end_epoch: Optional[int] = None) -> np.ndarray:
+        """Line positions (file order) whose timestamp is within [start_epoch, end_epoch]."""
+        valid = self.epochs != MISSING_EPOCH
+        if self.is_sorted:
+            lo = 0 if start_epoch is None else int(np.searchsorted(self.search_epochs, start_epoch, side="left"))
+            hi = len(self.epochs) if end_epoch is None else int(np.searchsorted(self.search_epochs, end_epoch, side="right"))
+            # Lines without a timestamp are dropped by the mask
+            positions = np.arange(lo, hi)
+            return positions[valid[lo:hi]]
+
+        mask = valid
+        if start_epoch is not None:
+            mask = mask & (self.epochs >= start_epoch)
+        if end_epoch is not None:
+            mask = mask & (self.epochs <= end_epoch)
+        return np.flatnonzero(mask)
+
+    def decode(self, positions) -> List[dict]:
+        """Decodes only the given lines straight from the memory map."""
+        entries = []
+        if len(positions) == 0:
+            return entries
+        with open(self.file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for position in positions:
+                    line = mm[int(self.starts[position]):int(self.ends[position])]
+                    try:
+                        entries.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+        return entries
+
+def get_jsonl_index(file_path: str) -> Optional[JsonlIndex]:
+    """Returns the cached index of a JSONL file, extended with any appended lines."""
+    if not os.path.isfile(file_path):
+        return None
+    key = os.path.abspath(file_path)
+    with _cache_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = _index_cache[key] = JsonlIndex(file_path)
+        return index.refresh()
+
+def load_jsonl_time_range(file_path: str, start_time=None, end_time=None) -> List[dict]:
+    """Entries of a JSONL log whose timestamp is within [start_time, end_time], in file order."""
+    index = get_jsonl_index(file_path)
+    if index is None:
+        return []
+    start_epoch = to_epoch_us(start_time) if start_time is not None else None
+    end_epoch = to_epoch_us(end_time) if end_time is not None else None
+    return index.decode(index.positions_in_range(start_epoch, end_epoch))
@@ -0,0 +1,87 @@
+# utils/rate_limiter.py
+# version 2.0, aug 2025
+
+import time
+import threading
+from typing import Dict, Optional
+import requests
+
+# Per exchange defaults, well under the public REST limits
+DEFAULT_EXCHANGE_LIMITS = {
+    "binance": {"max_concurrency": 8, "requests_per_second": 15},
+    "bybit": {"max_concurrency": 6, "requests_per_second": 10},
+    "okx": {"max_concurrency": 4, "requests_per_second": 8},
+    "kucoin": {"max_concurrency": 4, "requests_per_second": 6},
+}
+FALLBACK_LIMITS = {"max_concurrency": 4, "requests_per_second": 5}
+
+class RequestBudgetExceeded(requests.RequestException):
+    """Raised instead of queueing when a request would wait longer than its budget allows."""
+
+class RateLimiter:
+    """
+    Caps one exchange to max_concurrency requests in flight and requests_per_second
+    starts (token bucket, burst of one second). Used as a context manager around a request.
+    """
+
+    def __init__(self, max_concurrency: int = 4, requests_per_second: float = 5):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.requests_per_second = float(requests_per_second)
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._capacity = max(1.0, self.requests_per_second)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self.waited_seconds = 0.0
+
+    def _take_token(self, deadline=None):
+        if self.requests_per_second <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.requests_per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.requests_per_second
+                if deadline is not None and now + wait > deadline:
+                    raise RequestBudgetExceeded(f"rate limit budget exhausted ({self.requests_per_second}/s)")
+                self.waited_seconds += wait
+            time.sleep(wait)
+
+    def acquire(self, max_wait: Optional[float] = None):
+        """Takes a slot and a token; with max_wait, raises RequestBudgetExceeded rather than wait longer."""
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        if not self._slots.acquire(timeout=max_wait):
+            raise RequestBudgetExceeded(f"all {self.max_concurrency} request slots busy")
+        try:
+            self._take_token(deadline)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self):
+        self._slots.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._slots.release()
+        return False
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_exchange_limiter(exchange: str, limits: Optional[dict] = None) -> RateLimiter:
+    """Shared limiter of one exchange; limits (from config) only apply when it is first created."""
+    key = exchange.lower()
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            settings = {**DEFAULT_EXCHANGE_LIMITS.get(key, FALLBACK_LIMITS), **(limits or {})}
+            limiter = _limiters[key] = RateLimiter(settings["max_concurrency"], settings["requests_per_second"])
+        return limiter